@@ -1,91 +1,169 @@
 import os
 import json
 import sys
-import sqlite3
-from flask import Flask, request, jsonify, send_from_directory
+import click
+from functools import wraps
+from flask import Flask, Request, Response, request, make_response, send_from_directory, stream_with_context
+from werkzeug.exceptions import RequestEntityTooLarge
 from flask_cors import CORS
 from datetime import datetime, date
 
 # Resume parser imports
-from resume_parser.file_handler import save_resume_file
-from resume_parser.interface import parse_resume, save_parsed_resume
+from resume_parser.file_handler import (
+    store_resume_upload, describe_size, UploadSpool, UploadError, MAX_UPLOAD_BYTES
+)
+from resume_parser.interface import (
+    parse_resume_file, store_parsed_resume, get_parsed_resume, project_resume_data, import_legacy_results
+)
+from resume_parser.reparse import start_background_reparse
+from resume_parser.serialization import dumps, loads, iter_json_array, iter_ndjson
+from resume_parser.retention import start_background_gc
+
+from background_jobs import JobRegistry, poll_sse_stream, RUNNING, DONE, FAILED
+from resume_templates import TemplateStore, RESUME_TEMPLATES, DEFAULT_TEMPLATE
+from database import (
+    get_pool, migrate, get_data_version, verify_counters, list_jobs, upsert_jobs, search_jobs,
+    save_job as save_job_row, iter_jobs, resolve_job_fields, add_tailored_resume,
+    get_latest_tailored_resume, prune_resume_blobs, database_size, create_tailor_task,
+    update_tailor_task, get_tailor_task, create_parse_task, update_parse_task, get_parse_task, GET_JOB_SQL, STATUS_COUNTS_SQL,
+    APPLIED_ON_DATE_SQL
+)
 
 # Get the absolute path to the extension/popup directory
 STATIC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'extension', 'popup'))
 
+class UploadRequest(Request):
+    """Request that streams uploaded files through an UploadSpool instead of buffering them."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if not filename:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        return UploadSpool(filename, MAX_UPLOAD_BYTES)
+
 app = Flask(__name__)
-CORS(app)
+app.request_class = UploadRequest
+# Reject oversized requests from their Content-Length before reading the body
+# (with headroom for the multipart framing around the file)
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES + 64 * 1024
+# Let cross-origin callers (the extension) read the pagination cursor
+CORS(app, expose_headers=['X-Next-Cursor'])
+
+# Resume templates for tailoring, kept in memory and reloaded when their files change
+template_store = TemplateStore(RESUME_TEMPLATES)
+
+# Bounded pool for resume parses requested in async mode; their status is kept in parse_tasks
+parse_jobs = JobRegistry(max_workers=int(os.environ.get('PARSE_WORKERS', 2)))
+
+# Bounded pool resume tailoring runs on; requests return a task handle unless
+# they pass wait=1, which waits up to TAILOR_WAIT_SECONDS for the result
+tailor_jobs = JobRegistry(max_workers=int(os.environ.get('TAILOR_WORKERS', 2)))
+TAILOR_WAIT_SECONDS = float(os.environ.get('TAILOR_WAIT_SECONDS', 30))
+
+def json_response(data):
+    """Build a JSON response with the configured serializer (orjson when installed)."""
+    return Response(dumps(data), mimetype='application/json')
+
+# Per-thread connections to jobs.db (WAL mode), shared with database.Database
+db_pool = get_pool()
 
 def get_db():
-    db = sqlite3.connect('jobs.db')
-    db.row_factory = sqlite3.Row
-    return db
+    """Get the request thread's pooled connection; it is returned to the pool when the request ends."""
+    return db_pool.acquire()
+
+@app.teardown_appcontext
+def release_db(exception=None):
+    db_pool.release()
 
 def init_db():
-    with get_db() as db:
-        # Only create table if it doesn't exist
-        db.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                description TEXT,
-                apply_link TEXT,
-                status TEXT CHECK(status IN ('to_apply', 'applied', 'interviewing')) DEFAULT 'to_apply',
-                saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                applied_at TIMESTAMP
-            )
-        ''')
-        
-        # Create tailored resumes table
-        db.execute('''
-            CREATE TABLE IF NOT EXISTS tailored_resumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
-            )
-        ''')
-        
-        # Check if we need to add the applied_at column (for backward compatibility)
-        columns = db.execute("PRAGMA table_info(jobs)").fetchall()
-        column_names = [col[1] for col in columns]
-        
-        if 'applied_at' not in column_names:
-            db.execute('ALTER TABLE jobs ADD COLUMN applied_at TIMESTAMP')
-            
-        if 'status' not in column_names:
-            db.execute('ALTER TABLE jobs ADD COLUMN status TEXT DEFAULT "to_apply"')
-            
-        db.commit()
+    """Create the jobs tables or bring them up to the latest schema version."""
+    with db_pool.connection() as db:
+        migrate(db)
+
+@app.cli.command('verify-counters')
+@click.option('--repair', is_flag=True, help='Rebuild the counters from the jobs table if they differ.')
+def verify_counters_command(repair):
+    """Check the stored job stats counters against the jobs table."""
+    init_db()
+    with db_pool.connection() as db:
+        mismatches = verify_counters(db, repair=repair)
+    for mismatch in mismatches:
+        click.echo(f"{mismatch['kind']} {mismatch['key']!r}: stored {mismatch['stored']}, actual {mismatch['actual']}")
+    if not mismatches:
+        click.echo("Counters match the jobs table")
+    elif repair:
+        click.echo(f"Repaired {len(mismatches)} counters")
+    else:
+        raise SystemExit(1)
+
+@app.cli.command('import-parsed-resumes')
+def import_parsed_resumes_command():
+    """Import parse results saved as .json files next to legacy uploads into the parsed resume store."""
+    click.echo(f"Imported {import_legacy_results()} legacy parse results")
+
+@app.cli.command('compact-db')
+def compact_db_command():
+    """Migrate the jobs database, drop unused resume bodies and VACUUM, reporting the size before and after."""
+    with db_pool.connection() as db:
+        before = database_size(db)['total']
+        migrate(db)
+        pruned = prune_resume_blobs(db)
+        db.execute('VACUUM')
+        after = database_size(db)['total']
+    click.echo(f"Removed {pruned} unused resume bodies")
+    click.echo(f"Database size: {describe_size(before)} -> {describe_size(after)}")
+
+def etag_on_data_version(vary=None):
+    """
+    Tag a GET view's responses with the jobs data version and answer
+    If-None-Match with 304 Not Modified while it is unchanged.
+
+    The version is read before the view runs, so a body is never tagged
+    with a version older than the data it shows, and a revalidation that
+    matches costs one primary-key lookup without touching the jobs table.
+
+    Args:
+        vary: Optional callable returning a string that also goes into the
+              tag, for responses that change without a write (e.g. the date)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            with get_db() as db:
+                etag = str(get_data_version(db))
+            if vary is not None:
+                etag = f"{etag}-{vary()}"
+
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            # Let browsers keep the body but revalidate it on every use
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
 
 def get_status_counts():
     with get_db() as db:
-        counts = db.execute('''
-            SELECT status, COUNT(*) as count
-            FROM jobs
-            GROUP BY status
-        ''').fetchall()
+        counts = db.execute(STATUS_COUNTS_SQL).fetchall()
         return {row['status']: row['count'] for row in counts}
 
 def get_today_stats():
     today = date.today().isoformat()
     with get_db() as db:
-        count = db.execute('''
-            SELECT COUNT(*) as count
-            FROM jobs
-            WHERE status = 'applied'
-            AND date(applied_at) = ?
-        ''', (today,)).fetchone()['count']
-        return count
+        row = db.execute(APPLIED_ON_DATE_SQL, (today,)).fetchone()
+        return row['count'] if row else 0
 
 @app.route('/jobs/today-stats', methods=['GET'])
+@etag_on_data_version(vary=lambda: date.today().isoformat())
 def get_today_job_stats():
     try:
         today_count = get_today_stats() or 0  # Ensure we return 0 if None
         daily_goal = 10  # Current daily application goal
-        return jsonify({
+        return json_response({
             'today_applied': today_count,
             'daily_goal': daily_goal,
             'goal_met': today_count >= daily_goal
@@ -93,7 +171,7 @@ def get_today_job_stats():
     except Exception as e:
         print(f"Error getting today's job stats: {e}")
         # Return a proper error response with 500 status
-        return jsonify({
+        return json_response({
             'today_applied': 0,
             'daily_goal': 10,
             'goal_met': False,
@@ -101,75 +179,155 @@ def get_today_job_stats():
         }), 200  # Return 200 with default values instead of 500
 
 @app.route('/jobs/stats', methods=['GET'])
+@etag_on_data_version()
 def get_job_stats():
     try:
         counts = get_status_counts()
-        return jsonify({
+        return json_response({
             'total': sum(counts.values()),
             'by_status': counts
         }), 200
     except Exception as e:
         print(f"Error getting job stats: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/save-job', methods=['POST'])
 def save_job():
     try:
-        data = request.json
-        title = data.get('title')
-        company = data.get('company')
-        description = data.get('description')
-        apply_link = data.get('apply_link')
-        
-        if not title or not company:
-            return jsonify({'error': 'Missing required fields'}), 400
+        try:
+            # Saving a posting that is already stored updates it
+            job_id = save_job_row(get_db(), request.json)
+        except ValueError as e:
+            return json_response({'error': str(e)}), 400
             
-        with get_db() as db:
-            cursor = db.execute(
-                'INSERT INTO jobs (title, company, description, apply_link) VALUES (?, ?, ?, ?)',
-                (title, company, description, apply_link)
-            )
-            job_id = cursor.lastrowid
-            db.commit()
-            
-        return jsonify({'message': 'Job saved successfully', 'id': job_id}), 200
+        return json_response({'message': 'Job saved successfully', 'id': job_id}), 200
         
     except Exception as e:
         print(f"Error saving job: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+def iter_request_lines():
+    """Read the non-blank lines of a request body without reading it all."""
+    for line in request.stream:
+        if line.strip():
+            yield line
+
+@app.route('/jobs/bulk', methods=['POST'])
+def bulk_save_jobs():
+    """
+    Save many jobs at once, from a JSON array or (with Content-Type
+    application/x-ndjson) one JSON object per line.
+
+    Jobs are written with executemany in batched transactions. A job whose
+    normalized apply link is already stored is updated instead of added
+    again, so re-running an import is safe.
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            # Lines that are not valid JSON are reported with the invalid jobs
+            summary = upsert_jobs(get_db(), iter_request_lines(), decode=loads)
+        else:
+            jobs = request.get_json(silent=True)
+            if not isinstance(jobs, list):
+                return json_response({'error': 'Expected a JSON array of jobs'}), 400
+            summary = upsert_jobs(get_db(), jobs)
+        return json_response(summary), 200
+
+    except Exception as e:
+        print(f"Error saving jobs: {e}")
+        return json_response({'error': str(e)}), 500
+
+def request_fields():
+    """Read the comma-separated fields= query parameter (None if absent)."""
+    return [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()] or None
+
+def request_limit():
+    """Read the limit= query parameter (None if absent). Raises ValueError if it is not an integer."""
+    limit = request.args.get('limit', type=int)
+    if 'limit' in request.args and limit is None:
+        raise ValueError("limit must be a positive integer")
+    return limit
+
+def stream_jobs(fields, ndjson=False):
+    """Stream every job, encoded in chunks while the rows are read."""
+    # Validate the fields before the response starts
+    try:
+        fields = resolve_job_fields(fields)
+    except ValueError as e:
+        return json_response({'error': str(e)}), 400
+
+    def generate():
+        # The request's connection is released before streaming starts; hold one for the stream
+        with db_pool.connection() as db:
+            jobs = iter_jobs(db, fields)
+            yield from (iter_ndjson(jobs) if ndjson else iter_json_array(jobs))
+
+    mimetype = 'application/x-ndjson' if ndjson else 'application/json'
+    return Response(generate(), mimetype=mimetype), 200
 
 @app.route('/jobs', methods=['GET'])
 @app.route('/get-jobs', methods=['GET'])
+@etag_on_data_version()
 def get_jobs():
+    """
+    List saved jobs, newest first.
+
+    Query parameters: ``fields`` (comma-separated, defaults to everything but
+    the description), ``limit`` (page size) and ``cursor`` (from the
+    X-Next-Cursor header of the previous page, sent while more jobs remain).
+
+    ``stream=1`` streams every job as a JSON array, and ``format=ndjson`` as
+    newline-delimited JSON, encoding rows as they are read instead of
+    building the whole listing in memory.
+    """
     try:
-        with get_db() as db:
-            # Get jobs with tailored resume information
-            jobs = db.execute('''
-                SELECT j.*, 
-                       CASE WHEN tr.id IS NOT NULL THEN 1 ELSE 0 END as has_tailored_resume
-                FROM jobs j
-                LEFT JOIN (
-                    SELECT DISTINCT job_id, MIN(id) as id
-                    FROM tailored_resumes
-                    GROUP BY job_id
-                ) tr ON j.id = tr.job_id
-                ORDER BY j.saved_at DESC
-            ''').fetchall()
-            
-            # Convert to dict and ensure no null values
-            processed_jobs = []
-            for job in jobs:
-                job_dict = dict(job)
-                # Replace None values with empty strings
-                for key in job_dict:
-                    if job_dict[key] is None:
-                        job_dict[key] = ''
-                processed_jobs.append(job_dict)
-            return jsonify(processed_jobs), 200
+        fields = request_fields()
+        if request.args.get('format') == 'ndjson' or request_flag('stream'):
+            return stream_jobs(fields, ndjson=request.args.get('format') == 'ndjson')
+        try:
+            limit = request_limit()
+            with get_db() as db:
+                jobs, next_cursor = list_jobs(db, fields, limit, request.args.get('cursor'))
+        except ValueError as e:
+            return json_response({'error': str(e)}), 400
+
+        response = json_response(jobs)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response, 200
             
     except Exception as e:
         print(f"Error getting jobs: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+@app.route('/jobs/search', methods=['GET'])
+@etag_on_data_version()
+def search_saved_jobs():
+    """
+    Full-text search over saved jobs and their tailored resumes, best match first.
+
+    Query parameters: ``q`` (words to search for), ``fields``, ``limit``
+    (default 20) and ``cursor``, as for /jobs. Each result also has an
+    HTML-escaped ``snippet`` with the matches in <mark> tags.
+    """
+    try:
+        fields = request_fields()
+        try:
+            limit = request_limit()
+            with get_db() as db:
+                results, next_cursor = search_jobs(db, request.args.get('q', ''), fields, limit,
+                                                   request.args.get('cursor'))
+        except ValueError as e:
+            return json_response({'error': str(e)}), 400
+
+        response = json_response(results)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response, 200
+
+    except Exception as e:
+        print(f"Error searching jobs: {e}")
+        return json_response({'error': str(e)}), 500
 
 @app.route('/jobs/<int:job_id>/status', methods=['PUT'])
 def update_job_status(job_id):
@@ -178,13 +336,13 @@ def update_job_status(job_id):
         new_status = data.get('status')
         
         if not new_status or new_status not in ['to_apply', 'applied', 'interviewing']:
-            return jsonify({'error': 'Invalid status'}), 400
+            return json_response({'error': 'Invalid status'}), 400
             
         with get_db() as db:
             # First, get the current status
             current = db.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
             if not current:
-                return jsonify({'error': 'Job not found'}), 404
+                return json_response({'error': 'Job not found'}), 404
 
             if new_status == 'applied':
                 # Set applied_at timestamp when changing to applied
@@ -206,11 +364,11 @@ def update_job_status(job_id):
                 ''', (new_status, job_id))
             db.commit()
             
-        return jsonify({'message': 'Status updated successfully'}), 200
+        return json_response({'message': 'Status updated successfully'}), 200
         
     except Exception as e:
         print(f"Error updating job status: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/delete-job/<int:job_id>', methods=['DELETE'])
 def delete_job(job_id):
@@ -218,97 +376,134 @@ def delete_job(job_id):
         with get_db() as db:
             db.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
             db.commit()
-        return jsonify({'message': 'Job deleted successfully'}), 200
+        return json_response({'message': 'Job deleted successfully'}), 200
         
     except Exception as e:
         print(f"Error deleting job: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+def tailor_resume_job(task_id, job_id, content, progress):
+    """Background job storing a tailored resume for a saved job, recording its progress in tailor_tasks."""
+    with db_pool.connection() as db:
+        try:
+            update_tailor_task(db, task_id, RUNNING, 'saving')
+            progress('saving')
+            # The job may have been deleted while this was queued
+            if db.execute('SELECT 1 FROM jobs WHERE id = ?', (job_id,)).fetchone() is None:
+                raise LookupError('Job not found')
+            # Store the tailored resume (identical bodies share one compressed blob)
+            resume_id = add_tailored_resume(db, job_id, content)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            update_tailor_task(db, task_id, FAILED, error=str(e))
+            raise
+        update_tailor_task(db, task_id, DONE, resume_id=resume_id)
+        return resume_id
+
+def tailor_task_response(db, task):
+    """
+    Describe a tailoring task the way the parse job endpoints describe jobs.
+
+    Finished tasks carry the tailor-resume response body as their result.
+    """
+    data = {
+        'id': task['id'],
+        'kind': 'tailor-resume',
+        'status': task['status'],
+        'stage': task['stage'],
+        'created_at': task['created_at'],
+        'finished_at': task['finished_at']
+    }
+    if task['error'] is not None:
+        data['error'] = task['error']
+    if task['status'] == DONE:
+        # Get the updated job data with has_tailored_resume status
+        job = db.execute(GET_JOB_SQL, (task['job_id'],)).fetchone()
+        data['result'] = {
+            'message': 'Resume tailored successfully',
+            'resume_id': task['resume_id'],
+            'job': dict(job) if job else None
+        }
+    return data
 
 @app.route('/jobs/<int:job_id>/tailor-resume', methods=['POST'])
 def tailor_resume(job_id):
     try:
+        # The body is optional; when given it must be an object
+        body = request.get_json(silent=True)
+        if body is None:
+            body = {}
+        if not isinstance(body, dict):
+            return json_response({'error': 'Request body must be a JSON object'}), 400
+        
         with get_db() as db:
             # Get job details
-            job = db.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            job = db.execute('SELECT 1 FROM jobs WHERE id = ?', (job_id,)).fetchone()
             if not job:
-                return jsonify({'error': 'Job not found'}), 404
-            
-            # Get the absolute path to resume_experience_chunk.tex
-            resume_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'resume_experience_chunk.tex'))
-            
-            # Check if file exists
-            if not os.path.exists(resume_path):
-                return jsonify({'error': 'Resume template not found'}), 404
-            
-            # Read resume content
-            try:
-                with open(resume_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                if not content:
-                    return jsonify({'error': 'Resume template is empty'}), 500
-            except Exception as e:
-                print(f"Error reading resume file: {e}")
-                return jsonify({'error': 'Failed to read resume template'}), 500
-            
-            # Store the tailored resume in a transaction
-            try:
-                # Start transaction
-                db.execute('BEGIN')
-                
-                # Store the tailored resume
-                cursor = db.execute(
-                    'INSERT INTO tailored_resumes (job_id, content) VALUES (?, ?)',
-                    (job_id, content)
-                )
-                resume_id = cursor.lastrowid
-                
-                # Commit transaction
-                db.commit()
-                
-                # Get the updated job data with has_tailored_resume status
-                updated_job = db.execute('''
-                    SELECT j.*, 
-                           CASE WHEN tr.id IS NOT NULL THEN 1 ELSE 0 END as has_tailored_resume
-                    FROM jobs j
-                    LEFT JOIN (
-                        SELECT DISTINCT job_id, MIN(id) as id
-                        FROM tailored_resumes
-                        GROUP BY job_id
-                    ) tr ON j.id = tr.job_id
-                    WHERE j.id = ?
-                ''', (job_id,)).fetchone()
-                
-                return jsonify({
-                    'message': 'Resume tailored successfully',
-                    'resume_id': resume_id,
-                    'job': dict(updated_job)
-                }), 200
-                
-            except Exception as e:
-                # Rollback transaction on error
-                db.execute('ROLLBACK')
-                raise e
+                return json_response({'error': 'Job not found'}), 404
+        
+        # Get the resume template (cached; the file is only re-read when it changes)
+        template = body.get('template', DEFAULT_TEMPLATE)
+        try:
+            content = template_store.get(template)
+        except (KeyError, TypeError):
+            return json_response({'error': f'Unknown resume template: {template}'}), 400
+        except FileNotFoundError:
+            return json_response({'error': 'Resume template not found'}), 404
+        except Exception as e:
+            print(f"Error reading resume file: {e}")
+            return json_response({'error': 'Failed to read resume template'}), 500
+        if not content:
+            return json_response({'error': 'Resume template is empty'}), 500
+        
+        # Task status lives in the jobs database, so any worker process can report it,
+        # and repeated clicks while a tailoring of this job and template is unfinished share it
+        with get_db() as db:
+            task_id, created = create_tailor_task(db, job_id, template)
+        if created:
+            job = tailor_jobs.submit('tailor-resume', tailor_resume_job, task_id, job_id, content)
+        
+        # Callers get a handle to poll right away; with wait=1 they get the result
+        # instead if this process runs the task and it finishes in time
+        finished = created and request_flag('wait') and tailor_jobs.wait(job, TAILOR_WAIT_SECONDS)
+        with get_db() as db:
+            task = tailor_task_response(db, get_tailor_task(db, task_id))
+        
+        if not finished:
+            return json_response({
+                'task_id': task_id,
+                'status': task['status'],
+                'status_url': f'/tailor-resume/jobs/{task_id}'
+            }), 202
+        if task['status'] == FAILED:
+            return json_response({'error': task['error']}), 500
+        return json_response(task['result']), 200
                 
     except Exception as e:
         print(f"Error tailoring resume: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+@app.route('/tailor-resume/jobs/<task_id>', methods=['GET'])
+def get_tailor_job(task_id):
+    with get_db() as db:
+        task = get_tailor_task(db, task_id)
+        if not task:
+            return json_response({'error': 'Job not found'}), 404
+        return json_response(tailor_task_response(db, task)), 200
 
 @app.route('/jobs/<int:job_id>/tailored-resume', methods=['GET'])
+@etag_on_data_version()
 def get_tailored_resume(job_id):
     try:
         with get_db() as db:
             # Get the most recent tailored resume for this job
-            resume = db.execute('''
-                SELECT * FROM tailored_resumes 
-                WHERE job_id = ? 
-                ORDER BY created_at DESC 
-                LIMIT 1
-            ''', (job_id,)).fetchone()
+            resume = get_latest_tailored_resume(db, job_id)
             
             if not resume:
-                return jsonify({'error': 'No tailored resume found'}), 404
+                return json_response({'error': 'No tailored resume found'}), 404
                 
-            return jsonify({
+            return json_response({
                 'id': resume['id'],
                 'content': resume['content'],
                 'created_at': resume['created_at']
@@ -316,38 +511,29 @@ def get_tailored_resume(job_id):
             
     except Exception as e:
         print(f"Error getting tailored resume: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/jobs/<int:job_id>', methods=['GET'])
+@etag_on_data_version()
 def get_job(job_id):
     try:
         with get_db() as db:
             # Get job with tailored resume information
-            job = db.execute('''
-                SELECT j.*, 
-                       CASE WHEN tr.id IS NOT NULL THEN 1 ELSE 0 END as has_tailored_resume
-                FROM jobs j
-                LEFT JOIN (
-                    SELECT DISTINCT job_id, MIN(id) as id
-                    FROM tailored_resumes
-                    GROUP BY job_id
-                ) tr ON j.id = tr.job_id
-                WHERE j.id = ?
-            ''', (job_id,)).fetchone()
+            job = db.execute(GET_JOB_SQL, (job_id,)).fetchone()
             
             if not job:
-                return jsonify({'error': 'Job not found'}), 404
+                return json_response({'error': 'Job not found'}), 404
                 
             job_dict = dict(job)
             # Replace None values with empty strings
             for key in job_dict:
                 if job_dict[key] is None:
                     job_dict[key] = ''
-            return jsonify(job_dict), 200
+            return json_response(job_dict), 200
             
     except Exception as e:
         print(f"Error getting job: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/')
 def index():
@@ -361,6 +547,88 @@ def resume_editor():
 def serve_static(path):
     return send_from_directory(STATIC_DIR, path)
 
+def parse_saved_resume(file_path, content_hash, progress=None):
+    """Parse a saved upload and store the result. Returns (response body, status code)."""
+    # Identical files are only parsed once
+    resume_data = get_parsed_resume(content_hash)
+    if resume_data is not None:
+        print(f"Using stored parse for {content_hash}")
+        return {
+            'success': True,
+            'message': 'Resume parsed successfully',
+            'cached': True,
+            'data': resume_data
+        }, 200
+    
+    # Parse the resume, trying the enhanced parser first for PDFs
+    print(f"Parsing resume: {file_path}")
+    resume_data, used_enhanced = parse_resume_file(file_path, progress)
+    
+    # Check for errors in parsing
+    if 'error' in resume_data:
+        print(f"Parser error: {resume_data['error']}")
+        return {'error': resume_data['error']}, 500
+        
+    # Save the parsed data for future reference
+    store_parsed_resume(resume_data, content_hash, file_path)
+    
+    print("Resume parsing succeeded")
+    return {
+        'success': True,
+        'message': 'Resume parsed successfully with enhanced parser' if used_enhanced else 'Resume parsed successfully',
+        'data': resume_data
+    }, 200
+
+def request_flag(name):
+    """Whether a boolean query or form parameter is set."""
+    return request.values.get(name, '').lower() in ('1', 'true', 'yes')
+
+def resume_projection():
+    """Read the fields= and debug= parameters of a parse request. Returns (fields, debug)."""
+    fields = [field.strip() for field in request.values.get('fields', '').split(',') if field.strip()]
+    return fields or None, request_flag('debug')
+
+def project_parse_response(body, fields=None, debug=False):
+    """Trim the parsed data in a /parse-resume response body to the requested fields."""
+    if 'data' not in body:
+        return body
+    return dict(body, data=project_resume_data(body['data'], fields, debug))
+
+def parse_resume_job(task_id, file_path, content_hash, fields, debug, progress):
+    """Background job wrapper around parse_saved_resume, recording its progress in parse_tasks."""
+    with db_pool.connection() as db:
+        def record(stage):
+            update_parse_task(db, task_id, RUNNING, stage)
+            progress(stage)
+        
+        try:
+            record(RUNNING)
+            body, status = parse_saved_resume(file_path, content_hash, record)
+            if status != 200:
+                raise RuntimeError(body['error'])
+            result = project_parse_response(body, fields, debug)
+        except Exception as e:
+            update_parse_task(db, task_id, FAILED, error=str(e))
+            raise
+        update_parse_task(db, task_id, DONE, result=dumps(result).decode('utf-8'))
+        return result
+
+def parse_task_response(task):
+    """Describe an async parse the way background jobs describe themselves."""
+    data = {
+        'id': task['id'],
+        'kind': 'parse-resume',
+        'status': task['status'],
+        'stage': task['stage'],
+        'created_at': task['created_at'],
+        'finished_at': task['finished_at']
+    }
+    if task['error'] is not None:
+        data['error'] = task['error']
+    if task['status'] == DONE:
+        data['result'] = loads(task['result'])
+    return data
+
 # Resume parsing endpoint
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume_endpoint():
@@ -370,7 +638,7 @@ def parse_resume_endpoint():
         # Check if the post request has the file part
         if 'file' not in request.files:
             print("No file part in the request")
-            return jsonify({'error': 'No file part'}), 400
+            return json_response({'error': 'No file part'}), 400
             
         file = request.files['file']
         print(f"File received: {file.filename}, Content type: {file.content_type}")
@@ -378,79 +646,75 @@ def parse_resume_endpoint():
         # If user does not select file, browser might submit an empty file
         if file.filename == '':
             print("Empty filename")
-            return jsonify({'error': 'No selected file'}), 400
+            return json_response({'error': 'No selected file'}), 400
             
         # Save the uploaded file
         print(f"Saving file: {file.filename}")
-        success, message, file_path = save_resume_file(file)
+        success, message, upload = store_resume_upload(file)
         
         if not success:
             print(f"Failed to save file: {message}")
-            return jsonify({'error': message}), 400
+            return json_response({'error': message}), 400
         
+        file_path = upload['path']
+        content_hash = upload['content_hash']
         print(f"Successfully saved resume file to {file_path}")
-            
-        # Parse the resume
-        # First try the enhanced parser if the file is PDF
-        if file_path.lower().endswith('.pdf'):
-            try:
-                print(f"Attempting to use enhanced parser for {file_path}")
-                # Import the enhanced parser from the resume_parser module
-                from resume_parser import enhanced_parse_resume
-                
-                # Parse with enhanced parser
-                print(f"Running enhanced parser on {file_path}")
-                resume_data = enhanced_parse_resume(file_path)
-                
-                # Check if any data was returned
-                if resume_data and isinstance(resume_data, dict) and 'contact_info' in resume_data:
-                    print(f"Enhanced parser successful for {file_path}")
-                    print(f"Resume data keys: {resume_data.keys()}")
-                    # Save the parsed data for future reference
-                    data_path = os.path.join(os.path.dirname(file_path), f"{os.path.splitext(os.path.basename(file_path))[0]}.json")
-                    save_parsed_resume(resume_data, data_path)
-                    
-                    return jsonify({
-                        'success': True,
-                        'message': 'Resume parsed successfully with enhanced parser',
-                        'data': resume_data
-                    }), 200
-                else:
-                    print(f"Enhanced parser didn't return valid data for {file_path}")
-                    if resume_data and isinstance(resume_data, dict) and 'error' in resume_data:
-                        print(f"Parser error: {resume_data['error']}")
-            except Exception as e:
-                print(f"Enhanced parser error: {str(e)}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"File {file_path} is not a PDF, skipping enhanced parser")
         
-        # Fallback to the regular parser
-        print(f"Using standard parser for {file_path}")
-        resume_data = parse_resume(file_path)
+        # Responses leave out debug payloads unless asked for
+        fields, debug = resume_projection()
         
-        # Check for errors in parsing
-        if 'error' in resume_data:
-            print(f"Standard parser error: {resume_data['error']}")
-            return jsonify({'error': resume_data['error']}), 500
-            
-        # Save the parsed data for future reference
-        data_path = os.path.join(os.path.dirname(file_path), f"{os.path.splitext(os.path.basename(file_path))[0]}.json")
-        save_parsed_resume(resume_data, data_path)
+        # In async mode, queue the parse and return a job handle right away;
+        # its status lives in the jobs database, so any worker process can report it
+        if request_flag('async'):
+            with get_db() as db:
+                task_id = create_parse_task(db)
+            parse_jobs.submit('parse-resume', parse_resume_job, task_id, file_path, content_hash, fields, debug)
+            return json_response({
+                'job_id': task_id,
+                'status': 'queued',
+                'status_url': f'/parse-resume/jobs/{task_id}',
+                'events_url': f'/parse-resume/jobs/{task_id}/events'
+            }), 202
         
-        print("Standard parser succeeded")
-        return jsonify({
-            'success': True,
-            'message': 'Resume parsed successfully',
-            'data': resume_data
-        }), 200
+        body, status = parse_saved_resume(file_path, content_hash)
+        return json_response(project_parse_response(body, fields, debug)), status
             
+    except UploadError as e:
+        print(f"Rejected upload: {e}")
+        return json_response({'error': str(e)}), e.status_code
+    except RequestEntityTooLarge:
+        print("Rejected upload: request too large")
+        return json_response({'error': f'File is too large. The maximum size is {describe_size(MAX_UPLOAD_BYTES)}.'}), 413
     except Exception as e:
         print(f"Error parsing resume: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+@app.route('/parse-resume/jobs/<job_id>', methods=['GET'])
+def get_parse_job(job_id):
+    with get_db() as db:
+        task = get_parse_task(db, job_id)
+    if not task:
+        return json_response({'error': 'Job not found'}), 404
+    return json_response(parse_task_response(task)), 200
+
+def fetch_parse_task(job_id):
+    """Read an async parse for streaming, on a connection held only for the read."""
+    with db_pool.connection() as db:
+        task = get_parse_task(db, job_id)
+    return parse_task_response(task) if task else None
+
+@app.route('/parse-resume/jobs/<job_id>/events', methods=['GET'])
+def stream_parse_job(job_id):
+    with get_db() as db:
+        if not get_parse_task(db, job_id):
+            return json_response({'error': 'Job not found'}), 404
+    return Response(
+        stream_with_context(poll_sse_stream(lambda: fetch_parse_task(job_id))),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/test-resume-parser', methods=['GET'])
 def test_resume_parser():
@@ -460,7 +724,7 @@ def test_resume_parser():
         
         # Check if file exists
         if not os.path.exists(test_resume_path):
-            return jsonify({'error': 'Test resume file not found'}), 404
+            return json_response({'error': 'Test resume file not found'}), 404
         
         # Import the enhanced parser from the resume_parser module
         from resume_parser import enhanced_parse_resume
@@ -468,7 +732,7 @@ def test_resume_parser():
         # Parse with enhanced parser
         resume_data = enhanced_parse_resume(test_resume_path)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'Resume parsed successfully with enhanced parser',
             'data': resume_data
@@ -478,7 +742,7 @@ def test_resume_parser():
         print(f"Error testing resume parser: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/test-upload-form')
 def test_upload_form():
@@ -545,7 +809,7 @@ def test_upload_form():
                     resultDiv.innerHTML = 'Parsing resume...';
                     resultDiv.style.display = 'block';
                     
-                    const response = await fetch('/parse-resume', {
+                    const response = await fetch('/parse-resume?debug=1', {
                         method: 'POST',
                         body: formData
                     });
@@ -569,4 +833,10 @@ def test_upload_form():
 
 if __name__ == '__main__':
     init_db()
+    # Keep parse results of legacy uploads before retention may delete them
+    import_legacy_results()
+    # Upgrade results from older parser versions on idle cores
+    start_background_reparse()
+    # Apply the upload retention policy a little at a time
+    start_background_gc()
     app.run(port=5000) 
\ No newline at end of file
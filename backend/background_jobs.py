@@ -0,0 +1,248 @@
+"""
+Background Jobs
+
+This module provides a small in-process job registry for work that should
+not block an HTTP request.
+
+Jobs run on a bounded thread pool. Each job records its status and a list of
+stage transitions, which request handlers can poll or stream to clients as
+server-sent events. Jobs whose status is recorded elsewhere (e.g. in a
+database shared by several server processes) can be streamed by polling.
+"""
+
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Iterator
+
+from resume_parser.serialization import dumps
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+FINISHED_STATUSES = (DONE, FAILED)
+
+class Job:
+    """
+    A unit of background work and its progress.
+
+    Attributes:
+        id: Unique job id
+        kind: Kind of work (e.g. 'parse-resume')
+        status: One of queued, running, done or failed
+        stage: Name of the current stage
+        events: Stage transitions as dictionaries with stage, status and time
+        result: Result returned by the job function, once done
+        error: Error message, if the job failed
+    """
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = QUEUED
+        self.stage = QUEUED
+        self.events: List[Dict[str, Any]] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """
+        Convert the job to a JSON-serializable dictionary.
+
+        Args:
+            include_result: Whether to include the result of a finished job
+
+        Returns:
+            Dictionary describing the job
+        """
+        data = {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'stage': self.stage,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+        }
+        if self.error is not None:
+            data['error'] = self.error
+        if include_result and self.status == DONE:
+            data['result'] = self.result
+        return data
+
+class JobRegistry:
+    """
+    Run jobs on a bounded thread pool and track their progress.
+
+    Args:
+        max_workers: Maximum number of jobs running at once
+        retention_seconds: How long finished jobs are kept for status queries
+    """
+
+    def __init__(self, max_workers: int = 2, retention_seconds: float = 3600):
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs: Dict[str, Job] = {}
+        self._changed = threading.Condition()
+
+    def _record(self, job: Job, stage: str, status: Optional[str] = None) -> None:
+        with self._changed:
+            job.stage = stage
+            if status is not None:
+                job.status = status
+            job.events.append({'stage': stage, 'status': job.status, 'time': time.time()})
+            self._changed.notify_all()
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        self._record(job, RUNNING, RUNNING)
+        try:
+            result = fn(*args, progress=lambda stage: self._record(job, stage), **kwargs)
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.kind}) failed")
+            job.error = str(e)
+            job.finished_at = time.time()
+            self._record(job, FAILED, FAILED)
+            return
+        job.result = result
+        job.finished_at = time.time()
+        self._record(job, DONE, DONE)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        with self._changed:
+            for job_id in [job_id for job_id, job in self._jobs.items()
+                           if job.finished_at is not None and job.finished_at < cutoff]:
+                del self._jobs[job_id]
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args, **kwargs) -> Job:
+        """
+        Queue a job.
+
+        ``fn`` is called with the given arguments plus a ``progress`` keyword
+        argument, a callback taking the name of the stage the job has reached.
+        Its return value becomes the job result; an exception fails the job.
+
+        Args:
+            kind: Kind of work, reported with the job
+            fn: Function to run
+
+        Returns:
+            The queued job
+        """
+        self._prune()
+        job = Job(kind)
+        with self._changed:
+            self._jobs[job.id] = job
+        self._record(job, QUEUED)
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id, or None if it is unknown or has expired."""
+        with self._changed:
+            return self._jobs.get(job_id)
+
+    def wait(self, job: Job, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a job to finish.
+
+        Args:
+            job: Job to wait for
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Whether the job finished
+        """
+        with self._changed:
+            return self._changed.wait_for(lambda: job.status in FINISHED_STATUSES, timeout=timeout)
+
+    def iter_events(self, job: Job, keepalive: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yield the job's stage transitions as they happen, until it finishes.
+
+        ``None`` is yielded when no transition happened for ``keepalive``
+        seconds, so streaming responses can send a keep-alive.
+
+        Args:
+            job: Job to follow
+            keepalive: Seconds to wait for a transition before yielding None
+        """
+        sent = 0
+        while True:
+            with self._changed:
+                if sent >= len(job.events):
+                    self._changed.wait_for(lambda: sent < len(job.events), timeout=keepalive)
+                new_events = job.events[sent:]
+            if not new_events:
+                yield None
+                continue
+            for event in new_events:
+                yield event
+            sent += len(new_events)
+            if new_events[-1]['status'] in FINISHED_STATUSES:
+                return
+
+def sse_stream(registry: JobRegistry, job: Job) -> Iterator[str]:
+    """
+    Format a job's stage transitions as server-sent events.
+
+    Each transition is sent as a ``stage`` event; the final event is named
+    after the outcome (``done`` or ``failed``) and carries the job itself.
+
+    Args:
+        registry: Registry the job belongs to
+        job: Job to follow
+    """
+    for event in registry.iter_events(job):
+        if event is None:
+            yield ': keep-alive\n\n'
+        elif event['status'] in FINISHED_STATUSES:
+            yield f"event: {event['status']}\ndata: {dumps(job.to_dict()).decode('utf-8')}\n\n"
+        else:
+            yield f"event: stage\ndata: {dumps(event).decode('utf-8')}\n\n"
+
+def poll_sse_stream(fetch: Callable[[], Optional[Dict[str, Any]]], poll_interval: float = 0.5,
+                    keepalive: float = 15.0) -> Iterator[str]:
+    """
+    Format the progress of a task recorded outside this process as server-sent events.
+
+    ``fetch`` is polled every ``poll_interval`` seconds and returns the task
+    as a dictionary shaped like ``Job.to_dict()``, or None once it is gone.
+    Events have the same names and data as ``sse_stream``, except that a
+    stage shorter than the poll interval may not be reported.
+
+    Args:
+        fetch: Function returning the task's current state
+        poll_interval: Seconds between polls
+        keepalive: Seconds without a new stage before a keep-alive is sent
+    """
+    last = None
+    idle = 0.0
+    while True:
+        task = fetch()
+        if task is None:
+            yield f"event: {FAILED}\ndata: {dumps({'error': 'Job not found'}).decode('utf-8')}\n\n"
+            return
+        if task['status'] in FINISHED_STATUSES:
+            yield f"event: {task['status']}\ndata: {dumps(task).decode('utf-8')}\n\n"
+            return
+        current = (task['stage'], task['status'])
+        if current != last:
+            event = {'stage': task['stage'], 'status': task['status'], 'time': time.time()}
+            yield f"event: stage\ndata: {dumps(event).decode('utf-8')}\n\n"
+            last = current
+            idle = 0.0
+        elif idle >= keepalive:
+            yield ': keep-alive\n\n'
+            idle = 0.0
+        time.sleep(poll_interval)
+        idle += poll_interval
@@ -1,77 +1,1286 @@
+"""
+Jobs Database
+
+Connections to the jobs database are pooled: each thread checks out one
+connection, keeps it until it releases it (the app does so when a request
+ends), and released connections are reused by later threads instead of
+reopening the file. Every connection runs in WAL mode so readers are not
+blocked while a job is being saved, with ``synchronous=NORMAL``, memory-mapped
+reads and a per-connection cache of prepared statements.
+
+The schema is versioned with ``PRAGMA user_version``: ``migrate`` applies
+each step in ``MIGRATIONS`` newer than the database's version, in its own
+transaction. The queries behind the job endpoints live here too, so the
+tests can check that each one is served from an index. Triggers bump a
+single data version on every write, which the app turns into ETags, and
+keep FTS5 indexes of the jobs and tailored resumes in sync for search.
+Tailored resume bodies are stored once per distinct text, zlib-compressed
+in ``resume_blobs`` and keyed by their SHA-256, and the status of background
+tailoring tasks and async resume parses is kept in ``tailor_tasks`` and
+``parse_tasks`` so every server process sees it.
+"""
+
+import os
+import re
+import html
+import zlib
+import base64
 import sqlite3
+import time
+import uuid
+import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-class Database:
-    def __init__(self, db_path: str = "jobs.db"):
+# Location of the jobs database (relative paths resolve against the working directory)
+DEFAULT_DB_PATH = os.environ.get('JOBS_DB_PATH', 'jobs.db')
+
+# Bytes of the database file read through memory-mapped I/O
+MMAP_SIZE = int(os.environ.get('JOBS_DB_MMAP_SIZE', 64 * 1024 * 1024))
+
+# Prepared statements cached per connection
+CACHED_STATEMENTS = 256
+
+# Seconds a writer waits for another writer's lock before failing
+BUSY_TIMEOUT = 5.0
+
+# zlib level for tailored resume bodies, which are compressed once and read rarely
+COMPRESSION_LEVEL = 9
+
+def _decompress(data: Optional[bytes]) -> Optional[str]:
+    return None if data is None else zlib.decompress(data).decode('utf-8')
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """Define the SQL functions the schema relies on (``decompress``, behind the resume_texts view)."""
+    conn.create_function('decompress', 1, _decompress, deterministic=True)
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Apply the pragmas every pooled connection uses.
+
+    Args:
+        conn: Newly opened connection
+
+    Returns:
+        The same connection
+    """
+    conn.row_factory = sqlite3.Row
+    # WAL is persistent in the file; setting it again is a no-op
+    conn.execute('PRAGMA journal_mode=WAL')
+    # Durable across application crashes; only an OS crash can lose the last commits
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(f'PRAGMA mmap_size={int(MMAP_SIZE)}')
+    register_functions(conn)
+    return conn
+
+class ConnectionPool:
+    """
+    Per-thread pool of SQLite connections to one database file.
+
+    A thread gets the same connection from every ``acquire`` until it calls
+    ``release``, which rolls back anything left uncommitted and keeps the
+    connection for the next thread. Connections inherited across ``fork()``
+    are never used or closed by the child.
+
+    Args:
+        db_path: Path to the SQLite database file
+        max_idle: Maximum number of released connections kept open
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_idle: int = 8):
         self.db_path = db_path
-        self.create_tables()
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._reset()
 
-    def get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._idle: List[sqlite3.Connection] = []
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            # Closing a connection opened by the parent could checkpoint or
+            # unlock its database from under it; keep them referenced instead
+            self._inherited = getattr(self, '_inherited', []) + self._idle
+            self._reset()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new configured connection that may be handed between threads."""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                               cached_statements=CACHED_STATEMENTS)
+        return configure_connection(conn)
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection, checking one out if it has none.
+
+        Returns:
+            Connection held by this thread until ``release``
+        """
+        with self._lock:
+            self._check_fork()
+            conn = getattr(self._local, 'conn', None)
+            if conn is not None:
+                return conn
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self.connect()
+        self._local.conn = conn
         return conn
 
-    def create_tables(self):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                description TEXT NOT NULL,
-                apply_link TEXT,
-                saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    def release(self) -> None:
+        """Return the calling thread's connection to the pool, if it holds one."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the thread's connection for a block, releasing it afterwards if
+        the block checked it out.
+        """
+        held = getattr(self._local, 'conn', None) is not None and self._pid == os.getpid()
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            if not held:
+                self.release()
+
+    def close_all(self) -> None:
+        """Close the idle connections and the calling thread's connection."""
+        self.release()
+        with self._lock:
+            self._check_fork()
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+def _column_names(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    """Version 1: the jobs and tailored_resumes tables, upgrading databases from before versioning."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            company TEXT NOT NULL,
+            description TEXT,
+            apply_link TEXT,
+            status TEXT CHECK(status IN ('to_apply', 'applied', 'interviewing')) DEFAULT 'to_apply',
+            saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            applied_at TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS tailored_resumes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Columns added after the first release
+    column_names = _column_names(conn, 'jobs')
+    if 'applied_at' not in column_names:
+        conn.execute('ALTER TABLE jobs ADD COLUMN applied_at TIMESTAMP')
+    if 'status' not in column_names:
+        conn.execute("ALTER TABLE jobs ADD COLUMN status TEXT DEFAULT 'to_apply'")
+
+def _index_job_queries(conn: sqlite3.Connection) -> None:
+    """Version 2: indexes for the job listing, stats and tailored resume lookups."""
+    # The day a job was applied to, kept in step with applied_at by triggers,
+    # so the daily stats can look it up instead of computing date() per row
+    conn.execute('ALTER TABLE jobs ADD COLUMN applied_date TEXT')
+    conn.execute('UPDATE jobs SET applied_date = date(applied_at) WHERE applied_at IS NOT NULL')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_applied_date_insert AFTER INSERT ON jobs
+        WHEN NEW.applied_at IS NOT NULL
+        BEGIN
+            UPDATE jobs SET applied_date = date(NEW.applied_at) WHERE id = NEW.id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_applied_date_update AFTER UPDATE OF applied_at ON jobs
+        BEGIN
+            UPDATE jobs SET applied_date = date(NEW.applied_at) WHERE id = NEW.id;
+        END
+    ''')
+
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_saved_at ON jobs (saved_at, id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_applied_date ON jobs (status, applied_date)')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_tailored_resumes_job_created
+        ON tailored_resumes (job_id, created_at)
+    ''')
+
+# Most recent tailored resume of a job (the later insert wins ties on created_at)
+LATEST_TAILORED_RESUME_ID = '''
+    (SELECT id FROM tailored_resumes
+     WHERE job_id = {job_id}
+     ORDER BY created_at DESC, id DESC
+     LIMIT 1)
+'''
+
+def _track_tailored_resumes(conn: sqlite3.Connection) -> None:
+    """Version 3: per-job tailored resume count and latest id, kept up to date by triggers."""
+    conn.execute('ALTER TABLE jobs ADD COLUMN latest_tailored_resume_id INTEGER')
+    conn.execute('ALTER TABLE jobs ADD COLUMN tailored_count INTEGER NOT NULL DEFAULT 0')
+    conn.execute(f'''
+        UPDATE jobs SET
+            tailored_count = (SELECT COUNT(*) FROM tailored_resumes WHERE job_id = jobs.id),
+            latest_tailored_resume_id = {LATEST_TAILORED_RESUME_ID.format(job_id='jobs.id')}
+    ''')
+
+    def refresh(job_id):
+        return f'''
+            UPDATE jobs SET
+                tailored_count = (SELECT COUNT(*) FROM tailored_resumes WHERE job_id = {job_id}),
+                latest_tailored_resume_id = {LATEST_TAILORED_RESUME_ID.format(job_id=job_id)}
+            WHERE id = {job_id};
+        '''
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS tailored_resumes_insert AFTER INSERT ON tailored_resumes
+        BEGIN
+            UPDATE jobs SET
+                tailored_count = tailored_count + 1,
+                latest_tailored_resume_id = {LATEST_TAILORED_RESUME_ID.format(job_id='NEW.job_id')}
+            WHERE id = NEW.job_id;
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS tailored_resumes_delete AFTER DELETE ON tailored_resumes
+        BEGIN
+            {refresh('OLD.job_id')}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS tailored_resumes_update AFTER UPDATE OF job_id, created_at ON tailored_resumes
+        BEGIN
+            {refresh('OLD.job_id')}
+            {refresh('NEW.job_id')}
+        END
+    ''')
+
+def _track_data_version(conn: sqlite3.Connection) -> None:
+    """Version 4: a counter bumped by every write to the jobs and tailored_resumes tables."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    conn.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 1)')
+    for table in ('jobs', 'tailored_resumes'):
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_data_version AFTER {event} ON {table}
+                BEGIN
+                    UPDATE data_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+# Counted totals derived from the jobs table: (kind, key expression, condition)
+# over NEW/OLD rows. 'status' counts jobs per status and 'applied_on' counts
+# applied jobs per day of applied_at.
+COUNTERS = (
+    ('status', "IFNULL({row}.status, '')", '1'),
+    ('applied_on', 'date({row}.applied_at)', "{row}.status = 'applied' AND date({row}.applied_at) IS NOT NULL")
+)
+
+# The counters recomputed from scratch, for backfilling and verification
+EXACT_COUNTERS_SQL = '''
+    SELECT 'status' as kind, IFNULL(status, '') as key, COUNT(*) as count
+    FROM jobs
+    GROUP BY status
+    UNION ALL
+    SELECT 'applied_on' as kind, date(applied_at) as key, COUNT(*) as count
+    FROM jobs
+    WHERE status = 'applied' AND date(applied_at) IS NOT NULL
+    GROUP BY date(applied_at)
+'''
+
+def _count_jobs(conn: sqlite3.Connection) -> None:
+    """Version 5: per-status and per-day applied counts, kept in step with jobs by triggers."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_counters (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, key)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute(f'INSERT OR REPLACE INTO job_counters (kind, key, count) {EXACT_COUNTERS_SQL}')
+
+    def adjust(row, delta):
+        statements = []
+        for kind, key, condition in COUNTERS:
+            key, condition = key.format(row=row), condition.format(row=row)
+            if delta > 0:
+                statements.append(f'''
+                    INSERT INTO job_counters (kind, key, count) SELECT '{kind}', {key}, 1 WHERE {condition}
+                    ON CONFLICT (kind, key) DO UPDATE SET count = count + 1;
+                ''')
+            else:
+                statements.append(f'''
+                    UPDATE job_counters SET count = count - 1
+                    WHERE kind = '{kind}' AND key = {key} AND {condition};
+                ''')
+        return ''.join(statements)
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_insert_counters AFTER INSERT ON jobs
+        BEGIN
+            {adjust('NEW', 1)}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_update_counters AFTER UPDATE OF status, applied_at ON jobs
+        BEGIN
+            {adjust('OLD', -1)}
+            {adjust('NEW', 1)}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_delete_counters AFTER DELETE ON jobs
+        BEGIN
+            {adjust('OLD', -1)}
+        END
+    ''')
+
+# Query parameters that only track where a link was clicked
+TRACKING_PARAMETERS = ('refid', 'trackingid', 'trk', 'trkinfo', 'currentjobid', 'eborigin', 'lipi', 'src')
+
+def normalize_apply_link(apply_link: Optional[str]) -> Optional[str]:
+    """
+    Normalize a job's apply link so the same posting always gets the same key.
+
+    Lowercases the scheme and host, drops the fragment, tracking parameters
+    (utm_*, LinkedIn's trk/refId/trackingId...) and a trailing slash, and
+    sorts the remaining query parameters.
+
+    Args:
+        apply_link: Link as saved by the extension or an import
+
+    Returns:
+        Normalized link, or None for an empty link
+    """
+    if not apply_link or not apply_link.strip():
+        return None
+    parts = urlsplit(apply_link.strip())
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_') and name.lower() not in TRACKING_PARAMETERS
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+def _key_apply_links(conn: sqlite3.Connection) -> None:
+    """Version 6: a unique normalized apply link, so saving the same posting again updates it."""
+    conn.execute('ALTER TABLE jobs ADD COLUMN apply_link_key TEXT')
+    # Older duplicates of a posting keep a NULL key; the newest copy owns it
+    keys = {}
+    for job_id, apply_link in conn.execute('SELECT id, apply_link FROM jobs ORDER BY id'):
+        key = normalize_apply_link(apply_link)
+        if key is not None:
+            keys[key] = job_id
+    conn.executemany('UPDATE jobs SET apply_link_key = ? WHERE id = ?', keys.items())
+    conn.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_apply_link_key
+        ON jobs (apply_link_key) WHERE apply_link_key IS NOT NULL
+    ''')
+
+# Full-text indexes: (index, content table, indexed columns)
+FTS_TABLES = (
+    ('jobs_fts', 'jobs', ('title', 'company', 'description')),
+    ('tailored_resumes_fts', 'tailored_resumes', ('content',))
+)
+
+def _index_full_text(conn: sqlite3.Connection) -> None:
+    """Version 7: FTS5 indexes over job postings and tailored resumes, kept in sync by triggers."""
+    for index, table, columns in FTS_TABLES:
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'NEW.{column}' for column in columns)
+        old_values = ', '.join(f'OLD.{column}' for column in columns)
+        # External content: the index stores only the tokens and reads text from the table
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5(
+                {column_list}, content='{table}', content_rowid='id', tokenize='porter unicode61'
             )
-        """)
+        ''')
+        conn.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_insert_fts AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO {index} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_delete_fts AFTER DELETE ON {table}
+            BEGIN
+                INSERT INTO {index} ({index}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_update_fts AFTER UPDATE OF {column_list} ON {table}
+            BEGIN
+                INSERT INTO {index} ({index}, rowid, {column_list}) VALUES ('delete', OLD.id, {old_values});
+                INSERT INTO {index} (rowid, {column_list}) VALUES (NEW.id, {new_values});
+            END
+        ''')
 
-        conn.commit()
-        conn.close()
+def store_resume_blob(conn: sqlite3.Connection, content: str) -> int:
+    """
+    Store a tailored resume body once, compressed and keyed by its SHA-256.
 
-    def save_job(self, title: str, company: str, description: str, apply_link: Optional[str] = None) -> int:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO jobs (title, company, description, apply_link) VALUES (?, ?, ?, ?)",
-            (title, company, description, apply_link)
+    Args:
+        conn: Connection to the jobs database
+        content: Resume text
+
+    Returns:
+        ID of the resume_blobs row holding the text, new or existing
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    row = conn.execute('SELECT id FROM resume_blobs WHERE hash = ?', (digest,)).fetchone()
+    if row is not None:
+        return row[0]
+    blob_id = conn.execute(
+        'INSERT INTO resume_blobs (hash, size, data) VALUES (?, ?, ?)',
+        (digest, len(data), zlib.compress(data, COMPRESSION_LEVEL))
+    ).lastrowid
+    # The index reads text back through resume_texts but is given it directly here
+    conn.execute('INSERT INTO resume_blobs_fts (rowid, content) VALUES (?, ?)', (blob_id, content))
+    return blob_id
+
+def _store_resume_blobs(conn: sqlite3.Connection) -> None:
+    """Version 8: tailored resume bodies moved to a compressed blob table, one row per distinct body."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS resume_blobs (
+            id INTEGER PRIMARY KEY,
+            hash TEXT NOT NULL UNIQUE,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
         )
-        job_id = cursor.lastrowid
-        
-        conn.commit()
-        conn.close()
-        return job_id
+    ''')
+    conn.execute('CREATE VIEW IF NOT EXISTS resume_texts AS SELECT id, decompress(data) as content FROM resume_blobs')
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS resume_blobs_fts USING fts5(
+            content, content='resume_texts', content_rowid='id', tokenize='porter unicode61'
+        )
+    ''')
+    conn.execute('ALTER TABLE tailored_resumes ADD COLUMN blob_id INTEGER REFERENCES resume_blobs(id)')
+
+    blob_ids = [(store_resume_blob(conn, content), resume_id)
+                for resume_id, content in conn.execute('SELECT id, content FROM tailored_resumes').fetchall()]
+    conn.executemany('UPDATE tailored_resumes SET blob_id = ? WHERE id = ?', blob_ids)
+
+    # Each distinct body is now indexed once, through resume_blobs_fts
+    for trigger in ('insert', 'delete', 'update'):
+        conn.execute(f'DROP TRIGGER IF EXISTS tailored_resumes_{trigger}_fts')
+    conn.execute('DROP TABLE IF EXISTS tailored_resumes_fts')
+    conn.execute('ALTER TABLE tailored_resumes DROP COLUMN content')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_tailored_resumes_blob ON tailored_resumes (blob_id)')
+
+def _track_tailor_tasks(conn: sqlite3.Connection) -> None:
+    """Version 9: status of background tailoring tasks, shared by every server process."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS tailor_tasks (
+            id TEXT PRIMARY KEY,
+            job_id INTEGER NOT NULL,
+            template TEXT NOT NULL,
+            status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'done', 'failed')),
+            stage TEXT NOT NULL,
+            resume_id INTEGER,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            finished_at REAL
+        )
+    ''')
+    # At most one unfinished task per job and template, across processes
+    conn.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_tailor_tasks_active
+        ON tailor_tasks (job_id, template) WHERE status IN ('queued', 'running')
+    ''')
+
+def _drop_applied_date(conn: sqlite3.Connection) -> None:
+    """Version 10: drop applied_date, which the daily stats no longer read (they use job_counters)."""
+    conn.execute('DROP TRIGGER IF EXISTS jobs_applied_date_insert')
+    conn.execute('DROP TRIGGER IF EXISTS jobs_applied_date_update')
+    conn.execute('DROP INDEX IF EXISTS idx_jobs_status_applied_date')
+    conn.execute('ALTER TABLE jobs DROP COLUMN applied_date')
+
+def _track_parse_tasks(conn: sqlite3.Connection) -> None:
+    """Version 11: status and results of async resume parses, shared by every server process."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS parse_tasks (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'done', 'failed')),
+            stage TEXT NOT NULL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            finished_at REAL
+        )
+    ''')
+
+# Schema versions in order: (version, step)
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _create_tables),
+    (2, _index_job_queries),
+    (3, _track_tailored_resumes),
+    (4, _track_data_version),
+    (5, _count_jobs),
+    (6, _key_apply_links),
+    (7, _index_full_text),
+    (8, _store_resume_blobs),
+    (9, _track_tailor_tasks),
+    (10, _drop_applied_date),
+    (11, _track_parse_tasks)
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version recorded in the database."""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Bring the database up to the latest schema version.
+
+    Each step runs in its own write transaction, so a failed step leaves
+    the database at the previous version, and processes migrating the same
+    file at once apply every step exactly once.
+
+    Args:
+        conn: Connection to the database
+
+    Returns:
+        Schema version the database was at before migrating
+    """
+    register_functions(conn)
+    start_version = get_schema_version(conn)
+    for version, step in MIGRATIONS:
+        if version <= start_version:
+            continue
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have applied this step while we waited for the lock
+            if get_schema_version(conn) < version:
+                step(conn)
+                conn.execute(f'PRAGMA user_version = {int(version)}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return start_version
+
+# Saving a posting whose normalized link is already stored updates it in place
+UPSERT_JOB_SQL = '''
+    INSERT INTO jobs (title, company, description, apply_link, apply_link_key)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (apply_link_key) WHERE apply_link_key IS NOT NULL DO UPDATE SET
+        title = excluded.title,
+        company = excluded.company,
+        description = COALESCE(excluded.description, jobs.description),
+        apply_link = excluded.apply_link
+'''
+
+# Jobs written per transaction by upsert_jobs
+UPSERT_BATCH_SIZE = 1000
+
+def job_row(job: Any) -> Tuple:
+    """
+    Validate a job submitted for saving and build its UPSERT_JOB_SQL parameters.
+
+    Raises:
+        ValueError: If the job is not an object with a title and company
+    """
+    if not isinstance(job, dict):
+        raise ValueError('Job must be a JSON object')
+    title, company = job.get('title'), job.get('company')
+    if not title or not company:
+        raise ValueError('Missing required fields')
+    apply_link = job.get('apply_link')
+    return (title, company, job.get('description'), apply_link, normalize_apply_link(apply_link))
+
+def save_job(conn: sqlite3.Connection, job: Dict) -> int:
+    """
+    Save one job, updating the stored copy of the same posting if there is one.
+
+    Args:
+        conn: Connection to the jobs database
+        job: Job with title, company and optional description and apply_link
+
+    Returns:
+        Id of the inserted or updated job
+
+    Raises:
+        ValueError: If the job is invalid
+    """
+    row = job_row(job)
+    with conn:
+        conn.execute(UPSERT_JOB_SQL, row)
+        if row[-1] is None:
+            return conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+        return conn.execute('SELECT id FROM jobs WHERE apply_link_key = ?', (row[-1],)).fetchone()[0]
+
+def upsert_jobs(conn: sqlite3.Connection, jobs: Iterable[Any], batch_size: int = UPSERT_BATCH_SIZE,
+                decode: Optional[Callable[[Any], Any]] = None) -> Dict:
+    """
+    Save many jobs with one executemany and one commit per batch.
+
+    Jobs are consumed lazily, so a stream of any length is saved in constant
+    memory. Invalid jobs are skipped and reported by their position.
+
+    Args:
+        conn: Connection to the jobs database
+        jobs: Jobs as accepted by save_job
+        batch_size: Jobs written per transaction
+        decode: Optional function decoding each item first (e.g. a JSON line);
+                items it raises ValueError for are reported as errors
+
+    Returns:
+        Dictionary with the number of jobs received, inserted and updated,
+        and the errors of the skipped ones
+    """
+    summary = {'received': 0, 'inserted': 0, 'updated': 0, 'errors': []}
+
+    def write(batch):
+        with conn:
+            # Take the write lock before reading MAX(id), so no other writer can
+            # insert rows between the read and the batch and be counted as ours
+            conn.execute('BEGIN IMMEDIATE')
+            last_id = conn.execute('SELECT IFNULL(MAX(id), 0) FROM jobs').fetchone()[0]
+            conn.executemany(UPSERT_JOB_SQL, batch)
+            # Ids only grow, so new rows are exactly those past the previous maximum
+            inserted = conn.execute('SELECT COUNT(*) FROM jobs WHERE id > ?', (last_id,)).fetchone()[0]
+        summary['inserted'] += inserted
+        summary['updated'] += len(batch) - inserted
+
+    batch = []
+    for index, job in enumerate(jobs):
+        summary['received'] += 1
+        try:
+            batch.append(job_row(decode(job) if decode is not None else job))
+        except ValueError as e:
+            summary['errors'].append({'index': index, 'error': str(e)})
+            continue
+        if len(batch) >= batch_size:
+            write(batch)
+            batch = []
+    if batch:
+        write(batch)
+    return summary
+
+def get_data_version(conn: sqlite3.Connection) -> int:
+    """
+    Get the data version, which increases with every change to the jobs or
+    their tailored resumes. Reading it does not touch either table.
+    """
+    return conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()[0]
+
+# Whether a job has a tailored resume, read from the count the triggers keep on the row
+HAS_TAILORED_RESUME = 'j.tailored_count > 0 as has_tailored_resume'
+
+LIST_JOBS_SQL = f'''
+    SELECT j.*, {HAS_TAILORED_RESUME}
+    FROM jobs j
+    ORDER BY j.saved_at DESC, j.id DESC
+'''
+
+GET_JOB_SQL = f'''
+    SELECT j.*, {HAS_TAILORED_RESUME}
+    FROM jobs j
+    WHERE j.id = ?
+'''
+
+# Columns GET /jobs can return, with NULLs coalesced to '' as the extension expects
+JOB_FIELDS = {
+    'id': 'j.id',
+    'title': "COALESCE(j.title, '')",
+    'company': "COALESCE(j.company, '')",
+    'description': "COALESCE(j.description, '')",
+    'apply_link': "COALESCE(j.apply_link, '')",
+    'status': "COALESCE(j.status, '')",
+    'saved_at': "COALESCE(j.saved_at, '')",
+    'applied_at': "COALESCE(j.applied_at, '')",
+    'has_tailored_resume': 'j.tailored_count > 0',
+    'tailored_count': 'j.tailored_count',
+    'latest_tailored_resume_id': "COALESCE(j.latest_tailored_resume_id, '')"
+}
+
+# Fields returned when none are requested: everything but the (large) description
+DEFAULT_JOB_FIELDS = (
+    'id', 'title', 'company', 'apply_link', 'status', 'saved_at', 'applied_at', 'has_tailored_resume'
+)
+
+# Largest page GET /jobs returns
+MAX_PAGE_SIZE = 500
+
+def list_jobs_sql(fields: Sequence[str], after_cursor: bool = False, limit: bool = False) -> str:
+    """
+    Build the query for a page of the job listing, newest first.
+
+    Args:
+        fields: Names from JOB_FIELDS to select
+        after_cursor: Only return jobs after the (saved_at, id) given as the first two parameters
+        limit: Take the page size as the last parameter
+
+    Returns:
+        SQL statement
+    """
+    columns = ', '.join(f'{JOB_FIELDS[field]} as {field}' for field in fields)
+    where = 'WHERE (j.saved_at, j.id) < (?, ?)' if after_cursor else ''
+    return f'''
+        SELECT {columns}
+        FROM jobs j
+        {where}
+        ORDER BY j.saved_at DESC, j.id DESC
+        {'LIMIT ?' if limit else ''}
+    '''
+
+def encode_cursor(saved_at: str, job_id: int) -> str:
+    """Encode the position after a job as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(f'{saved_at}|{job_id}'.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a pagination cursor.
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        saved_at, _, job_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').rpartition('|')
+        return saved_at, int(job_id)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+def resolve_job_fields(fields: Optional[Sequence[str]]) -> List[str]:
+    """Validate requested job fields, defaulting to DEFAULT_JOB_FIELDS. Raises ValueError for unknown names."""
+    fields = list(fields or DEFAULT_JOB_FIELDS)
+    unknown = [field for field in fields if field not in JOB_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+def list_jobs(conn: sqlite3.Connection, fields: Optional[Sequence[str]] = None, limit: Optional[int] = None,
+              cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Get a page of saved jobs, newest first, using keyset pagination on (saved_at, id).
+
+    Each page is a range scan of idx_jobs_saved_at starting at the cursor, so
+    it costs the same however deep into the listing it is.
+
+    Args:
+        conn: Connection to the jobs database
+        fields: Names from JOB_FIELDS to return (defaults to DEFAULT_JOB_FIELDS)
+        limit: Page size, capped at MAX_PAGE_SIZE (None returns every job after the cursor)
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        tuple: (jobs, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If a field, the limit or the cursor is invalid
+    """
+    fields = resolve_job_fields(fields)
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+    # The next cursor is built from the last row's position, even when those fields weren't asked for
+    selected = fields + [field for field in ('saved_at', 'id') if field not in fields]
+    params: List = []
+    if cursor:
+        params.extend(decode_cursor(cursor))
+    if limit is not None:
+        limit = min(limit, MAX_PAGE_SIZE)
+        # One extra row tells whether there is a next page
+        params.append(limit + 1)
+    rows = conn.execute(list_jobs_sql(selected, bool(cursor), limit is not None), params).fetchall()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]['saved_at'], rows[-1]['id'])
+    jobs = [{field: row[field] for field in fields} for row in rows]
+    return jobs, next_cursor
+
+# Rows fetched from SQLite at a time when iterating over every job
+ITER_BATCH_SIZE = 500
+
+def iter_jobs(conn: sqlite3.Connection, fields: Optional[Sequence[str]] = None,
+              batch_size: int = ITER_BATCH_SIZE) -> Iterator[Dict]:
+    """
+    Iterate over every saved job, newest first, without loading them all.
+
+    Rows are fetched ``batch_size`` at a time from one statement, so memory
+    stays flat however many jobs there are and the whole iteration reads
+    one consistent snapshot.
+
+    Args:
+        conn: Connection to the jobs database
+        fields: Names from JOB_FIELDS to return (defaults to DEFAULT_JOB_FIELDS)
+        batch_size: Rows fetched per step
+
+    Returns:
+        Iterator of job dictionaries
+
+    Raises:
+        ValueError: If a field is unknown (raised before the first job is read)
+    """
+    fields = resolve_job_fields(fields)
+    cursor = conn.execute(list_jobs_sql(fields))
+
+    def rows():
+        try:
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                for row in batch:
+                    yield dict(zip(fields, row))
+        finally:
+            cursor.close()
+
+    return rows()
+
+# Both stats read job_counters, which the triggers keep current
+STATUS_COUNTS_SQL = '''
+    SELECT key as status, count
+    FROM job_counters
+    WHERE kind = 'status' AND count > 0
+'''
+
+APPLIED_ON_DATE_SQL = '''
+    SELECT count
+    FROM job_counters
+    WHERE kind = 'applied_on' AND key = ?
+'''
+
+def verify_counters(conn: sqlite3.Connection, repair: bool = False) -> List[Dict]:
+    """
+    Compare job_counters with counts recomputed from the jobs table.
+
+    Args:
+        conn: Connection to the jobs database
+        repair: Replace the counters with the recomputed counts if they differ
+
+    Returns:
+        List of mismatches, each with kind, key, stored and actual counts
+    """
+    stored = {(row[0], row[1]): row[2] for row in conn.execute(
+        'SELECT kind, key, count FROM job_counters WHERE count != 0')}
+    actual = {(row[0], row[1]): row[2] for row in conn.execute(EXACT_COUNTERS_SQL)}
+    mismatches = [
+        {'kind': kind, 'key': key, 'stored': stored.get((kind, key), 0), 'actual': actual.get((kind, key), 0)}
+        for kind, key in sorted(set(stored) | set(actual))
+        if stored.get((kind, key), 0) != actual.get((kind, key), 0)
+    ]
+    if mismatches and repair:
+        with conn:
+            conn.execute('DELETE FROM job_counters')
+            conn.execute(f'INSERT INTO job_counters (kind, key, count) {EXACT_COUNTERS_SQL}')
+    return mismatches
+
+# Highlight markers used inside SQLite, swapped for <mark> tags after HTML-escaping the snippet
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+# Words of context around the matched terms in a snippet
+SNIPPET_WORDS = 16
+
+# bm25 weights of the title, company and description columns
+JOB_COLUMN_WEIGHTS = (10.0, 5.0, 1.0)
+
+SEARCH_JOBS_SQL = f'''
+    WITH matches AS (
+        SELECT rowid as job_id,
+               bm25(jobs_fts, {', '.join(str(weight) for weight in JOB_COLUMN_WEIGHTS)}) as score,
+               snippet(jobs_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', {SNIPPET_WORDS}) as snippet,
+               'job' as matched_in
+        FROM jobs_fts
+        WHERE jobs_fts MATCH :query
+        UNION ALL
+        SELECT tr.job_id,
+               bm25(resume_blobs_fts) as score,
+               snippet(resume_blobs_fts, 0, '{_MARK_START}', '{_MARK_END}', '…', {SNIPPET_WORDS}) as snippet,
+               'tailored_resume' as matched_in
+        FROM resume_blobs_fts
+        JOIN tailored_resumes tr ON tr.blob_id = resume_blobs_fts.rowid
+        WHERE resume_blobs_fts MATCH :query
+    ),
+    best AS (
+        -- With MIN(), SQLite takes the other columns from the best-scoring row
+        SELECT job_id, MIN(score) as score, snippet, matched_in
+        FROM matches
+        GROUP BY job_id
+    )
+    SELECT {{columns}}, best.snippet as snippet, best.matched_in as matched_in
+    FROM best
+    JOIN jobs j ON j.id = best.job_id
+    ORDER BY best.score, j.id DESC
+    LIMIT :limit OFFSET :offset
+'''
+
+# Results per search page when no limit is given
+DEFAULT_SEARCH_LIMIT = 20
+
+def fts_query(text: str) -> Optional[str]:
+    """
+    Turn free text typed by a user into an FTS5 query matching all of its words.
+
+    Words are quoted so FTS5 operators and punctuation in the input cannot
+    cause syntax errors; the last word also matches as a prefix, so results
+    appear while it is still being typed.
+
+    Returns:
+        FTS5 query, or None if the text has no words
+    """
+    words = re.findall(r'\w+', text or '')
+    if not words:
+        return None
+    return ' '.join(f'"{word}"' for word in words) + '*'
+
+def _highlight(snippet: Optional[str]) -> str:
+    return html.escape(snippet or '').replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+def search_jobs(conn: sqlite3.Connection, text: str, fields: Optional[Sequence[str]] = None,
+                limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Search saved jobs and their tailored resumes, best matches first.
+
+    Jobs match on their title, company or description (weighted in that
+    order) or on the content of a tailored resume. Each result carries an
+    HTML-escaped ``snippet`` with the matched words in <mark> tags, and
+    ``matched_in`` ('job' or 'tailored_resume').
+
+    Args:
+        conn: Connection to the jobs database
+        text: Words to search for
+        fields: Names from JOB_FIELDS to return (defaults to DEFAULT_JOB_FIELDS)
+        limit: Page size, capped at MAX_PAGE_SIZE
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        tuple: (results, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the text has no words, or a field, the limit or the cursor is invalid
+    """
+    query = fts_query(text)
+    if query is None:
+        raise ValueError("Search text must contain at least one word")
+    fields = resolve_job_fields(fields)
+    limit = DEFAULT_SEARCH_LIMIT if limit is None else limit
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    limit = min(limit, MAX_PAGE_SIZE)
+    offset = 0
+    if cursor:
+        # Ranked results are paged by position
+        try:
+            offset = int(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii'))
+        except (UnicodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    columns = ', '.join(f'{JOB_FIELDS[field]} as {field}' for field in fields)
+    rows = conn.execute(SEARCH_JOBS_SQL.format(columns=columns),
+                        {'query': query, 'limit': limit + 1, 'offset': offset}).fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = base64.urlsafe_b64encode(str(offset + limit).encode('ascii')).decode('ascii')
+    results = []
+    for row in rows:
+        result = dict(zip(fields, row))
+        result['snippet'] = _highlight(row[len(fields)])
+        result['matched_in'] = row[len(fields) + 1]
+        results.append(result)
+    return results, next_cursor
+
+LATEST_TAILORED_RESUME_SQL = '''
+    SELECT tr.id, tr.job_id, tr.created_at, b.data
+    FROM tailored_resumes tr
+    LEFT JOIN resume_blobs b ON b.id = tr.blob_id
+    WHERE tr.job_id = ?
+    ORDER BY tr.created_at DESC, tr.id DESC
+    LIMIT 1
+'''
+
+def add_tailored_resume(conn: sqlite3.Connection, job_id: int, content: str) -> int:
+    """
+    Record a tailored resume for a job, sharing the stored body with every
+    other tailored resume of the same text. The caller commits.
+
+    Returns:
+        ID of the new tailored_resumes row
+    """
+    blob_id = store_resume_blob(conn, content)
+    return conn.execute('INSERT INTO tailored_resumes (job_id, blob_id) VALUES (?, ?)', (job_id, blob_id)).lastrowid
+
+def get_latest_tailored_resume(conn: sqlite3.Connection, job_id: int) -> Optional[Dict]:
+    """
+    Get the most recent tailored resume of a job, body decompressed.
+
+    Returns:
+        dict with id, job_id, content and created_at, or None if the job has none
+    """
+    row = conn.execute(LATEST_TAILORED_RESUME_SQL, (job_id,)).fetchone()
+    if row is None:
+        return None
+    return {'id': row[0], 'job_id': row[1], 'content': _decompress(row[3]), 'created_at': row[2]}
+
+def prune_resume_blobs(conn: sqlite3.Connection) -> int:
+    """
+    Delete stored resume bodies that no tailored resume refers to any more.
+
+    Returns:
+        Number of bodies deleted
+    """
+    unused = conn.execute('''
+        SELECT id, data FROM resume_blobs b
+        WHERE NOT EXISTS (SELECT 1 FROM tailored_resumes WHERE blob_id = b.id)
+    ''').fetchall()
+    with conn:
+        for blob_id, data in unused:
+            conn.execute("INSERT INTO resume_blobs_fts (resume_blobs_fts, rowid, content) VALUES ('delete', ?, ?)",
+                         (blob_id, _decompress(data)))
+            conn.execute('DELETE FROM resume_blobs WHERE id = ?', (blob_id,))
+    return len(unused)
+
+# Seconds after which an unfinished tailoring or parse task is assumed lost with its process
+TAILOR_TASK_STALE_SECONDS = 600
+PARSE_TASK_STALE_SECONDS = 600
+
+# Seconds finished tailoring and parse tasks are kept for status queries
+TAILOR_TASK_RETENTION_SECONDS = 3600
+PARSE_TASK_RETENTION_SECONDS = 3600
+
+def _expire_tasks(conn: sqlite3.Connection, table: str, now: float, stale_seconds: float,
+                  retention_seconds: float, error: str) -> None:
+    """Fail a task table's unfinished tasks not updated for ``stale_seconds`` and delete old finished ones."""
+    conn.execute(f'''
+        UPDATE {table}
+        SET status = 'failed', stage = 'failed', error = ?, updated_at = ?, finished_at = ?
+        WHERE status IN ('queued', 'running') AND updated_at < ?
+    ''', (error, now, now, now - stale_seconds))
+    conn.execute(f'DELETE FROM {table} WHERE finished_at < ?', (now - retention_seconds,))
+
+def create_tailor_task(conn: sqlite3.Connection, job_id: int, template: str) -> Tuple[str, bool]:
+    """
+    Queue a tailoring task, unless one for the same job and template is unfinished.
+
+    Tasks left unfinished for TAILOR_TASK_STALE_SECONDS are marked failed
+    first, so a process that died mid-task does not block new ones, and
+    finished tasks past TAILOR_TASK_RETENTION_SECONDS are deleted.
+
+    Args:
+        conn: Connection to the jobs database
+        job_id: Job to tailor a resume for
+        template: Name of the resume template
+
+    Returns:
+        tuple: (task id, whether the task was created rather than an unfinished one reused)
+    """
+    now = time.time()
+    with conn:
+        _expire_tasks(conn, 'tailor_tasks', now, TAILOR_TASK_STALE_SECONDS, TAILOR_TASK_RETENTION_SECONDS,
+                      'Tailoring was interrupted')
+        task_id = uuid.uuid4().hex
+        created = conn.execute('''
+            INSERT INTO tailor_tasks (id, job_id, template, status, stage, created_at, updated_at)
+            VALUES (?, ?, ?, 'queued', 'queued', ?, ?)
+            ON CONFLICT (job_id, template) WHERE status IN ('queued', 'running') DO NOTHING
+        ''', (task_id, job_id, template, now, now)).rowcount == 1
+        if not created:
+            # The write transaction keeps the unfinished task from finishing meanwhile
+            task_id = conn.execute('''
+                SELECT id FROM tailor_tasks
+                WHERE job_id = ? AND template = ? AND status IN ('queued', 'running')
+            ''', (job_id, template)).fetchone()[0]
+    return task_id, created
+
+def update_tailor_task(conn: sqlite3.Connection, task_id: str, status: str, stage: Optional[str] = None,
+                       resume_id: Optional[int] = None, error: Optional[str] = None) -> None:
+    """
+    Record a tailoring task's progress and commit.
+
+    Args:
+        conn: Connection to the jobs database
+        task_id: Task to update
+        status: One of queued, running, done or failed
+        stage: Name of the current stage (defaults to the status)
+        resume_id: Tailored resume the task produced, once done
+        error: Error message, if the task failed
+    """
+    now = time.time()
+    finished_at = now if status in ('done', 'failed') else None
+    with conn:
+        conn.execute('''
+            UPDATE tailor_tasks
+            SET status = ?, stage = ?, resume_id = ?, error = ?, updated_at = ?, finished_at = ?
+            WHERE id = ?
+        ''', (status, stage or status, resume_id, error, now, finished_at, task_id))
+
+def get_tailor_task(conn: sqlite3.Connection, task_id: str) -> Optional[Dict]:
+    """
+    Get a tailoring task by id.
+
+    Returns:
+        dict with id, job_id, template, status, stage, resume_id, error,
+        created_at and finished_at, or None if the task is unknown or expired
+    """
+    row = conn.execute('''
+        SELECT id, job_id, template, status, stage, resume_id, error, created_at, finished_at
+        FROM tailor_tasks WHERE id = ?
+    ''', (task_id,)).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('id', 'job_id', 'template', 'status', 'stage', 'resume_id', 'error',
+                     'created_at', 'finished_at'), row))
+
+def create_parse_task(conn: sqlite3.Connection) -> str:
+    """
+    Queue an async resume parse.
+
+    Parses left unfinished for PARSE_TASK_STALE_SECONDS are marked failed
+    first, and finished ones past PARSE_TASK_RETENTION_SECONDS are deleted.
+
+    Args:
+        conn: Connection to the jobs database
+
+    Returns:
+        Id of the new task
+    """
+    now = time.time()
+    task_id = uuid.uuid4().hex
+    with conn:
+        _expire_tasks(conn, 'parse_tasks', now, PARSE_TASK_STALE_SECONDS, PARSE_TASK_RETENTION_SECONDS,
+                      'Parsing was interrupted')
+        conn.execute('''
+            INSERT INTO parse_tasks (id, status, stage, created_at, updated_at)
+            VALUES (?, 'queued', 'queued', ?, ?)
+        ''', (task_id, now, now))
+    return task_id
+
+def update_parse_task(conn: sqlite3.Connection, task_id: str, status: str, stage: Optional[str] = None,
+                      result: Optional[str] = None, error: Optional[str] = None) -> None:
+    """
+    Record an async parse's progress and commit.
+
+    Args:
+        conn: Connection to the jobs database
+        task_id: Task to update
+        status: One of queued, running, done or failed
+        stage: Name of the current stage (defaults to the status)
+        result: Response body of the parse as JSON text, once done
+        error: Error message, if the parse failed
+    """
+    now = time.time()
+    finished_at = now if status in ('done', 'failed') else None
+    with conn:
+        conn.execute('''
+            UPDATE parse_tasks
+            SET status = ?, stage = ?, result = ?, error = ?, updated_at = ?, finished_at = ?
+            WHERE id = ?
+        ''', (status, stage or status, result, error, now, finished_at, task_id))
+
+def get_parse_task(conn: sqlite3.Connection, task_id: str) -> Optional[Dict]:
+    """
+    Get an async parse by id.
+
+    Returns:
+        dict with id, status, stage, result (JSON text), error, created_at
+        and finished_at, or None if the task is unknown or expired
+    """
+    row = conn.execute('''
+        SELECT id, status, stage, result, error, created_at, finished_at
+        FROM parse_tasks WHERE id = ?
+    ''', (task_id,)).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('id', 'status', 'stage', 'result', 'error', 'created_at', 'finished_at'), row))
+
+def database_size(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Get the size of the database file and how much of it is unused pages.
+
+    Returns:
+        dict with total and free bytes
+    """
+    page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    return {'total': page_size * page_count, 'free': page_size * free_pages}
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path: str = DEFAULT_DB_PATH) -> ConnectionPool:
+    """
+    Get the process-wide connection pool for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        ConnectionPool shared by every caller using the same path
+    """
+    key = os.path.abspath(db_path) if db_path != ':memory:' else db_path
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(db_path)
+        return pool
+
+class Database:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self.create_tables()
+
+    def create_tables(self):
+        with self.pool.connection() as conn:
+            migrate(conn)
+
+    def save_job(self, title: str, company: str, description: str, apply_link: Optional[str] = None) -> int:
+        with self.pool.connection() as conn:
+            return save_job(conn, {
+                'title': title, 'company': company, 'description': description, 'apply_link': apply_link
+            })
 
     def get_jobs(self) -> List[Dict]:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM jobs ORDER BY saved_at DESC")
-        jobs = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return jobs
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(LIST_JOBS_SQL)]
 
     def get_job(self, job_id: int) -> Optional[Dict]:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        job = cursor.fetchone()
-        
-        conn.close()
-        return dict(job) if job else None
+        with self.pool.connection() as conn:
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            return dict(job) if job else None
 
     def delete_job(self, job_id: int) -> bool:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-        success = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
-        return success 
\ No newline at end of file
+        with self.pool.connection() as conn, conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            return cursor.rowcount > 0
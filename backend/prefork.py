@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Pre-fork Server
+
+Serves the backend from several worker processes that share the NLP models
+loaded by a single master process.
+
+The master imports the app, loads the spaCy model, the NLTK corpora and the
+parsers (see ``resume_parser.interface.warm_up``), then freezes the garbage
+collector so collections in the workers do not write to, and so un-share, the
+pages holding those objects. It then opens the listening socket and forks the
+workers, which accept connections from the shared socket. Workers that exit
+are replaced.
+
+Background jobs (re-parsing stale results and upload garbage collection) run
+in the first worker only. Async resume parses and tailoring tasks run in the
+worker that accepted them but record their status in the jobs database, so
+any worker can answer status and event requests for them.
+
+Send SIGUSR1 to the master (or pass ``--report-after SECONDS``) to log a
+memory report, showing for each worker how much of its memory is shared with
+the others and how much is its own.
+
+Usage:
+    python prefork.py [--workers N] [--host HOST] [--port PORT] [--report-after SECONDS]
+"""
+
+import os
+import gc
+import sys
+import time
+import socket
+import signal
+import logging
+import argparse
+from typing import Dict, List, Optional
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fields of /proc/<pid>/smaps_rollup included in memory reports (in kB)
+MEMORY_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+def parse_smaps_rollup(text: str) -> Dict[str, int]:
+    """
+    Parse the contents of /proc/<pid>/smaps_rollup.
+
+    Args:
+        text: File contents
+
+    Returns:
+        Dictionary of memory fields in kB, plus ``shared`` and ``unique`` totals
+    """
+    memory = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(':')
+        if name in MEMORY_FIELDS:
+            memory[name] = int(value.split()[0])
+    memory['shared'] = memory.get('Shared_Clean', 0) + memory.get('Shared_Dirty', 0)
+    memory['unique'] = memory.get('Private_Clean', 0) + memory.get('Private_Dirty', 0)
+    return memory
+
+def read_memory(pid: int) -> Optional[Dict[str, int]]:
+    """Read the memory usage of a process, or None if it is unavailable (e.g. not Linux)."""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            return parse_smaps_rollup(f.read())
+    except OSError:
+        return None
+
+def memory_report(master_pid: int, worker_pids: List[int]) -> str:
+    """
+    Format the memory usage of the master and its workers.
+
+    ``unique`` is memory only that process uses; ``shared`` is memory whose
+    pages are also mapped by other processes, such as the models loaded by
+    the master. PSS splits shared pages evenly between the processes sharing them.
+
+    Returns:
+        Report as a multi-line string
+    """
+    lines = [f"{'process':<16} {'rss MiB':>9} {'pss MiB':>9} {'shared MiB':>11} {'unique MiB':>11}"]
+    total_pss = 0
+    for label, pid in [('master', master_pid)] + [(f'worker {pid}', pid) for pid in worker_pids]:
+        memory = read_memory(pid)
+        if memory is None:
+            lines.append(f"{label:<16} unavailable")
+            continue
+        total_pss += memory.get('Pss', 0)
+        lines.append(f"{label:<16} {memory.get('Rss', 0) / 1024:>9.1f} {memory.get('Pss', 0) / 1024:>9.1f} "
+                     f"{memory['shared'] / 1024:>11.1f} {memory['unique'] / 1024:>11.1f}")
+    lines.append(f"{'total pss':<16} {'':>9} {total_pss / 1024:>9.1f}")
+    return '\n'.join(lines)
+
+def serve_worker(app, listener: socket.socket, host: str, port: int, run_background_jobs: bool) -> None:
+    """Serve requests from the shared listening socket until terminated."""
+    from werkzeug.serving import make_server
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # Memory reports are the master's job; survive a SIGUSR1 sent to the whole group
+    signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+
+    if run_background_jobs:
+        from resume_parser.interface import import_legacy_results
+        from resume_parser.reparse import start_background_reparse
+        from resume_parser.retention import start_background_gc
+        import_legacy_results()
+        start_background_reparse()
+        start_background_gc()
+
+    server = make_server(host, port, app, threaded=True, fd=listener.fileno())
+    server.serve_forever()
+
+class PreforkServer:
+    """
+    Master process that warms up the app and supervises forked workers.
+
+    Args:
+        workers: Number of worker processes
+        host: Address to listen on
+        port: Port to listen on
+        report_after: Log a memory report this many seconds after the workers start
+    """
+
+    def __init__(self, workers: int = 2, host: str = '127.0.0.1', port: int = 5000,
+                 report_after: Optional[float] = None):
+        self.num_workers = workers
+        self.host = host
+        self.port = port
+        self.report_after = report_after
+        self.workers: Dict[int, int] = {}  # pid -> worker index
+        self._stopping = False
+        self._report_requested = False
+
+    def warm_up(self):
+        """Import the app and load every model before forking."""
+        start = time.perf_counter()
+        import app as backend_app
+        from resume_parser.interface import warm_up
+        status = warm_up()
+        backend_app.init_db()
+        backend_app.template_store.load_all()
+        # SQLite connections must not cross fork(); workers open their own
+        backend_app.db_pool.close_all()
+
+        # Move everything loaded so far out of the collector's reach, so the
+        # workers' collections never touch (and copy) these pages
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Warmed up in {time.perf_counter() - start:.1f}s: {status}")
+        return backend_app.app
+
+    def spawn(self, app, listener: socket.socket, index: int) -> int:
+        """Fork one worker."""
+        pid = os.fork()
+        if pid == 0:
+            try:
+                serve_worker(app, listener, self.host, self.port, run_background_jobs=index == 0)
+            finally:
+                os._exit(0)
+        self.workers[pid] = index
+        return pid
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _request_report(self, signum, frame) -> None:
+        self._report_requested = True
+
+    def run(self) -> None:
+        """Warm up, fork the workers and supervise them until SIGINT or SIGTERM."""
+        app = self.warm_up()
+
+        listener = socket.create_server((self.host, self.port), reuse_port=False, backlog=128)
+        listener.set_inheritable(True)
+
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGUSR1, self._request_report)
+
+        for index in range(self.num_workers):
+            self.spawn(app, listener, index)
+        logger.info(f"Serving on http://{self.host}:{self.port} with {self.num_workers} workers "
+                    f"(master pid {os.getpid()}, SIGUSR1 for a memory report)")
+
+        report_at = time.monotonic() + self.report_after if self.report_after is not None else None
+        while not self._stopping:
+            if report_at is not None and time.monotonic() >= report_at:
+                report_at = None
+                self._report_requested = True
+            if self._report_requested:
+                self._report_requested = False
+                logger.info("Memory report:\n" + memory_report(os.getpid(), list(self.workers)))
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if pid and pid in self.workers:
+                index = self.workers.pop(pid)
+                if not self._stopping:
+                    logger.warning(f"Worker {pid} exited with status {status}; starting a replacement")
+                    self.spawn(app, listener, index)
+                continue
+            time.sleep(0.2)
+
+        logger.info("Shutting down workers")
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(self.workers):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        listener.close()
+
+def main():
+    """Main entry point for the pre-fork server."""
+    parser = argparse.ArgumentParser(description='Serve the backend from pre-forked workers.')
+    parser.add_argument('--workers', '-w', type=int, default=int(os.environ.get('WEB_WORKERS', 2)),
+                        help='Number of worker processes')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', '-p', type=int, default=5000, help='Port to listen on')
+    parser.add_argument('--report-after', type=float, help='Log a memory report this many seconds after startup')
+    args = parser.parse_args()
+
+    if not hasattr(os, 'fork'):
+        sys.exit("The pre-fork server needs os.fork(); run app.py instead")
+    PreforkServer(args.workers, args.host, args.port, args.report_after).run()
+
+if __name__ == "__main__":
+    main()
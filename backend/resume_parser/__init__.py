@@ -3,24 +3,40 @@
 Resume Parser Package
 
 This package provides tools for parsing and extracting structured data from resumes.
+
+The public functions are loaded on first access, so importing the package (or
+one of its light modules such as ``file_handler``) does not pull in spaCy,
+NLTK or their models.
 """
 
-from resume_parser.interface import parse_resume, save_parsed_resume, load_parsed_resume
-from resume_parser.enhanced_parser import parse_resume as enhanced_parse_resume
-from resume_parser.relevance_matcher import (
-    score_experience_relevance,
-    rank_experiences,
-    select_relevant_experiences,
-    identify_skill_gaps
-)
+import importlib
+
+# Public name -> (submodule, attribute)
+_LAZY_ATTRIBUTES = {
+    'parse_resume': ('.interface', 'parse_resume'),
+    'parse_resume_file': ('.interface', 'parse_resume_file'),
+    'get_parser_version': ('.interface', 'get_parser_version'),
+    'save_parsed_resume': ('.interface', 'save_parsed_resume'),
+    'load_parsed_resume': ('.interface', 'load_parsed_resume'),
+    'store_parsed_resume': ('.interface', 'store_parsed_resume'),
+    'get_parsed_resume': ('.interface', 'get_parsed_resume'),
+    'enhanced_parse_resume': ('.enhanced_parser', 'parse_resume'),
+    'score_experience_relevance': ('.relevance_matcher', 'score_experience_relevance'),
+    'rank_experiences': ('.relevance_matcher', 'rank_experiences'),
+    'select_relevant_experiences': ('.relevance_matcher', 'select_relevant_experiences'),
+    'identify_skill_gaps': ('.relevance_matcher', 'identify_skill_gaps')
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'parse_resume',
-    'save_parsed_resume',
-    'load_parsed_resume',
-    'enhanced_parse_resume',
-    'score_experience_relevance',
-    'rank_experiences',
-    'select_relevant_experiences',
-    'identify_skill_gaps'
-] 
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,20 +3,29 @@
 Resume Parser CLI
 
 Command-line tool for testing the resume parser with different files.
+
+A single file path keeps the original behaviour of printing one JSON blob.
+Directories, glob patterns and multiple paths switch to batch mode, which
+parses files in parallel and streams one JSON object per line as each file
+finishes.
 """
 
 import os
 import sys
+import glob
 import json
 import argparse
 import logging
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, TextIO
 
 # Add the project root to the Python path to allow imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.insert(0, project_root)
 
-from backend.resume_parser.interface import parse_resume, save_parsed_resume
+from backend.resume_parser.interface import parse_resume, save_parsed_resume, get_parser_version
+from backend.resume_parser.file_handler import allowed_file, compute_file_hash
+from backend.resume_parser.serialization import dumps
 
 # Initialize logger
 logging.basicConfig(
@@ -25,58 +34,237 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default manifest used by --skip-unchanged
+DEFAULT_MANIFEST = '.resume_parser_manifest.json'
+
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description='Parse resume files into structured data.')
-    parser.add_argument('file_path', help='Path to the resume file (PDF, DOC, or DOCX)')
-    parser.add_argument('--output', '-o', help='Path to save the parsed resume data (JSON)')
-    parser.add_argument('--pretty', '-p', action='store_true', help='Pretty-print the output')
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help='Resume files (PDF, DOC, or DOCX), directories or glob patterns')
+    parser.add_argument('--output', '-o',
+                        help='Path to save the parsed resume data (JSON for a single file, JSONL in batch mode)')
+    parser.add_argument('--pretty', '-p', action='store_true', help='Pretty-print the output (single file only)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Increase output verbosity')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Number of files to parse in parallel')
+    parser.add_argument('--skip-unchanged', action='store_true',
+                        help='Skip files whose content hash and parser version match the manifest')
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                        help=f'Manifest of parsed files used by --skip-unchanged (default: {DEFAULT_MANIFEST})')
     return parser.parse_args()
 
+def expand_paths(paths: List[str]) -> List[str]:
+    """
+    Expand files, directories and glob patterns into a sorted list of resume files.
+
+    Args:
+        paths: Paths given on the command line
+
+    Returns:
+        Absolute paths of all matching resume files, without duplicates
+    """
+    files = set()
+    for path in paths:
+        matches = glob.glob(path, recursive=True) if glob.has_magic(path) else [path]
+        for match in matches:
+            if os.path.isdir(match):
+                for root, _, names in os.walk(match):
+                    for name in names:
+                        if allowed_file(name):
+                            files.add(os.path.abspath(os.path.join(root, name)))
+            elif os.path.isfile(match) and allowed_file(match):
+                files.add(os.path.abspath(match))
+            elif not glob.has_magic(path):
+                logger.warning(f"Skipping {match}: not a resume file or directory")
+    return sorted(files)
+
+def load_manifest(manifest_path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load the manifest recording what each file was last parsed from.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        Dictionary of file path to manifest entry (empty if missing or unreadable)
+    """
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+def manifest_entry(content_hash: str) -> Dict[str, str]:
+    """
+    Build the manifest entry for a file parsed by the current parser.
+
+    Args:
+        content_hash: SHA-256 hex digest of the file
+
+    Returns:
+        Dictionary with the content hash and parser version
+    """
+    return {'content_hash': content_hash, 'parser_version': get_parser_version()}
+
+def save_manifest(manifest: Dict[str, Dict[str, str]], manifest_path: str) -> None:
+    """
+    Atomically write the manifest to disk.
+
+    Args:
+        manifest: Dictionary of file path to manifest entry
+        manifest_path: Path to the manifest file
+    """
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def _parse_file(file_path: str) -> Dict[str, Any]:
+    """Parse one file in a worker process."""
+    return parse_resume(file_path)
+
+def run_batch(files: List[str], out: TextIO, jobs: int = 1,
+              manifest: Optional[Dict[str, Dict[str, str]]] = None) -> int:
+    """
+    Parse many files and stream one JSON object per line as each finishes.
+
+    Each line has the form ``{"file": ..., "content_hash": ..., "data": ...}``,
+    or ``{"file": ..., "error": ...}`` when parsing fails.
+
+    Args:
+        files: Resume files to parse
+        out: Stream to write JSON lines to
+        jobs: Number of worker processes
+        manifest: Optional manifest; files whose content hash and parser version
+            both match their entry are skipped, and successfully parsed files
+            are recorded in it
+
+    Returns:
+        Number of files that failed to parse
+    """
+    hashes = {}
+    pending = []
+    failures = 0
+    for file_path in files:
+        try:
+            content_hash = compute_file_hash(file_path)
+        except OSError as e:
+            # Deleted or unreadable since the paths were expanded
+            failures += 1
+            logger.error(f"Error reading {file_path}: {e}")
+            out.write(dumps({'file': file_path, 'error': str(e)}).decode('utf-8') + '\n')
+            out.flush()
+            continue
+        # Entries from another parser version (or older manifests holding
+        # only a hash) do not match, so those files are parsed again
+        if manifest is not None and manifest.get(file_path) == manifest_entry(content_hash):
+            logger.debug(f"Skipping unchanged file: {file_path}")
+            continue
+        hashes[file_path] = content_hash
+        pending.append(file_path)
+
+    logger.info(f"Parsing {len(pending)} of {len(files)} files with {jobs} worker(s)")
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {executor.submit(_parse_file, path): path for path in pending}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                resume_data = future.result()
+            except Exception as e:
+                resume_data = {'error': str(e)}
+
+            if 'error' in resume_data:
+                failures += 1
+                logger.error(f"Error parsing {file_path}: {resume_data['error']}")
+                record = {'file': file_path, 'error': resume_data['error']}
+            else:
+                record = {'file': file_path, 'content_hash': hashes[file_path], 'data': resume_data}
+                if manifest is not None:
+                    manifest[file_path] = manifest_entry(hashes[file_path])
+
+            out.write(dumps(record).decode('utf-8') + '\n')
+            out.flush()
+
+    return failures
+
+def parse_single(args) -> None:
+    """Parse a single file and print one JSON blob (the original CLI behaviour)."""
+    file_path = args.paths[0]
+
+    # Parse resume
+    logger.info(f"Parsing resume: {file_path}")
+    resume_data = parse_resume(file_path)
+
+    # Check for errors
+    if 'error' in resume_data:
+        logger.error(f"Error parsing resume: {resume_data['error']}")
+        sys.exit(1)
+
+    # Save to file if output path is provided
+    if args.output:
+        logger.info(f"Saving parsed resume data to {args.output}")
+        if save_parsed_resume(resume_data, args.output):
+            logger.info("Data saved successfully")
+        else:
+            logger.error("Failed to save data")
+            sys.exit(1)
+
+    # Print to stdout
+    if args.pretty:
+        print(json.dumps(resume_data, indent=2))
+    else:
+        print(json.dumps(resume_data))
+
 def main():
     """Main entry point for the CLI."""
     args = parse_args()
-    
+
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
-    
+
     try:
-        # Check if file exists
-        if not os.path.exists(args.file_path):
-            logger.error(f"File not found: {args.file_path}")
+        batch_mode = (
+            len(args.paths) > 1
+            or args.jobs > 1
+            or args.skip_unchanged
+            or not os.path.isfile(args.paths[0])
+        )
+
+        if not batch_mode:
+            parse_single(args)
+            logger.info("Resume parsing completed successfully")
+            return
+
+        files = expand_paths(args.paths)
+        if not files:
+            logger.error(f"No resume files found in: {', '.join(args.paths)}")
             sys.exit(1)
-        
-        # Parse resume
-        logger.info(f"Parsing resume: {args.file_path}")
-        resume_data = parse_resume(args.file_path)
-        
-        # Check for errors
-        if 'error' in resume_data:
-            logger.error(f"Error parsing resume: {resume_data['error']}")
+
+        manifest = load_manifest(args.manifest) if args.skip_unchanged else None
+
+        out = open(args.output, 'a') if args.output else sys.stdout
+        try:
+            failures = run_batch(files, out, jobs=args.jobs, manifest=manifest)
+        finally:
+            if manifest is not None:
+                save_manifest(manifest, args.manifest)
+            if out is not sys.stdout:
+                out.close()
+
+        if failures:
+            logger.error(f"{failures} file(s) failed to parse")
             sys.exit(1)
-        
-        # Save to file if output path is provided
-        if args.output:
-            logger.info(f"Saving parsed resume data to {args.output}")
-            if save_parsed_resume(resume_data, args.output):
-                logger.info("Data saved successfully")
-            else:
-                logger.error("Failed to save data")
-                sys.exit(1)
-        
-        # Print to stdout
-        if args.pretty:
-            print(json.dumps(resume_data, indent=2))
-        else:
-            print(json.dumps(resume_data))
-        
+
         logger.info("Resume parsing completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -5,7 +5,7 @@ This module provides functions for extracting structured data from resume DOCX f
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Callable
 import docx
 
 # Initialize logger
@@ -46,7 +46,7 @@ def extract_text_from_docx(docx_path: str) -> str:
         logger.error(f"Error extracting text from DOCX: {e}")
         return ""
 
-def parse_resume_docx(docx_path: str) -> Dict[str, Any]:
+def parse_resume_docx(docx_path: str, progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Parse a resume DOCX file into structured data.
     
@@ -55,6 +55,7 @@ def parse_resume_docx(docx_path: str) -> Dict[str, Any]:
     
     Args:
         docx_path: Path to the resume DOCX file
+        progress: Optional callback called with the name of each parsing stage
         
     Returns:
         Dictionary containing structured resume data
@@ -68,6 +69,8 @@ def parse_resume_docx(docx_path: str) -> Dict[str, Any]:
         )
         
         # Extract text from DOCX
+        if progress:
+            progress('extracting')
         raw_text = extract_text_from_docx(docx_path)
         if not raw_text:
             logger.error(f"Failed to extract text from {docx_path}")
@@ -77,6 +80,8 @@ def parse_resume_docx(docx_path: str) -> Dict[str, Any]:
         normalized_text = normalize_text(raw_text)
         
         # Identify sections in the resume
+        if progress:
+            progress('sectioning')
         sections = identify_sections(normalized_text)
         
         # Extract contact information (typically from the header section)
@@ -287,13 +287,20 @@ def extract_research(text):
     
     return research_items
 
-def parse_resume(file_path):
-    """Parse a resume file and extract structured information."""
+def parse_resume(file_path, progress=None):
+    """Parse a resume file and extract structured information.
+    
+    ``progress``, if given, is called with the name of each parsing stage.
+    """
     try:
         # Extract text from PDF
+        if progress:
+            progress('extracting')
         text = extract_text(file_path)
         
         # Identify sections in the resume
+        if progress:
+            progress('sectioning')
         sections = identify_sections(text)
         
         # Extract contact information from the header
@@ -5,9 +5,10 @@ This module provides functions for handling uploaded resume files.
 """
 
 import os
-import uuid
+import hashlib
 import logging
-from typing import Tuple, Optional
+import tempfile
+from typing import Dict, Any, Tuple, Optional
 from werkzeug.utils import secure_filename
 
 # Initialize logger
@@ -35,45 +36,268 @@ def allowed_file(filename: str) -> bool:
     """
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def save_resume_file(file, user_id: str = None) -> Tuple[bool, str, Optional[str]]:
+# Number of bytes read from an upload at a time
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum size of an uploaded resume in bytes
+MAX_UPLOAD_BYTES = int(os.environ.get('MAX_UPLOAD_BYTES', 10 * 1024 * 1024))
+
+# Leading bytes ("magic numbers") each allowed file type must start with
+FILE_SIGNATURES = {
+    'pdf': b'%PDF-',
+    'docx': b'PK\x03\x04',
+    'doc': b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',
+}
+
+class UploadError(Exception):
+    """An upload was rejected. ``status_code`` is the HTTP status to respond with."""
+    status_code = 400
+
+class UploadTooLarge(UploadError):
+    """The upload exceeded the configured size limit."""
+    status_code = 413
+
+class InvalidUploadContent(UploadError):
+    """The upload's content does not match its file type."""
+    status_code = 415
+
+def describe_size(num_bytes: int) -> str:
     """
-    Save an uploaded resume file to disk.
+    Describe a size limit in human-readable units.
+    
+    Args:
+        num_bytes: Size in bytes
+        
+    Returns:
+        Size in MB, KB or bytes (e.g. "10 MB")
+    """
+    for unit, scale in (('MB', 1024 * 1024), ('KB', 1024)):
+        if num_bytes >= scale:
+            return f"{num_bytes / scale:.3g} {unit}"
+    return f"{num_bytes} bytes"
+
+def check_file_signature(extension: str, head: bytes) -> bool:
+    """
+    Check that the first bytes of a file match its extension.
+    
+    Args:
+        extension: File extension (without the dot)
+        head: First bytes of the file
+        
+    Returns:
+        True if the file starts with the signature for its type, False otherwise
+    """
+    signature = FILE_SIGNATURES.get(extension.lower())
+    return signature is not None and head[:len(signature)] == signature
+
+class UploadSpool:
+    """
+    Writable file that hashes, size-limits and type-checks an upload as it streams in.
+    
+    Werkzeug's multipart parser writes each uploaded file into the object
+    returned by ``Request._get_file_stream`` in fixed-size chunks. Returning an
+    UploadSpool there means the body is written straight to a temporary file in
+    UPLOAD_DIR, hashed on the way, and rejected as soon as it exceeds
+    ``max_bytes`` or its first bytes do not match the file type, without the
+    whole body ever being buffered. The temporary file is removed on close
+    unless ``store_resume_upload`` has claimed it.
+    
+    Args:
+        filename: Filename given by the client
+        max_bytes: Maximum number of bytes accepted
+    """
+    
+    def __init__(self, filename: Optional[str], max_bytes: int = MAX_UPLOAD_BYTES):
+        if not filename or not allowed_file(filename):
+            raise UploadError("Invalid file type. Please upload a PDF, DOC, or DOCX file.")
+        self.extension = get_file_extension(filename)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._head = b''
+        fd, self.path = tempfile.mkstemp(dir=UPLOAD_DIR, prefix='.upload-')
+        self._file = os.fdopen(fd, 'w+b')
+    
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the bytes written so far."""
+        return self._digest.hexdigest()
+    
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.discard()
+            raise UploadTooLarge(f"File is too large. The maximum size is {describe_size(self.max_bytes)}.")
+        
+        # Check the signature as soon as enough of the first chunk has arrived
+        signature_length = len(FILE_SIGNATURES[self.extension])
+        if len(self._head) < signature_length:
+            self._head += data[:signature_length - len(self._head)]
+            if len(self._head) >= signature_length and not check_file_signature(self.extension, self._head):
+                self.discard()
+                raise InvalidUploadContent(f"File content does not match a {self.extension.upper()} file.")
+        
+        self._digest.update(data)
+        return self._file.write(data)
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+    
+    def readline(self, size: int = -1) -> bytes:
+        return self._file.readline(size)
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def claim(self) -> str:
+        """
+        Take ownership of the temporary file so it is not removed on close.
+        
+        Returns:
+            Path of the temporary file
+        """
+        if len(self._head) < len(FILE_SIGNATURES[self.extension]):
+            self.discard()
+            raise InvalidUploadContent(f"File content does not match a {self.extension.upper()} file.")
+        self._file.close()
+        path, self.path = self.path, None
+        return path
+    
+    def discard(self) -> None:
+        """Close and remove the temporary file."""
+        self._file.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+    
+    def close(self) -> None:
+        self.discard()
+
+def get_blob_path(content_hash: str, extension: str, upload_dir: Optional[str] = None) -> str:
+    """
+    Get the path a file with the given content is stored at.
+    
+    Args:
+        content_hash: SHA-256 hex digest of the file contents
+        extension: File extension (without the dot)
+        upload_dir: Root of the upload storage (defaults to UPLOAD_DIR)
+        
+    Returns:
+        Path of the content-addressed file, sharded by hash prefix so no single
+        directory grows too large (e.g. ``UPLOAD_DIR/ab/cd/abcd....pdf``)
+    """
+    return os.path.join(upload_dir or UPLOAD_DIR, content_hash[:2], content_hash[2:4],
+                        f"{content_hash}.{extension}")
+
+def store_resume_upload(file, user_id: str = None,
+                        max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """
+    Stream an uploaded resume file to content-addressed storage.
+    
+    The upload is hashed while it is written to a temporary file. If a file
+    with the same content is already stored, the temporary file replaces it,
+    so a duplicate upload costs one hash computation and no extra disk space.
+    Every upload gets its own metadata row pointing at the stored file.
+    
+    Uploads larger than ``max_bytes`` or whose first bytes do not match their
+    file type are rejected as soon as the offending chunk is read.
     
     Args:
         file: The file object from the request
         user_id: Optional user ID to associate with the file
+        max_bytes: Maximum size of the upload in bytes
         
     Returns:
         Tuple containing:
         - Success status (True/False)
         - Message string
-        - Path to the saved file (if successful, otherwise None)
+        - Upload details (if successful, otherwise None): path, content_hash,
+          size, upload_id and duplicate (whether the content was already stored)
+    
+    Raises:
+        UploadError: If the upload is too large or its content does not match
+                     its file type; ``status_code`` gives the HTTP status
     """
+    tmp_path = None
     try:
-        if file and allowed_file(file.filename):
-            # Generate a secure filename
-            filename = secure_filename(file.filename)
-            
-            # Add user_id prefix if provided
-            prefix = f"{user_id}_" if user_id else ""
-            
-            # Add a UUID to ensure uniqueness
-            unique_filename = f"{prefix}{uuid.uuid4().hex}_{filename}"
-            
-            # Full path to save the file
-            file_path = os.path.join(UPLOAD_DIR, unique_filename)
-            
-            # Save the file
-            file.save(file_path)
-            
-            logger.info(f"Resume file saved successfully: {file_path}")
-            return True, "File uploaded successfully", file_path
-        else:
+        if not (file and allowed_file(file.filename)):
             logger.warning(f"Invalid file type: {file.filename if file else 'No file'}")
             return False, "Invalid file type. Please upload a PDF, DOC, or DOCX file.", None
+        
+        # Generate a secure filename to keep as metadata
+        filename = secure_filename(file.filename)
+        extension = get_file_extension(filename)
+        
+        if isinstance(file.stream, UploadSpool):
+            # Already streamed, hashed and checked while the request was parsed
+            spool = file.stream
+            content_hash, size = spool.content_hash, spool.size
+            tmp_path = spool.claim()
+        else:
+            # Stream the upload to a temporary file, hashing and checking as we go
+            spool = UploadSpool(filename, max_bytes)
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                spool.write(chunk)
+            content_hash, size = spool.content_hash, spool.size
+            tmp_path = spool.claim()
+        
+        # Keep one copy of each distinct file
+        file_path = get_blob_path(content_hash, extension)
+        duplicate = os.path.exists(file_path)
+        
+        # Imported here so the store is only opened when uploads are handled
+        from resume_parser.store import get_store
+        
+        # Record the upload before moving the file into place: the garbage
+        # collector removes files while holding the store's write lock, so
+        # a file it removed for an older upload is stored again here
+        upload_id = get_store().record_upload(content_hash, file_path, filename, user_id, size)
+        
+        # Replacing an existing copy is harmless: it has the same content
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(tmp_path, file_path)
+        tmp_path = None
+        
+        logger.info(f"Resume file stored as {file_path} (duplicate: {duplicate})")
+        return True, "File uploaded successfully", {
+            'path': file_path,
+            'content_hash': content_hash,
+            'size': size,
+            'upload_id': upload_id,
+            'duplicate': duplicate
+        }
+    except UploadError as e:
+        logger.warning(f"Rejected upload {file.filename}: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"Error saving resume file: {str(e)}")
         return False, f"Error saving file: {str(e)}", None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def save_resume_file(file, user_id: str = None) -> Tuple[bool, str, Optional[str]]:
+    """
+    Save an uploaded resume file to disk.
+    
+    Args:
+        file: The file object from the request
+        user_id: Optional user ID to associate with the file
+        
+    Returns:
+        Tuple containing:
+        - Success status (True/False)
+        - Message string
+        - Path to the saved file (if successful, otherwise None)
+    """
+    try:
+        success, message, upload = store_resume_upload(file, user_id)
+    except UploadError as e:
+        return False, str(e), None
+    return success, message, upload['path'] if upload else None
 
 def delete_resume_file(file_path: str) -> Tuple[bool, str]:
     """
@@ -109,4 +333,21 @@ def get_file_extension(file_path: str) -> str:
     Returns:
         File extension (without the dot)
     """
-    return os.path.splitext(file_path)[1][1:].lower() 
\ No newline at end of file
+    return os.path.splitext(file_path)[1][1:].lower()
+
+def compute_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hash of a file's contents.
+    
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes to read at a time
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
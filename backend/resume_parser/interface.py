@@ -5,18 +5,59 @@ This module provides a unified interface for parsing different resume file forma
 """
 
 import os
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Callable
 
-from resume_parser.file_handler import get_file_extension
-from resume_parser.parser import parse_resume_pdf
-from resume_parser.docx_parser import parse_resume_docx
+from resume_parser.file_handler import get_file_extension, UPLOAD_DIR
+from resume_parser.store import get_store
+from resume_parser.serialization import dumps, loads
 
 # Initialize logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def parse_resume(file_path: str) -> Dict[str, Any]:
+# Modules whose source determines the parser version
+PARSER_MODULES = ('parser.py', 'enhanced_parser.py', 'docx_parser.py')
+
+# Fields of a parse result that are only useful for debugging the parser
+DEBUG_FIELDS = ('raw_sections',)
+
+@lru_cache(maxsize=None)
+def get_parser_version() -> str:
+    """
+    Get the version of the parsing heuristics.
+    
+    The version is derived from the source of the parser modules, so any change
+    to the heuristics produces a new version without anyone having to bump it.
+    
+    Returns:
+        Short hex digest identifying the parser code
+    """
+    digest = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for module_name in PARSER_MODULES:
+        with open(os.path.join(package_dir, module_name), 'rb') as f:
+            digest.update(module_name.encode())
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+def stamp_parser_version(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Record the current parser version in a parse result that does not have one.
+    
+    Args:
+        resume_data: Structured resume data
+        
+    Returns:
+        The same dictionary
+    """
+    if 'error' not in resume_data:
+        resume_data.setdefault('parser_version', get_parser_version())
+    return resume_data
+
+def parse_resume(file_path: str, progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Parse a resume file into structured data.
     
@@ -24,6 +65,7 @@ def parse_resume(file_path: str) -> Dict[str, Any]:
     
     Args:
         file_path: Path to the resume file
+        progress: Optional callback called with the name of each parsing stage
         
     Returns:
         Dictionary containing structured resume data
@@ -37,13 +79,16 @@ def parse_resume(file_path: str) -> Dict[str, Any]:
         # Get file extension
         file_ext = get_file_extension(file_path)
         
-        # Call appropriate parser based on file extension
+        # Call appropriate parser based on file extension; parsers are imported
+        # on first use so importing this module does not load the NLP models
         if file_ext == 'pdf':
+            from resume_parser.parser import parse_resume_pdf
             logger.info(f"Parsing PDF resume: {file_path}")
-            return parse_resume_pdf(file_path)
+            return stamp_parser_version(parse_resume_pdf(file_path, progress))
         elif file_ext in ['docx', 'doc']:
+            from resume_parser.docx_parser import parse_resume_docx
             logger.info(f"Parsing DOCX resume: {file_path}")
-            return parse_resume_docx(file_path)
+            return stamp_parser_version(parse_resume_docx(file_path, progress))
         else:
             logger.error(f"Unsupported file format: {file_ext}")
             return {'error': f'Unsupported file format: {file_ext}'}
@@ -51,6 +96,38 @@ def parse_resume(file_path: str) -> Dict[str, Any]:
         logger.error(f"Error parsing resume: {str(e)}")
         return {'error': str(e)}
 
+def parse_resume_file(file_path: str,
+                      progress: Optional[Callable[[str], None]] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Parse a resume file, trying the enhanced parser first for PDFs.
+    
+    Falls back to the standard parser if the enhanced parser fails or does
+    not return contact information.
+    
+    Args:
+        file_path: Path to the resume file
+        progress: Optional callback called with the name of each parsing stage
+        
+    Returns:
+        Tuple containing:
+        - Dictionary containing structured resume data
+        - Whether the enhanced parser produced the data
+    """
+    if get_file_extension(file_path) == 'pdf':
+        try:
+            # Imported here so the standard parser does not depend on it
+            from resume_parser.enhanced_parser import parse_resume as enhanced_parse_resume
+            
+            logger.info(f"Running enhanced parser on {file_path}")
+            resume_data = enhanced_parse_resume(file_path, progress)
+            if resume_data and isinstance(resume_data, dict) and 'contact_info' in resume_data:
+                return stamp_parser_version(resume_data), True
+            logger.warning(f"Enhanced parser didn't return valid data for {file_path}")
+        except Exception as e:
+            logger.error(f"Enhanced parser error: {str(e)}")
+    
+    return parse_resume(file_path, progress), False
+
 def save_parsed_resume(resume_data: Dict[str, Any], file_path: Optional[str] = None) -> bool:
     """
     Save parsed resume data for future use.
@@ -63,8 +140,6 @@ def save_parsed_resume(resume_data: Dict[str, Any], file_path: Optional[str] = N
         True if successful, False otherwise
     """
     try:
-        import json
-        
         # Create a default path if not provided
         if not file_path:
             # Generate filename from contact info if available
@@ -75,9 +150,11 @@ def save_parsed_resume(resume_data: Dict[str, Any], file_path: Optional[str] = N
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
+        stamp_parser_version(resume_data)
+        
         # Save as JSON
-        with open(file_path, 'w') as f:
-            json.dump(resume_data, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(dumps(resume_data, pretty=True))
         
         logger.info(f"Parsed resume data saved to {file_path}")
         return True
@@ -96,19 +173,180 @@ def load_parsed_resume(file_path: str) -> Dict[str, Any]:
         Dictionary containing structured resume data
     """
     try:
-        import json
-        
         # Check if file exists
         if not os.path.exists(file_path):
             logger.error(f"File not found: {file_path}")
             return {'error': 'File not found'}
         
         # Load JSON
-        with open(file_path, 'r') as f:
-            resume_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            resume_data = loads(f.read())
         
         logger.info(f"Parsed resume data loaded from {file_path}")
         return resume_data
     except Exception as e:
         logger.error(f"Error loading parsed resume data: {str(e)}")
-        return {'error': str(e)} 
\ No newline at end of file
+        return {'error': str(e)}
+
+def store_parsed_resume(resume_data: Dict[str, Any], content_hash: str,
+                        source_path: Optional[str] = None) -> bool:
+    """
+    Save parsed resume data to the parsed resume store.
+    
+    Args:
+        resume_data: Structured resume data
+        content_hash: SHA-256 hex digest of the source file
+        source_path: Optional path of the source file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        stamp_parser_version(resume_data)
+        get_store().save(resume_data, content_hash, resume_data['parser_version'], source_path)
+        logger.info(f"Parsed resume data stored for {content_hash}")
+        return True
+    except Exception as e:
+        logger.error(f"Error storing parsed resume data: {str(e)}")
+        return False
+
+# Version recorded for results imported from legacy JSON files; it never
+# matches a real version, so the re-parse job upgrades them
+LEGACY_PARSER_VERSION = 'legacy'
+
+def import_legacy_results(directory: Optional[str] = None) -> int:
+    """
+    Import the ``.json`` parse results older versions saved next to their
+    uploads into the parsed resume store.
+    
+    Args:
+        directory: Directory holding the legacy uploads (defaults to UPLOAD_DIR)
+        
+    Returns:
+        Number of results imported
+    """
+    try:
+        imported = get_store().import_json_files(directory or UPLOAD_DIR, LEGACY_PARSER_VERSION)
+    except Exception as e:
+        logger.error(f"Error importing legacy parse results: {str(e)}")
+        return 0
+    if imported:
+        logger.info(f"Imported {imported} legacy parse results")
+    return imported
+
+def get_parsed_resume(content_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the newest stored parse of a file.
+    
+    The result may come from an older parser version; the background re-parse
+    job replaces it once a result from the current version is ready.
+    
+    Args:
+        content_hash: SHA-256 hex digest of the source file
+        
+    Returns:
+        Structured resume data, or None if the file has not been parsed
+    """
+    try:
+        return get_store().get(content_hash)
+    except Exception as e:
+        logger.error(f"Error loading parsed resume data: {str(e)}")
+        return None
+
+def project_resume_data(resume_data: Dict[str, Any], fields: Optional[List[str]] = None,
+                        include_debug: bool = False) -> Dict[str, Any]:
+    """
+    Select the fields of a parse result to send to a client.
+    
+    Stored results are shared and never modified; a new dictionary is returned.
+    
+    Args:
+        resume_data: Structured resume data
+        fields: Top-level fields to keep; if omitted, every field except the
+            debug fields is kept
+        include_debug: Whether to keep debug fields such as raw_sections when
+            no explicit field list is given
+        
+    Returns:
+        Dictionary with the selected fields
+    """
+    if fields:
+        return {key: resume_data[key] for key in fields if key in resume_data}
+    if include_debug:
+        return dict(resume_data)
+    return {key: value for key, value in resume_data.items() if key not in DEBUG_FIELDS}
+
+# Short resume used to exercise the parsing heuristics during warm-up
+WARM_UP_TEXT = """Jane Doe
+jane.doe@example.com | (555) 123-4567 | linkedin.com/in/janedoe
+
+SUMMARY
+Data analyst with experience in SQL and Python.
+
+EXPERIENCE
+Data Analyst, Example Corp
+Jan 2022 - Present
+- Built dashboards in Tableau
+
+EDUCATION
+B.S. in Statistics, Example University, 2021
+
+SKILLS
+Python, SQL, Tableau
+"""
+
+def warm_up() -> Dict[str, bool]:
+    """
+    Load every parser, model and corpus ahead of the first parse.
+    
+    Runs the text-level heuristics once over a short sample so that their
+    regular expressions are compiled and cached. A pre-fork server calls this
+    in the master process, so the loaded state is shared copy-on-write by its
+    workers.
+    
+    Returns:
+        Dictionary mapping each component to whether it loaded
+    """
+    status = {}
+    
+    try:
+        from resume_parser import parser
+        status['spacy'] = parser.get_nlp() is not None
+        sections = parser.identify_sections(parser.normalize_text(WARM_UP_TEXT))
+        parser.extract_contact_info(sections.get('other', '') or WARM_UP_TEXT)
+        parser.parse_experience_section(sections.get('experience', ''))
+        parser.parse_education_section(sections.get('education', ''))
+        parser.parse_skills_section(sections.get('skills', ''))
+        status['parser'] = True
+    except Exception as e:
+        logger.warning(f"Parser warm-up failed: {e}")
+        status.setdefault('spacy', False)
+        status['parser'] = False
+    
+    try:
+        from resume_parser import enhanced_parser
+        enhanced_parser.identify_sections(WARM_UP_TEXT)
+        enhanced_parser.extract_contact_info(WARM_UP_TEXT)
+        enhanced_parser.extract_experiences(WARM_UP_TEXT)
+        status['enhanced_parser'] = True
+    except Exception as e:
+        logger.warning(f"Enhanced parser warm-up failed: {e}")
+        status['enhanced_parser'] = False
+    
+    try:
+        from resume_parser import docx_parser  # noqa: F401
+        status['docx_parser'] = True
+    except Exception as e:
+        logger.warning(f"DOCX parser warm-up failed: {e}")
+        status['docx_parser'] = False
+    
+    try:
+        from resume_parser import relevance_matcher
+        relevance_matcher.preprocess_text(WARM_UP_TEXT)
+        status['nltk'] = True
+    except Exception as e:
+        logger.warning(f"NLTK warm-up failed: {e}")
+        status['nltk'] = False
+    
+    get_parser_version()
+    return status
@@ -6,33 +6,30 @@ This module provides functions for extracting structured data from resume PDFs.
 
 import os
 import re
-import spacy
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from pdfminer.high_level import extract_text
 from pdfminer.layout import LAParams
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
 
 # Initialize logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except Exception as e:
-    logger.error(f"Error loading spaCy model: {e}")
-    nlp = None
-
-# Download NLTK resources if needed
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+@lru_cache(maxsize=None)
+def get_nlp():
+    """
+    Load the spaCy model on first use.
+    
+    Returns:
+        The ``en_core_web_sm`` pipeline, or None if spaCy or the model is unavailable
+    """
+    try:
+        import spacy
+        return spacy.load("en_core_web_sm")
+    except Exception as e:
+        logger.error(f"Error loading spaCy model: {e}")
+        return None
 
 # Common section headers in resumes
 SECTION_HEADERS = {
@@ -278,6 +275,7 @@ def extract_contact_info(text: str) -> Dict[str, str]:
         contact_info['github'] = github_matches[0]
     
     # Try to extract name using NLP if spaCy is available
+    nlp = get_nlp()
     if nlp:
         lines = text.split('\n')
         for line in lines[:3]:  # Usually name is in the first few lines
@@ -720,18 +718,21 @@ def extract_certifications(certifications_text: str) -> List[Dict[str, str]]:
     
     return certifications
 
-def parse_resume_pdf(pdf_path: str) -> Dict[str, Any]:
+def parse_resume_pdf(pdf_path: str, progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Main function to parse a resume PDF into structured data.
     
     Args:
         pdf_path: Path to the resume PDF file
+        progress: Optional callback called with the name of each parsing stage
         
     Returns:
         Dictionary containing structured resume data
     """
     try:
         # Extract text from PDF
+        if progress:
+            progress('extracting')
         raw_text = extract_text_from_pdf(pdf_path)
         if not raw_text:
             logger.error(f"Failed to extract text from {pdf_path}")
@@ -741,6 +742,8 @@ def parse_resume_pdf(pdf_path: str) -> Dict[str, Any]:
         normalized_text = normalize_text(raw_text)
         
         # Identify sections in the resume
+        if progress:
+            progress('sectioning')
         sections = identify_sections(normalized_text)
         
         # Extract contact information (typically from the header section)
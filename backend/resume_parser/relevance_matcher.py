@@ -8,25 +8,33 @@ to determine relevance scores and optimize content selection.
 
 import re
 import math
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 
-# Download required NLTK resources
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-
-# Initialize NLTK components
-stop_words = set(stopwords.words('english'))
-lemmatizer = WordNetLemmatizer()
+@lru_cache(maxsize=None)
+def get_nltk_components() -> Tuple[Any, set, Any]:
+    """
+    Load NLTK on first use, downloading missing resources.
+    
+    Returns:
+        Tuple of (word_tokenize function, English stop words, WordNet lemmatizer)
+    """
+    import nltk
+    from nltk.tokenize import word_tokenize
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+    
+    # Download required NLTK resources
+    try:
+        nltk.data.find('tokenizers/punkt')
+        nltk.data.find('corpora/stopwords')
+        nltk.data.find('corpora/wordnet')
+    except LookupError:
+        nltk.download('punkt')
+        nltk.download('stopwords')
+        nltk.download('wordnet')
+    
+    return word_tokenize, set(stopwords.words('english')), WordNetLemmatizer()
 
 def preprocess_text(text: str) -> List[str]:
     """
@@ -46,6 +54,7 @@ def preprocess_text(text: str) -> List[str]:
     text = re.sub(r'\d+', ' ', text)
     
     # Tokenize
+    word_tokenize, stop_words, lemmatizer = get_nltk_components()
     tokens = word_tokenize(text)
     
     # Remove stopwords and lemmatize
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Background Resume Re-parse
+
+This module upgrades stored parse results that were produced by an older
+version of the parser heuristics.
+
+Stale results are re-parsed in bulk in a low-priority process pool, at a
+limited rate, so the job only uses otherwise idle cores. Reads keep being
+served the old result until the new one has been stored; only then are the
+older versions deleted.
+"""
+
+import os
+import time
+import argparse
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Dict, Any, Optional, Tuple
+
+from resume_parser.interface import get_parser_version, parse_resume_file
+from resume_parser.store import ParsedResumeStore, get_store
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _lower_priority() -> None:
+    """Run worker processes at low CPU priority so they only use idle cores."""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+def _reparse_file(file_path: str) -> Dict[str, Any]:
+    """Parse one file in a worker process."""
+    resume_data, _ = parse_resume_file(file_path)
+    return resume_data
+
+class ReparseJob:
+    """
+    Re-parse stale results in the parsed resume store.
+
+    Args:
+        store: Store to upgrade (defaults to the shared store)
+        workers: Number of worker processes (defaults to all but one core)
+        max_per_minute: Maximum number of files submitted per minute
+        batch_size: Number of stale entries fetched from the store at a time
+    """
+
+    def __init__(self, store: Optional[ParsedResumeStore] = None, workers: Optional[int] = None,
+                 max_per_minute: int = 60, batch_size: int = 50):
+        self.store = store or get_store()
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.min_interval = 60.0 / max(1, max_per_minute)
+        self.batch_size = batch_size
+        self.parser_version = get_parser_version()
+        self.upgraded = 0
+        self.failed = 0
+        self._skipped = set()
+        self._stop = threading.Event()
+
+    def _finish(self, future: Future, entry: Dict[str, Any]) -> None:
+        content_hash = entry['content_hash']
+        try:
+            resume_data = future.result()
+        except Exception as e:
+            resume_data = {'error': str(e)}
+
+        if 'error' in resume_data:
+            logger.warning(f"Re-parse of {entry['source_path']} failed: {resume_data['error']}")
+            self._skipped.add(content_hash)
+            self.failed += 1
+            return
+
+        # Store the new version before deleting the old one so reads never miss
+        self.store.save(resume_data, content_hash, self.parser_version, entry['source_path'])
+        self.store.prune_versions(content_hash, self.parser_version)
+        self.upgraded += 1
+
+    def run(self) -> Tuple[int, int]:
+        """
+        Upgrade stale results until none are left or the job is stopped.
+
+        Returns:
+            Tuple of (results upgraded, results that could not be re-parsed)
+        """
+        logger.info(f"Re-parsing stale results to parser version {self.parser_version}")
+        in_flight: Dict[Future, Dict[str, Any]] = {}
+        last_submit = 0.0
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_lower_priority) as executor:
+            while not self._stop.is_set():
+                busy = self._skipped | {entry['content_hash'] for entry in in_flight.values()}
+                batch = [
+                    entry for entry in self.store.stale_entries(
+                        self.parser_version, self.batch_size + len(busy))
+                    if entry['content_hash'] not in busy
+                ]
+                if not batch and not in_flight:
+                    break
+
+                for entry in batch:
+                    if self._stop.is_set():
+                        break
+                    source_path = entry['source_path']
+                    if not source_path or not os.path.exists(source_path):
+                        self._skipped.add(entry['content_hash'])
+                        continue
+
+                    # Rate limit submissions and keep at most one task per worker queued
+                    while len(in_flight) >= self.workers and not self._stop.is_set():
+                        done = next((f for f in in_flight if f.done()), None)
+                        if done is None:
+                            time.sleep(0.05)
+                            continue
+                        self._finish(done, in_flight.pop(done))
+                    wait = last_submit + self.min_interval - time.monotonic()
+                    if wait > 0 and self._stop.wait(wait):
+                        break
+
+                    in_flight[executor.submit(_reparse_file, source_path)] = entry
+                    last_submit = time.monotonic()
+
+                for future in [f for f in in_flight if f.done()]:
+                    self._finish(future, in_flight.pop(future))
+                if in_flight and not batch:
+                    time.sleep(0.05)
+
+            for future, entry in in_flight.items():
+                if not self._stop.is_set():
+                    self._finish(future, entry)
+
+        logger.info(f"Re-parse finished: {self.upgraded} upgraded, {self.failed} failed")
+        return self.upgraded, self.failed
+
+    def stop(self) -> None:
+        """Stop submitting work; results already in flight are discarded."""
+        self._stop.set()
+
+def start_background_reparse(**kwargs) -> ReparseJob:
+    """
+    Start a re-parse job in a daemon thread.
+
+    Args:
+        **kwargs: Arguments for ReparseJob
+
+    Returns:
+        The running job, which can be stopped with ``stop()``
+    """
+    job = ReparseJob(**kwargs)
+    thread = threading.Thread(target=job.run, name='resume-reparse', daemon=True)
+    thread.start()
+    return job
+
+def main():
+    """Main entry point for a one-off re-parse run."""
+    parser = argparse.ArgumentParser(description='Re-parse stored resumes produced by an older parser version.')
+    parser.add_argument('--workers', '-j', type=int, help='Number of worker processes')
+    parser.add_argument('--max-per-minute', type=int, default=60, help='Maximum files re-parsed per minute')
+    args = parser.parse_args()
+
+    upgraded, failed = ReparseJob(workers=args.workers, max_per_minute=args.max_per_minute).run()
+    print(f"Upgraded {upgraded} result(s), {failed} failed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Upload Retention and Garbage Collection
+
+This module removes uploaded resume files and their stored parse results once
+they fall outside the configured retention policy.
+
+Uploads are stored under hash-prefix shard directories (``ab/cd/abcd....pdf``).
+The collector works incrementally: each pass scans only a few shard
+directories and deletes at most a fixed number of files, so it can run in the
+background next to the web server no matter how many files are stored. It
+also moves files left in the old flat layout into their shards.
+
+Files are removed when:
+
+- their latest upload is older than the maximum age,
+- the total size of stored uploads exceeds the byte budget (least recently
+  uploaded first), or
+- nothing in the store references them any more (orphans, including leftover
+  temporary uploads), once they are older than a grace period.
+
+Legacy uploads and ``.json`` parse outputs left in the flat layout by older
+versions are only deleted when ``delete_legacy`` is enabled. The server
+imports their results into the store at startup, before collection starts
+(``resume_parser.interface.import_legacy_results``, also available as
+``flask import-parsed-resumes``).
+"""
+
+import os
+import re
+import time
+import argparse
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from resume_parser import file_handler
+from resume_parser.store import ParsedResumeStore, get_store
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Names of content-addressed files and of the shard directories holding them
+BLOB_NAME = re.compile(r'^[0-9a-f]{64}\.(' + '|'.join(file_handler.ALLOWED_EXTENSIONS) + r')$')
+SHARD_NAME = re.compile(r'^[0-9a-f]{2}$')
+
+def _env_number(name: str, cast=int):
+    value = os.environ.get(name)
+    return cast(value) if value not in (None, '') else None
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    return value.lower() not in ('0', 'false', 'no')
+
+class RetentionPolicy:
+    """
+    Rules for how long uploaded files are kept.
+
+    Args:
+        max_age_days: Delete files whose latest upload is older than this
+            (None keeps them regardless of age)
+        max_total_bytes: Delete the least recently uploaded files while the
+            total size of stored uploads exceeds this (None means no limit)
+        delete_orphans: Delete files that nothing in the store references
+        orphan_grace_seconds: Minimum age of a file before it counts as an
+            orphan, so uploads that are still being processed are left alone
+        delete_legacy: Also treat unreferenced uploads and ``.json`` outputs
+            in the old flat layout as orphans
+    """
+
+    def __init__(self, max_age_days: Optional[float] = None, max_total_bytes: Optional[int] = None,
+                 delete_orphans: bool = True, orphan_grace_seconds: float = 24 * 3600,
+                 delete_legacy: bool = False):
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self.delete_orphans = delete_orphans
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self.delete_legacy = delete_legacy
+
+    @classmethod
+    def from_env(cls) -> 'RetentionPolicy':
+        """
+        Build a policy from the UPLOAD_MAX_AGE_DAYS, UPLOAD_MAX_TOTAL_BYTES,
+        UPLOAD_DELETE_ORPHANS, UPLOAD_ORPHAN_GRACE_SECONDS and
+        UPLOAD_DELETE_LEGACY environment variables.
+        """
+        grace = _env_number('UPLOAD_ORPHAN_GRACE_SECONDS', float)
+        return cls(
+            max_age_days=_env_number('UPLOAD_MAX_AGE_DAYS', float),
+            max_total_bytes=_env_number('UPLOAD_MAX_TOTAL_BYTES'),
+            delete_orphans=_env_flag('UPLOAD_DELETE_ORPHANS', True),
+            orphan_grace_seconds=grace if grace is not None else 24 * 3600,
+            delete_legacy=_env_flag('UPLOAD_DELETE_LEGACY', False)
+        )
+
+class UploadGarbageCollector:
+    """
+    Apply a retention policy to the upload directory, a little at a time.
+
+    Args:
+        store: Store recording uploads and results (defaults to the shared store)
+        upload_dir: Root of the upload storage (defaults to UPLOAD_DIR)
+        policy: Retention policy (defaults to RetentionPolicy.from_env())
+        shards_per_pass: Number of directories scanned for orphans per pass
+        batch_size: Number of store rows fetched at a time
+    """
+
+    def __init__(self, store: Optional[ParsedResumeStore] = None, upload_dir: Optional[str] = None,
+                 policy: Optional[RetentionPolicy] = None, shards_per_pass: int = 8, batch_size: int = 100):
+        self.store = store or get_store()
+        self.upload_dir = os.path.abspath(upload_dir or file_handler.UPLOAD_DIR)
+        self.policy = policy or RetentionPolicy.from_env()
+        self.shards_per_pass = shards_per_pass
+        self.batch_size = batch_size
+        self._shard_cursor = 0
+        self._upload_cursor = 0
+        self._stop = threading.Event()
+
+    def _owns(self, path: str) -> bool:
+        """Whether a path lies inside the upload directory (results may point elsewhere)."""
+        return os.path.abspath(path).startswith(self.upload_dir + os.sep)
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _remove_owned(self, path: str) -> None:
+        if self._owns(path):
+            self._remove(path)
+
+    def _delete_content(self, content_hash: str, up_to_id: Optional[int] = None) -> bool:
+        """
+        Delete a file's store rows and the files it owns.
+
+        Only upload rows up to ``up_to_id`` (the newest one the caller looked
+        at) are deleted, so content uploaded again since is kept. Files are
+        removed inside the store's write transaction, which an upload of the
+        same content waits for before it stores the file again.
+
+        Returns:
+            Whether the content was deleted
+        """
+        return bool(self.store.delete_content(content_hash, up_to_id, remove=self._remove_owned))
+
+    def migrate_flat_layout(self, limit: int) -> int:
+        """
+        Move content-addressed files from the top of the upload directory into shards.
+
+        Args:
+            limit: Maximum number of files to move
+
+        Returns:
+            Number of files moved
+        """
+        moved = 0
+        with os.scandir(self.upload_dir) as entries:
+            for entry in entries:
+                if moved >= limit:
+                    break
+                if not (entry.is_file() and BLOB_NAME.match(entry.name)):
+                    continue
+                content_hash, extension = entry.name.split('.', 1)
+                new_path = file_handler.get_blob_path(content_hash, extension, self.upload_dir)
+                os.makedirs(os.path.dirname(new_path), exist_ok=True)
+                os.replace(entry.path, new_path)
+                self.store.relocate(entry.path, new_path)
+                moved += 1
+        return moved
+
+    def collect_expired(self, limit: int) -> int:
+        """Delete up to ``limit`` files whose latest upload is older than the maximum age."""
+        if self.policy.max_age_days is None or limit <= 0:
+            return 0
+        cutoff = time.strftime('%Y-%m-%d %H:%M:%S',
+                               time.gmtime(time.time() - self.policy.max_age_days * 86400))
+        expired = self.store.uploads_by_age(limit, uploaded_before=cutoff)
+        return sum(self._delete_content(entry['content_hash'], entry['last_upload_id']) for entry in expired)
+
+    def collect_over_quota(self, limit: int) -> int:
+        """Delete up to ``limit`` of the least recently uploaded files while over the byte budget."""
+        if self.policy.max_total_bytes is None:
+            return 0
+        deleted = 0
+        _, total = self.store.upload_totals()
+        while total > self.policy.max_total_bytes and deleted < limit:
+            oldest = self.store.uploads_by_age(min(self.batch_size, limit - deleted))
+            progress = deleted
+            for entry in oldest:
+                if total <= self.policy.max_total_bytes:
+                    break
+                if self._delete_content(entry['content_hash'], entry['last_upload_id']):
+                    total -= entry['size'] or 0
+                    deleted += 1
+            # Stop when everything listed was uploaded again in the meantime
+            if deleted == progress:
+                break
+        return deleted
+
+    def collect_missing(self, limit: int) -> int:
+        """
+        Drop store rows for uploads whose file no longer exists.
+
+        Checks one batch of upload rows per call, resuming where the last call
+        stopped. Rows younger than the orphan grace period are left alone, since
+        an upload is recorded just before its file is moved into place.
+        """
+        rows = self.store.uploads_after(self._upload_cursor, self.batch_size)
+        if not rows:
+            self._upload_cursor = 0
+            return 0
+        self._upload_cursor = rows[-1]['id']
+        cutoff = time.strftime('%Y-%m-%d %H:%M:%S',
+                               time.gmtime(time.time() - self.policy.orphan_grace_seconds))
+        missing: Dict[str, int] = {}
+        for row in rows:
+            if row['uploaded_at'] < cutoff and not os.path.exists(row['blob_path']):
+                missing[row['content_hash']] = row['id']
+        return sum(self._delete_content(content_hash, up_to_id)
+                   for content_hash, up_to_id in list(missing.items())[:limit])
+
+    def _next_directories(self) -> List[str]:
+        """Pick the directories to scan for orphans this pass, round-robin."""
+        shards = sorted(name for name in os.listdir(self.upload_dir)
+                        if SHARD_NAME.match(name) and os.path.isdir(os.path.join(self.upload_dir, name)))
+        # The top of the upload directory holds temporary and legacy files
+        directories = [self.upload_dir] + [os.path.join(self.upload_dir, name) for name in shards]
+        selected = directories[self._shard_cursor:self._shard_cursor + self.shards_per_pass]
+        self._shard_cursor += len(selected)
+        if self._shard_cursor >= len(directories):
+            self._shard_cursor = 0
+        return selected
+
+    def _scan(self, directory: str, cutoff: float) -> List[str]:
+        """List files in a directory (and its shards below it) older than ``cutoff``."""
+        found = []
+        recurse = directory != self.upload_dir
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recurse:
+                        found.extend(self._scan(entry.path, cutoff))
+                elif entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    found.append(entry.path)
+        return found
+
+    def collect_orphans(self, limit: int) -> int:
+        """Delete up to ``limit`` unreferenced files from the next few directories."""
+        if not self.policy.delete_orphans or limit <= 0:
+            return 0
+        cutoff = time.time() - self.policy.orphan_grace_seconds
+        candidates = []
+        for directory in self._next_directories():
+            candidates.extend(self._scan(directory, cutoff))
+
+        # A .json parse output is kept while its sibling upload is referenced
+        siblings = {
+            path: [f"{os.path.splitext(path)[0]}.{ext}" for ext in file_handler.ALLOWED_EXTENSIONS]
+            for path in candidates if path.endswith('.json')
+        }
+        referenced = self.store.referenced_paths(
+            [path for path in candidates if path not in siblings]
+            + [sibling for paths in siblings.values() for sibling in paths]
+        )
+
+        deleted = 0
+        for path in candidates:
+            if deleted >= limit:
+                break
+            if os.path.basename(path).startswith('.upload-'):
+                orphan = True
+            elif os.path.dirname(path) == self.upload_dir and not self.policy.delete_legacy:
+                orphan = False
+            elif path in siblings:
+                orphan = not referenced.intersection(siblings[path])
+            else:
+                orphan = path not in referenced
+            if orphan and self._remove(path):
+                deleted += 1
+        return deleted
+
+    def run_pass(self, max_deletions: int = 500) -> Dict[str, int]:
+        """
+        Run one bounded garbage collection pass.
+
+        Args:
+            max_deletions: Maximum number of files deleted in this pass
+
+        Returns:
+            Dictionary with the number of files migrated, expired, over_quota,
+            missing and orphaned
+        """
+        stats = {'migrated': self.migrate_flat_layout(self.batch_size)}
+        remaining = max_deletions
+        for name, step in (('expired', self.collect_expired), ('over_quota', self.collect_over_quota),
+                           ('missing', self.collect_missing), ('orphaned', self.collect_orphans)):
+            stats[name] = step(remaining)
+            remaining -= stats[name]
+        if any(stats.values()):
+            logger.info(f"Upload GC pass: {stats}")
+        return stats
+
+    def run_forever(self, interval_seconds: float = 600) -> None:
+        """Run a pass every ``interval_seconds`` until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.run_pass()
+            except Exception:
+                logger.exception("Upload GC pass failed")
+            self._stop.wait(interval_seconds)
+
+    def stop(self) -> None:
+        """Stop running passes after the current one."""
+        self._stop.set()
+
+def start_background_gc(interval_seconds: Optional[float] = None, **kwargs) -> UploadGarbageCollector:
+    """
+    Start upload garbage collection in a daemon thread.
+
+    Args:
+        interval_seconds: Seconds between passes (defaults to UPLOAD_GC_INTERVAL_SECONDS or 600)
+        **kwargs: Arguments for UploadGarbageCollector
+
+    Returns:
+        The running collector, which can be stopped with ``stop()``
+    """
+    if interval_seconds is None:
+        interval_seconds = _env_number('UPLOAD_GC_INTERVAL_SECONDS', float) or 600
+    collector = UploadGarbageCollector(**kwargs)
+    thread = threading.Thread(target=collector.run_forever, args=(interval_seconds,),
+                              name='upload-gc', daemon=True)
+    thread.start()
+    return collector
+
+def main():
+    """Main entry point for a one-off garbage collection run."""
+    parser = argparse.ArgumentParser(description='Apply the upload retention policy.')
+    parser.add_argument('--max-deletions', type=int, default=500, help='Maximum files deleted per pass')
+    parser.add_argument('--all', action='store_true', help='Keep running passes until nothing is left to do')
+    args = parser.parse_args()
+
+    collector = UploadGarbageCollector()
+    totals: Dict[str, int] = {}
+    while True:
+        stats = collector.run_pass(args.max_deletions)
+        for name, count in stats.items():
+            totals[name] = totals.get(name, 0) + count
+        # A full sweep has visited every directory once the shard cursor wraps
+        if not args.all or (not any(stats.values()) and collector._shard_cursor == 0):
+            break
+    print(', '.join(f"{name}: {count}" for name, count in totals.items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+JSON Serialization
+
+This module provides the JSON encoder used for HTTP responses and stored
+parse results.
+
+orjson is used when it is installed, since it encodes large payloads several
+times faster than the standard library; otherwise the standard ``json``
+module is used. Set ``JSON_SERIALIZER=json`` to force the standard library.
+Both produce compact JSON as UTF-8 bytes and encode dates, datetimes and
+sets the same way.
+
+``iter_json_array`` and ``iter_ndjson`` encode an iterable of items as a
+stream of chunks, for responses too large to build in memory.
+"""
+
+import os
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Encode types that JSON has no representation for."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _use_orjson() -> bool:
+    return orjson is not None and os.environ.get('JSON_SERIALIZER', 'orjson').lower() != 'json'
+
+# Name of the encoder in use, reported by benchmarks
+BACKEND = 'orjson' if _use_orjson() else 'json'
+
+if BACKEND == 'orjson':
+    def dumps(obj: Any, pretty: bool = False) -> bytes:
+        """
+        Serialize an object to JSON.
+
+        Args:
+            obj: Object to serialize
+            pretty: Indent the output by two spaces
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or a string."""
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any, pretty: bool = False) -> bytes:
+        """
+        Serialize an object to JSON.
+
+        Args:
+            obj: Object to serialize
+            pretty: Indent the output by two spaces
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if pretty:
+            text = json.dumps(obj, default=_default, indent=2)
+        else:
+            # ASCII output keeps the C encoder's fast path
+            text = json.dumps(obj, default=_default, separators=(',', ':'))
+        return text.encode('utf-8')
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or a string."""
+        return json.loads(data)
+
+# Items encoded into each chunk of a streamed response
+STREAM_CHUNK_ITEMS = 200
+
+def iter_json_array(items: Iterable[Any], chunk_items: int = STREAM_CHUNK_ITEMS) -> Iterator[bytes]:
+    """
+    Encode items as one JSON array, yielded in chunks.
+
+    Args:
+        items: Items to encode, consumed lazily
+        chunk_items: Number of items per chunk
+
+    Returns:
+        Iterator of UTF-8 chunks that concatenate to the array
+    """
+    yield b'['
+    chunk = []
+    separator = b''
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) >= chunk_items:
+            yield separator + b','.join(chunk)
+            separator = b','
+            chunk = []
+    if chunk:
+        yield separator + b','.join(chunk)
+    yield b']'
+
+def iter_ndjson(items: Iterable[Any], chunk_items: int = STREAM_CHUNK_ITEMS) -> Iterator[bytes]:
+    """
+    Encode items as newline-delimited JSON, yielded in chunks.
+
+    Args:
+        items: Items to encode, consumed lazily
+        chunk_items: Number of items per chunk
+
+    Returns:
+        Iterator of UTF-8 chunks, one JSON document per line
+    """
+    chunk = []
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) >= chunk_items:
+            yield b'\n'.join(chunk) + b'\n'
+            chunk = []
+    if chunk:
+        yield b'\n'.join(chunk) + b'\n'
@@ -0,0 +1,492 @@
+"""
+Parsed Resume Store
+
+This module provides a SQLite-backed store for parsed resume data.
+
+Results are keyed by the SHA-256 hash of the uploaded file and the version of
+the parser that produced them, stored as compact JSON, and indexed by contact
+email and name. An in-process LRU cache sits in front of the table so repeated
+lookups of the same resume do not touch the database or re-decode JSON.
+
+The store also records one metadata row per upload, pointing at the
+content-addressed file the upload was stored as. The upload garbage collector
+uses those rows to decide which stored files are still referenced.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from resume_parser.serialization import dumps, loads
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Default location of the store database
+DEFAULT_STORE_PATH = os.environ.get(
+    'RESUME_STORE_PATH',
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'parsed_resumes.db'))
+)
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS parsed_resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content_hash TEXT NOT NULL,
+        parser_version TEXT NOT NULL,
+        source_path TEXT,
+        email TEXT,
+        name TEXT,
+        data TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (content_hash, parser_version)
+    );
+    CREATE INDEX IF NOT EXISTS idx_parsed_resumes_email ON parsed_resumes (email);
+    CREATE INDEX IF NOT EXISTS idx_parsed_resumes_name ON parsed_resumes (name);
+    CREATE TABLE IF NOT EXISTS resume_uploads (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content_hash TEXT NOT NULL,
+        blob_path TEXT NOT NULL,
+        original_filename TEXT,
+        user_id TEXT,
+        size INTEGER,
+        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_resume_uploads_hash ON resume_uploads (content_hash);
+    CREATE INDEX IF NOT EXISTS idx_resume_uploads_blob_path ON resume_uploads (blob_path);
+    CREATE INDEX IF NOT EXISTS idx_parsed_resumes_source_path ON parsed_resumes (source_path);
+'''
+
+def _normalize(value: Optional[str]) -> Optional[str]:
+    """Normalize an email or name for indexed lookup."""
+    if not value or not isinstance(value, str):
+        return None
+    return ' '.join(value.split()).lower()
+
+class ParsedResumeStore:
+    """
+    SQLite table of parsed resumes with an LRU cache in front of it.
+
+    Cached results are shared between callers and must be treated as read-only.
+
+    Args:
+        db_path: Path to the SQLite database file
+        cache_size: Maximum number of parsed resumes kept in memory
+    """
+
+    def __init__(self, db_path: str = DEFAULT_STORE_PATH, cache_size: int = 256):
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.RLock()
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+        return data
+
+    def _cache_put(self, key: Tuple[str, str], data: Dict[str, Any]) -> None:
+        self._cache[key] = data
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def save(self, resume_data: Dict[str, Any], content_hash: str, parser_version: str,
+             source_path: Optional[str] = None) -> int:
+        """
+        Save a parse result, replacing any result for the same hash and version.
+
+        Args:
+            resume_data: Structured resume data
+            content_hash: SHA-256 hex digest of the source file
+            parser_version: Version of the parser that produced the data
+            source_path: Optional path of the source file
+
+        Returns:
+            Row id of the stored result
+        """
+        contact_info = resume_data.get('contact_info') or {}
+        data = dumps(resume_data).decode('utf-8')
+        with self._lock, self._conn:
+            self._conn.execute('''
+                INSERT INTO parsed_resumes (content_hash, parser_version, source_path, email, name, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (content_hash, parser_version) DO UPDATE SET
+                    source_path = COALESCE(excluded.source_path, source_path),
+                    email = excluded.email,
+                    name = excluded.name,
+                    data = excluded.data,
+                    created_at = CURRENT_TIMESTAMP
+            ''', (content_hash, parser_version, source_path,
+                  _normalize(contact_info.get('email')), _normalize(contact_info.get('name')), data))
+            row_id = self._conn.execute('''
+                SELECT id FROM parsed_resumes WHERE content_hash = ? AND parser_version = ?
+            ''', (content_hash, parser_version)).fetchone()['id']
+            self._cache_put((content_hash, parser_version), resume_data)
+        return row_id
+
+    def get(self, content_hash: str, parser_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the parse result for a file.
+
+        Args:
+            content_hash: SHA-256 hex digest of the source file
+            parser_version: Exact parser version to return; if omitted, the most
+                recently stored result for the hash is returned
+
+        Returns:
+            Structured resume data, or None if the file has not been parsed
+        """
+        with self._lock:
+            if parser_version is not None:
+                cached = self._cache_get((content_hash, parser_version))
+                if cached is not None:
+                    return cached
+                row = self._conn.execute('''
+                    SELECT parser_version, data FROM parsed_resumes
+                    WHERE content_hash = ? AND parser_version = ?
+                ''', (content_hash, parser_version)).fetchone()
+            else:
+                row = self._conn.execute('''
+                    SELECT parser_version, data FROM parsed_resumes
+                    WHERE content_hash = ?
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                ''', (content_hash,)).fetchone()
+                if row is not None:
+                    cached = self._cache_get((content_hash, row['parser_version']))
+                    if cached is not None:
+                        return cached
+
+            if row is None:
+                return None
+            data = loads(row['data'])
+            self._cache_put((content_hash, row['parser_version']), data)
+            return data
+
+    def _find(self, column: str, value: str, limit: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(f'''
+                SELECT content_hash, parser_version, source_path, created_at
+                FROM parsed_resumes
+                WHERE {column} = ?
+                ORDER BY id DESC LIMIT ?
+            ''', (_normalize(value), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def find_by_email(self, email: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find stored parses by contact email, newest first.
+
+        Returns:
+            List of dictionaries with content_hash, parser_version, source_path and created_at
+        """
+        return self._find('email', email, limit)
+
+    def find_by_name(self, name: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find stored parses by contact name (case and whitespace insensitive), newest first.
+
+        Returns:
+            List of dictionaries with content_hash, parser_version, source_path and created_at
+        """
+        return self._find('name', name, limit)
+
+    def latest_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent parse for a contact email.
+
+        Returns:
+            Structured resume data, or None if no resume with that email is stored
+        """
+        matches = self.find_by_email(email, limit=1)
+        if not matches:
+            return None
+        return self.get(matches[0]['content_hash'], matches[0]['parser_version'])
+
+    def record_upload(self, content_hash: str, blob_path: str, original_filename: Optional[str] = None,
+                      user_id: Optional[str] = None, size: Optional[int] = None) -> int:
+        """
+        Record an upload of a content-addressed file.
+
+        Args:
+            content_hash: SHA-256 hex digest of the uploaded file
+            blob_path: Path the file content is stored at
+            original_filename: Filename given by the client
+            user_id: Optional user ID the upload belongs to
+            size: Size of the file in bytes
+
+        Returns:
+            Row id of the upload
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute('''
+                INSERT INTO resume_uploads (content_hash, blob_path, original_filename, user_id, size)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (content_hash, blob_path, original_filename, user_id, size))
+        return cursor.lastrowid
+
+    def get_uploads(self, content_hash: str) -> List[Dict[str, Any]]:
+        """
+        Get every recorded upload of a file, oldest first.
+
+        Returns:
+            List of upload metadata dictionaries
+        """
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT * FROM resume_uploads WHERE content_hash = ? ORDER BY id
+            ''', (content_hash,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def stale_entries(self, parser_version: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Find files that have no result from the given parser version.
+
+        Args:
+            parser_version: Current parser version
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of dictionaries with content_hash and source_path of the newest stale result
+        """
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT content_hash, source_path, MAX(id) AS id
+                FROM parsed_resumes
+                GROUP BY content_hash
+                HAVING SUM(parser_version = ?) = 0
+                LIMIT ?
+            ''', (parser_version, limit)).fetchall()
+        return [{'content_hash': row['content_hash'], 'source_path': row['source_path']} for row in rows]
+
+    def prune_versions(self, content_hash: str, keep_version: str) -> int:
+        """
+        Delete results for a file from every parser version except one.
+
+        Args:
+            content_hash: SHA-256 hex digest of the source file
+            keep_version: Parser version whose result is kept
+
+        Returns:
+            Number of results deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute('''
+                DELETE FROM parsed_resumes WHERE content_hash = ? AND parser_version != ?
+            ''', (content_hash, keep_version))
+            for key in [key for key in self._cache if key[0] == content_hash and key[1] != keep_version]:
+                del self._cache[key]
+        return cursor.rowcount
+
+    def referenced_paths(self, paths: List[str]) -> set:
+        """
+        Find which of the given files are referenced by an upload or a stored result.
+
+        Args:
+            paths: File paths to check
+
+        Returns:
+            Set of the paths that are still referenced
+        """
+        referenced = set()
+        with self._lock:
+            # Stay well below SQLite's bound parameter limit
+            for start in range(0, len(paths), 400):
+                chunk = paths[start:start + 400]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(f'''
+                    SELECT blob_path AS path FROM resume_uploads WHERE blob_path IN ({placeholders})
+                    UNION
+                    SELECT source_path FROM parsed_resumes WHERE source_path IN ({placeholders})
+                ''', chunk + chunk).fetchall()
+                referenced.update(row['path'] for row in rows)
+        return referenced
+
+    def relocate(self, old_path: str, new_path: str) -> None:
+        """Point uploads and results stored at ``old_path`` at ``new_path``."""
+        with self._lock, self._conn:
+            self._conn.execute('UPDATE resume_uploads SET blob_path = ? WHERE blob_path = ?',
+                               (new_path, old_path))
+            self._conn.execute('UPDATE parsed_resumes SET source_path = ? WHERE source_path = ?',
+                               (new_path, old_path))
+
+    def upload_totals(self) -> Tuple[int, int]:
+        """
+        Get the number and total size of distinct uploaded files.
+
+        Returns:
+            Tuple of (number of distinct files, total bytes)
+        """
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT COUNT(*) AS files, COALESCE(SUM(size), 0) AS bytes FROM (
+                    SELECT MAX(size) AS size FROM resume_uploads GROUP BY content_hash
+                )
+            ''').fetchone()
+        return row['files'], row['bytes']
+
+    def uploads_by_age(self, limit: int = 100, uploaded_before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List distinct uploaded files, least recently uploaded first.
+
+        Args:
+            limit: Maximum number of files to return
+            uploaded_before: Only return files whose latest upload is older than
+                this ``YYYY-MM-DD HH:MM:SS`` UTC timestamp
+
+        Returns:
+            List of dictionaries with content_hash, size, last_uploaded_at and
+            last_upload_id
+        """
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT content_hash, MAX(size) AS size, MAX(uploaded_at) AS last_uploaded_at,
+                       MAX(id) AS last_upload_id
+                FROM resume_uploads
+                GROUP BY content_hash
+                HAVING ? IS NULL OR MAX(uploaded_at) < ?
+                ORDER BY last_uploaded_at, content_hash
+                LIMIT ?
+            ''', (uploaded_before, uploaded_before, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def uploads_after(self, after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Page through upload rows in id order.
+
+        Args:
+            after_id: Only return rows with a larger id
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of dictionaries with id, content_hash, blob_path and uploaded_at
+        """
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT id, content_hash, blob_path, uploaded_at FROM resume_uploads
+                WHERE id > ? ORDER BY id LIMIT ?
+            ''', (after_id, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def delete_content(self, content_hash: str, up_to_id: Optional[int] = None,
+                       remove: Optional[Callable[[str], Any]] = None) -> List[str]:
+        """
+        Delete the upload rows and stored results for a file.
+
+        With ``up_to_id``, only upload rows up to that id are deleted. If a
+        newer upload of the same content was recorded in the meantime, its row,
+        the results and the file stay. The check and the deletion run in one
+        write transaction.
+
+        The store does not touch the files itself. ``remove`` is called with
+        each path the deleted rows pointed at before the transaction commits,
+        so an upload of the same content recorded concurrently waits for the
+        removal and then stores its file again.
+
+        Args:
+            content_hash: SHA-256 hex digest of the file
+            up_to_id: Only delete upload rows with an id up to this one
+            remove: Called with each path to remove while the deletion is pending
+
+        Returns:
+            Distinct blob and source paths the deleted rows pointed at, or an
+            empty list if newer uploads kept the content
+        """
+        with self._lock, self._conn:
+            self._conn.execute('BEGIN IMMEDIATE')
+            rows = self._conn.execute('''
+                SELECT blob_path AS path FROM resume_uploads WHERE content_hash = ?
+                UNION
+                SELECT source_path FROM parsed_resumes WHERE content_hash = ? AND source_path IS NOT NULL
+            ''', (content_hash, content_hash)).fetchall()
+            if up_to_id is not None:
+                self._conn.execute('DELETE FROM resume_uploads WHERE content_hash = ? AND id <= ?',
+                                   (content_hash, up_to_id))
+                if self._conn.execute('SELECT 1 FROM resume_uploads WHERE content_hash = ? LIMIT 1',
+                                      (content_hash,)).fetchone():
+                    return []
+            self._conn.execute('DELETE FROM resume_uploads WHERE content_hash = ?', (content_hash,))
+            self._conn.execute('DELETE FROM parsed_resumes WHERE content_hash = ?', (content_hash,))
+            for key in [key for key in self._cache if key[0] == content_hash]:
+                del self._cache[key]
+            paths = [row['path'] for row in rows]
+            if remove is not None:
+                for path in paths:
+                    remove(path)
+        return paths
+
+    def import_json_files(self, directory: str, parser_version: str) -> int:
+        """
+        Import legacy per-upload JSON files saved next to their source files.
+
+        A ``<name>.json`` file is imported only if its sibling upload
+        (``<name>.pdf``, ``.docx`` or ``.doc``) still exists, since the store is
+        keyed by the upload's content hash. Uploads the store already has a
+        result for are left alone, so importing a directory again is harmless.
+
+        Args:
+            directory: Directory containing uploads and their JSON results
+            parser_version: Version to record for the imported results
+
+        Returns:
+            Number of results imported
+        """
+        # Imported here to keep the store free of file-handling dependencies
+        from resume_parser.file_handler import compute_file_hash, ALLOWED_EXTENSIONS
+
+        imported = 0
+        for name in sorted(os.listdir(directory)):
+            stem, ext = os.path.splitext(name)
+            if ext != '.json':
+                continue
+            for upload_ext in ALLOWED_EXTENSIONS:
+                source_path = os.path.join(directory, f"{stem}.{upload_ext}")
+                if os.path.exists(source_path):
+                    break
+            else:
+                continue
+            try:
+                with open(os.path.join(directory, name), 'r') as f:
+                    resume_data = json.load(f)
+                content_hash = compute_file_hash(source_path)
+                if self.get(content_hash) is not None:
+                    continue
+                self.save(resume_data, content_hash, parser_version, source_path)
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Skipping {name}: {e}")
+        return imported
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+_store: Optional[ParsedResumeStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> ParsedResumeStore:
+    """
+    Get the process-wide parsed resume store.
+
+    Returns:
+        Shared ParsedResumeStore at DEFAULT_STORE_PATH
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ParsedResumeStore()
+    return _store
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Resume Watch-Folder Ingestion
+
+This module provides a long-running ingestion mode that watches a directory
+for new or changed resume files, parses them in a worker pool and saves the
+structured results in the parsed resume store.
+
+On Linux the directory is watched with inotify; elsewhere (or if inotify is
+unavailable) it falls back to polling. Files are only parsed once they have
+stopped changing for a settle period, so partially written uploads are not
+picked up early. The time from a file first being seen to its parsed JSON
+being written is recorded and reported.
+"""
+
+import os
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import signal
+import struct
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from resume_parser.file_handler import allowed_file, compute_file_hash
+from resume_parser.interface import parse_resume_file, store_parsed_resume, get_parsed_resume
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# inotify constants (from <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+class InotifyWatcher:
+    """Watch a directory for file changes using Linux inotify."""
+
+    def __init__(self, directory: str):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f'inotify_add_watch failed for {directory}')
+
+    def read_events(self, timeout: float) -> Tuple[Set[str], bool]:
+        """
+        Wait up to ``timeout`` seconds for changes.
+
+        Returns:
+            Tuple of (names of changed files, whether the event queue overflowed)
+        """
+        names = set()
+        overflowed = False
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return names, overflowed
+
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    overflowed = True
+                elif name:
+                    names.add(os.fsdecode(name))
+        return names, overflowed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Watch a directory for file changes by periodically scanning it."""
+
+    def __init__(self, directory: str, interval: float = 1.0):
+        self.directory = directory
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def read_events(self, timeout: float) -> Tuple[Set[str], bool]:
+        """
+        Wait up to ``timeout`` seconds, then report files whose size or mtime changed.
+
+        Returns:
+            Tuple of (names of changed files, always False for overflow)
+        """
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        names = {name for name, sig in snapshot.items() if self._snapshot.get(name) != sig}
+        self._snapshot = snapshot
+        return names, False
+
+    def close(self) -> None:
+        """Nothing to release for polling."""
+
+def create_watcher(directory: str, use_inotify: bool = True, poll_interval: float = 1.0):
+    """
+    Create an inotify watcher for the directory, falling back to polling.
+
+    Args:
+        directory: Directory to watch
+        use_inotify: Whether to try inotify first
+        poll_interval: Scan interval for the polling fallback
+
+    Returns:
+        A watcher with ``read_events`` and ``close`` methods
+    """
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            watcher = InotifyWatcher(directory)
+            logger.info(f"Watching {directory} with inotify")
+            return watcher
+        except OSError as e:
+            logger.warning(f"inotify unavailable ({e}), falling back to polling")
+    logger.info(f"Watching {directory} by polling every {poll_interval}s")
+    return PollingWatcher(directory, poll_interval)
+
+class LatencyStats:
+    """Collect drop-to-JSON latencies and summarize them."""
+
+    def __init__(self):
+        self.samples: List[float] = []
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize recorded latencies.
+
+        Returns:
+            Dictionary with count, mean, p50, p95 and max latency in seconds
+        """
+        if not self.samples:
+            return {'count': 0}
+        ordered = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+        return {
+            'count': len(ordered),
+            'mean': sum(ordered) / len(ordered),
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'max': ordered[-1],
+        }
+
+def _parse_file(file_path: str) -> Dict[str, Any]:
+    """Parse one file in a worker process, with the same parsers as /parse-resume."""
+    return parse_resume_file(file_path)[0]
+
+class IngestionDaemon:
+    """
+    Watch a directory and incrementally parse resumes dropped into it.
+
+    Args:
+        watch_dir: Directory to watch for resume files
+        jobs: Number of worker processes used for parsing
+        settle_seconds: How long a file must stay unchanged before it is parsed
+        poll_interval: Scan interval when falling back to polling
+        use_inotify: Whether to try inotify before polling
+    """
+
+    def __init__(self, watch_dir: str, jobs: int = 2,
+                 settle_seconds: float = 2.0, poll_interval: float = 1.0,
+                 use_inotify: bool = True):
+        self.watch_dir = os.path.abspath(watch_dir)
+        self.jobs = max(1, jobs)
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.latency = LatencyStats()
+
+        # name -> (first seen, last change, (mtime_ns, size))
+        self._pending: Dict[str, Tuple[float, float, Optional[Tuple[int, int]]]] = {}
+        # name -> content hash of the last successfully parsed version
+        self._parsed_hashes: Dict[str, str] = {}
+        self._in_flight: Dict[Future, Tuple[str, str, float]] = {}
+        self._stopping = False
+        self._watcher = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _stat(self, name: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(os.path.join(self.watch_dir, name))
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def notice(self, names, now: Optional[float] = None) -> None:
+        """Record that the named files were created or changed."""
+        now = time.time() if now is None else now
+        for name in names:
+            if not allowed_file(name):
+                continue
+            first_seen = self._pending[name][0] if name in self._pending else now
+            self._pending[name] = (first_seen, now, self._stat(name))
+
+    def _ready_files(self, now: float) -> List[Tuple[str, float]]:
+        """Return pending files that have been stable for the settle period."""
+        ready = []
+        for name, (first_seen, last_change, signature) in list(self._pending.items()):
+            current = self._stat(name)
+            if current is None:
+                del self._pending[name]
+                continue
+            if current != signature:
+                # Still being written; restart the quiet period
+                self._pending[name] = (first_seen, now, current)
+                continue
+            if now - last_change >= self.settle_seconds and current[1] > 0:
+                del self._pending[name]
+                ready.append((name, first_seen))
+        return ready
+
+    def dispatch_ready(self, now: Optional[float] = None) -> int:
+        """
+        Submit settled files whose content changed to the worker pool.
+
+        Returns:
+            Number of files submitted
+        """
+        now = time.time() if now is None else now
+        submitted = 0
+        for name, first_seen in self._ready_files(now):
+            file_path = os.path.join(self.watch_dir, name)
+            try:
+                content_hash = compute_file_hash(file_path)
+            except OSError as e:
+                logger.warning(f"Could not read {file_path}: {e}")
+                continue
+            if self._parsed_hashes.get(name) == content_hash or get_parsed_resume(content_hash) is not None:
+                logger.debug(f"Skipping unchanged file: {file_path}")
+                self._parsed_hashes[name] = content_hash
+                continue
+            future = self._executor.submit(_parse_file, file_path)
+            self._in_flight[future] = (name, content_hash, first_seen)
+            submitted += 1
+        return submitted
+
+    def collect_results(self) -> int:
+        """
+        Save the results of finished parse jobs.
+
+        Returns:
+            Number of results collected
+        """
+        done = [future for future in self._in_flight if future.done()]
+        for future in done:
+            name, content_hash, first_seen = self._in_flight.pop(future)
+            try:
+                resume_data = future.result()
+            except Exception as e:
+                resume_data = {'error': str(e)}
+
+            if 'error' in resume_data:
+                logger.error(f"Error parsing {name}: {resume_data['error']}")
+                continue
+
+            file_path = os.path.join(self.watch_dir, name)
+            if store_parsed_resume(resume_data, content_hash, file_path):
+                self._parsed_hashes[name] = content_hash
+                latency = time.time() - first_seen
+                self.latency.add(latency)
+                logger.info(f"Ingested {name} in {latency:.2f}s")
+        return len(done)
+
+    def run(self) -> Dict[str, float]:
+        """
+        Watch the directory until stopped (SIGINT/SIGTERM).
+
+        Existing files in the directory are ingested on startup.
+
+        Returns:
+            Latency summary for the run
+        """
+        self._watcher = create_watcher(self.watch_dir, self.use_inotify, self.poll_interval)
+        self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: self.stop())
+
+        # Pick up anything that was dropped while we were not running
+        self.notice(entry.name for entry in os.scandir(self.watch_dir) if entry.is_file())
+
+        last_report = time.time()
+        try:
+            while not self._stopping:
+                names, overflowed = self._watcher.read_events(self.poll_interval)
+                if overflowed:
+                    logger.warning("Event queue overflowed, rescanning directory")
+                    names = {entry.name for entry in os.scandir(self.watch_dir) if entry.is_file()}
+                self.notice(names)
+                self.dispatch_ready()
+                self.collect_results()
+
+                if time.time() - last_report >= 60 and self.latency.samples:
+                    logger.info(f"Ingestion latency: {self.latency.summary()}")
+                    last_report = time.time()
+        finally:
+            self._executor.shutdown(wait=True)
+            self.collect_results()
+            self._watcher.close()
+
+        summary = self.latency.summary()
+        logger.info(f"Ingestion stopped. Latency: {summary}")
+        return summary
+
+    def stop(self) -> None:
+        """Ask the run loop to exit after the current iteration."""
+        self._stopping = True
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='Watch a folder and parse resumes dropped into it.')
+    parser.add_argument('watch_dir', help='Directory to watch for resume files')
+    parser.add_argument('--jobs', '-j', type=int, default=2, help='Number of worker processes')
+    parser.add_argument('--settle', type=float, default=2.0,
+                        help='Seconds a file must stay unchanged before it is parsed')
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='Polling interval in seconds')
+    parser.add_argument('--no-inotify', action='store_true', help='Always use polling')
+    return parser.parse_args()
+
+def main():
+    """Main entry point for the watch-folder daemon."""
+    args = parse_args()
+    daemon = IngestionDaemon(
+        args.watch_dir,
+        jobs=args.jobs,
+        settle_seconds=args.settle,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.no_inotify,
+    )
+    summary = daemon.run()
+    print(summary)
+
+if __name__ == "__main__":
+    main()
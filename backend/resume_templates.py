@@ -0,0 +1,116 @@
+"""
+Resume Templates
+
+This module keeps the resume templates used for tailoring in memory.
+
+Each template is read and prepared once, then served from memory. A cached
+template is revalidated with a single ``stat`` at most once per check
+interval, and reloaded when its mtime, size or inode changes, so edits to
+the file (including an editor replacing it with a new file) are picked up
+without a restart.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds a cached template is trusted before its file is stat()ed again
+CHECK_INTERVAL = float(os.environ.get('RESUME_TEMPLATE_CHECK_INTERVAL', 1.0))
+
+# Template used when a request does not name one
+DEFAULT_TEMPLATE = 'experience'
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Templates available for tailoring: name -> path
+RESUME_TEMPLATES = {
+    'experience': os.path.join(REPO_DIR, 'resume_experience_chunk.tex')
+}
+
+class TemplateStore:
+    """
+    In-memory cache of named template files.
+
+    Args:
+        paths: Template name -> file path
+        prepare: Turns a template's text into the value served from the
+                 cache; runs once per load (defaults to stripping whitespace)
+        check_interval: Seconds between checks of a cached template's file
+    """
+
+    def __init__(self, paths: Dict[str, str], prepare: Callable[[str], Any] = str.strip,
+                 check_interval: float = CHECK_INTERVAL):
+        self.paths = dict(paths)
+        self.prepare = prepare
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        # name -> (prepared template, file signature, time of the last check)
+        self._cache: Dict[str, Tuple[Any, Tuple[int, int, int], float]] = {}
+
+    @staticmethod
+    def _signature(path: str) -> Tuple[int, int, int]:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def get(self, name: str = DEFAULT_TEMPLATE) -> Any:
+        """
+        Get a prepared template, reloading it if its file changed.
+
+        Args:
+            name: Template name
+
+        Returns:
+            The prepared template
+
+        Raises:
+            KeyError: If no template has that name
+            FileNotFoundError: If the template file does not exist
+            OSError: If the template file cannot be read
+        """
+        path = self.paths[name]
+        now = time.monotonic()
+        cached = self._cache.get(name)
+        if cached is not None and now - cached[2] < self.check_interval:
+            return cached[0]
+
+        with self._lock:
+            cached = self._cache.get(name)
+            signature = self._signature(path)
+            if cached is not None and cached[1] == signature:
+                self._cache[name] = (cached[0], signature, now)
+                return cached[0]
+
+            with open(path, 'r', encoding='utf-8') as f:
+                prepared = self.prepare(f.read())
+            # Keep the signature from before the read: a write during it leaves a
+            # newer mtime behind, so the next check loads the file again
+            self._cache[name] = (prepared, signature, now)
+            logger.info(f"Loaded resume template '{name}' from {path}")
+            return prepared
+
+    def load_all(self) -> Dict[str, Optional[str]]:
+        """
+        Load every template, e.g. before forking workers.
+
+        Returns:
+            Template name -> None if loaded, or the error that prevented it
+        """
+        status = {}
+        for name in self.paths:
+            try:
+                self.get(name)
+                status[name] = None
+            except OSError as e:
+                status[name] = str(e)
+        return status
+
+    def clear(self) -> None:
+        """Forget every cached template."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Bulk Import Benchmark
+
+Imports the same jobs into a temporary jobs database through the Flask app:
+
+- ``save-job``: one POST /save-job (and one commit) per job
+- ``bulk``: one POST /jobs/bulk of the whole list as NDJSON
+- ``bulk again``: the same request repeated, which only updates
+
+Usage:
+    python benchmarks/bulk_import.py [--jobs N]
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+def make_jobs(count):
+    return [{
+        'title': f'Data Analyst {i}',
+        'company': f'Company {i % 97}',
+        'description': 'Analyze data, build dashboards and work with stakeholders. ' * 20,
+        'apply_link': f'https://www.linkedin.com/jobs/view/{1000000 + i}/?trk=export'
+    } for i in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark single and bulk job imports.')
+    parser.add_argument('--jobs', type=int, default=5000, help='Jobs to import')
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    body = '\n'.join(json.dumps(job) for job in jobs).encode('utf-8')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault('RESUME_STORE_PATH', os.path.join(tmp_dir, 'store.db'))
+        import app as backend_app
+        from database import ConnectionPool
+
+        print(f"{args.jobs} jobs")
+        print(f"{'mode':<12} {'seconds':>8} {'jobs/s':>9}")
+        for label, database_name, requests in (
+            ('save-job', 'single.db', [('/save-job', job) for job in jobs]),
+            ('bulk', 'bulk.db', [('/jobs/bulk', body)]),
+            ('bulk again', 'bulk.db', [('/jobs/bulk', body)])
+        ):
+            backend_app.db_pool = ConnectionPool(os.path.join(tmp_dir, database_name))
+            backend_app.init_db()
+            client = backend_app.app.test_client()
+            start = time.perf_counter()
+            for url, payload in requests:
+                if isinstance(payload, bytes):
+                    response = client.post(url, data=payload, content_type='application/x-ndjson')
+                else:
+                    response = client.post(url, json=payload)
+                assert response.status_code == 200, response.get_json()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<12} {elapsed:>8.2f} {args.jobs / elapsed:>9.0f}")
+            backend_app.db_pool.close_all()
+
+if __name__ == "__main__":
+    main()
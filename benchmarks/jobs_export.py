@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Job Export Benchmark
+
+Fetches every job, descriptions included, from GET /jobs of the Flask app
+against a temporary database, as:
+
+- ``buffered``: the listing built in memory and encoded in one piece
+- ``stream``: ``stream=1``, a JSON array encoded in chunks while rows are read
+- ``ndjson``: ``format=ndjson``, the same as newline-delimited JSON
+
+and reports the time to the first byte, the total time and the peak Python
+memory allocated while serving each response.
+
+Usage:
+    python benchmarks/jobs_export.py [--jobs N]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import tracemalloc
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+WORDS = ('data analyst python sql dashboards stakeholders experience team build pipelines '
+         'requirements communication cloud modeling reporting insights product growth').split()
+
+FIELDS = 'id,title,company,description,apply_link,status,saved_at,applied_at,has_tailored_resume'
+
+def seed(db_path, count):
+    """Fill the database with jobs carrying descriptions of typical posting length."""
+    import database
+    rng = random.Random(0)
+    conn = sqlite3.connect(db_path)
+    database.migrate(conn)
+    conn.executemany(
+        'INSERT INTO jobs (title, company, description, apply_link, saved_at) VALUES (?, ?, ?, ?, ?)',
+        ((f'Data Analyst {i}', f'Company {i % 97}', ' '.join(rng.choice(WORDS) for _ in range(rng.randint(150, 450))),
+          f'https://jobs.example.com/postings/{i}', f'2025-{1 + i % 12:02d}-{1 + i % 28:02d} 12:00:00')
+         for i in range(count))
+    )
+    conn.commit()
+    conn.close()
+
+def measure(client, url):
+    """Returns (seconds to first byte, total seconds, bytes, peak MiB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    first_byte = None
+    size = 0
+    for chunk in response.response:
+        if first_byte is None:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    response.close()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first_byte or total, total, size, peak / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark buffered and streamed job exports.')
+    parser.add_argument('--jobs', type=int, default=100_000, help='Jobs in the seeded database')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'jobs.db')
+        os.environ['JOBS_DB_PATH'] = db_path
+        os.environ.setdefault('RESUME_STORE_PATH', os.path.join(tmp_dir, 'store.db'))
+        seed(db_path, args.jobs)
+
+        import app as backend_app
+        client = backend_app.app.test_client()
+
+        print(f"{args.jobs} jobs")
+        print(f"{'mode':<10} {'first byte ms':>14} {'total s':>8} {'MiB sent':>9} {'peak MiB':>9}")
+        for mode, query in (('buffered', ''), ('stream', '&stream=1'), ('ndjson', '&format=ndjson')):
+            first_byte, total, size, peak = measure(client, f'/jobs?fields={FIELDS}{query}')
+            print(f"{mode:<10} {first_byte * 1000:>14.1f} {total:>8.2f} {size / (1024 * 1024):>9.1f} {peak:>9.1f}")
+        backend_app.db_pool.close_all()
+
+if __name__ == "__main__":
+    main()
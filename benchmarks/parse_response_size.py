@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+/parse-resume Response Size Benchmark
+
+Measures the serialized size of /parse-resume response bodies for stored parse
+results, comparing the full response (every field, including debug payloads)
+with the default compact response and the fields the extension asks for.
+
+Usage:
+    python benchmarks/parse_response_size.py [result.json ...]
+
+Without arguments, the legacy parse results in uploads/ are used.
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser.interface import project_resume_data
+
+# Fields requested by extension/popup/jobs.js
+EXTENSION_FIELDS = ['contact_info', 'summary', 'experiences', 'education', 'skills', 'research', 'certifications']
+
+def response_size(resume_data, **projection) -> int:
+    """Size in bytes of a compact /parse-resume response body for the given projection."""
+    body = {
+        'success': True,
+        'message': 'Resume parsed successfully',
+        'data': project_resume_data(resume_data, **projection)
+    }
+    return len(json.dumps(body, separators=(',', ':')).encode('utf-8'))
+
+def main():
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description='Measure /parse-resume response sizes.')
+    parser.add_argument('paths', nargs='*', help='Parse result JSON files (defaults to uploads/*.json)')
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(os.path.join(os.path.dirname(backend_dir), 'uploads', '*.json')))
+    if not paths:
+        print("No parse results found")
+        return
+
+    columns = ('full', 'compact', 'extension')
+    totals = dict.fromkeys(columns, 0)
+    print(f"{'file':<48} {'full':>9} {'compact':>9} {'extension':>10}")
+    for path in paths:
+        with open(path, 'r') as f:
+            resume_data = json.load(f)
+        sizes = {
+            'full': response_size(resume_data, include_debug=True),
+            'compact': response_size(resume_data),
+            'extension': response_size(resume_data, fields=EXTENSION_FIELDS)
+        }
+        for column in columns:
+            totals[column] += sizes[column]
+        print(f"{os.path.basename(path)[:48]:<48} {sizes['full']:>9} {sizes['compact']:>9} {sizes['extension']:>10}")
+
+    print(f"{'total':<48} {totals['full']:>9} {totals['compact']:>9} {totals['extension']:>10}")
+    for column in columns[1:]:
+        saved = 1 - totals[column] / totals['full']
+        print(f"{column}: {saved:.0%} smaller than full")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tailored Resume Storage Benchmark
+
+Builds a jobs database at schema version 7, where every tailored resume
+stores its full text, with several tailored resumes per job (most of them
+the same template, as ``tailor-resume`` saves today). It then runs what
+``flask compact-db`` does (migrate to the blob table, prune, VACUUM) and
+reports the database size before and after.
+
+Usage:
+    python benchmarks/resume_storage.py [--jobs N] [--per-job N] [--variants N]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+WORDS = ('data analyst python sql dashboards stakeholders experience team build pipelines '
+         'requirements communication cloud modeling reporting insights product growth').split()
+
+def make_template(rng):
+    """A LaTeX experience section of typical length (about 5 KB)."""
+    items = '\n'.join(f'  \\item {" ".join(rng.choice(WORDS) for _ in range(18))}.' for _ in range(40))
+    return f'\\section{{Experience}}\n\\begin{{itemize}}\n{items}\n\\end{{itemize}}'
+
+def seed(conn, jobs, per_job, variants):
+    """Fill a version 7 database with jobs and their tailored resumes."""
+    import database
+    rng = random.Random(0)
+    templates = [make_template(rng) for _ in range(variants)]
+    for version, step in database.MIGRATIONS[:7]:
+        step(conn)
+    conn.execute('PRAGMA user_version = 7')
+    conn.executemany('INSERT INTO jobs (title, company) VALUES (?, ?)',
+                     ((f'Data Analyst {i}', f'Company {i % 97}') for i in range(jobs)))
+    conn.executemany('INSERT INTO tailored_resumes (job_id, content) VALUES (?, ?)',
+                     ((1 + i // per_job, templates[i % variants]) for i in range(jobs * per_job)))
+    conn.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description='Report the jobs database size before and after blob storage.')
+    parser.add_argument('--jobs', type=int, default=2000, help='Jobs in the seeded database')
+    parser.add_argument('--per-job', type=int, default=3, help='Tailored resumes per job')
+    parser.add_argument('--variants', type=int, default=3, help='Distinct tailored resume texts')
+    args = parser.parse_args()
+
+    import database
+    from resume_parser.file_handler import describe_size
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        conn = sqlite3.connect(os.path.join(tmp_dir, 'jobs.db'))
+        seed(conn, args.jobs, args.per_job, args.variants)
+        before = database.database_size(conn)['total']
+
+        start = time.perf_counter()
+        database.migrate(conn)
+        database.prune_resume_blobs(conn)
+        conn.execute('VACUUM')
+        elapsed = time.perf_counter() - start
+        after = database.database_size(conn)['total']
+        blobs = conn.execute('SELECT COUNT(*) FROM resume_blobs').fetchone()[0]
+        conn.close()
+
+    print(f"{args.jobs * args.per_job} tailored resumes, {blobs} distinct bodies")
+    print(f"before: {describe_size(before)}")
+    print(f"after:  {describe_size(after)} ({after / before:.1%}) in {elapsed:.2f} s")
+
+if __name__ == "__main__":
+    main()
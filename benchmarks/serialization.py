@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Benchmark
+
+Compares the encoders available to resume_parser.serialization with the
+encoding Flask's ``jsonify`` performs, on payloads shaped like our real
+responses:
+
+- a /jobs listing of saved jobs carrying full descriptions
+- /parse-resume bodies built from the example parse results in uploads/
+
+Usage:
+    python benchmarks/serialization.py [--jobs N] [--repeat N]
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import random
+import argparse
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import serialization
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WORDS = ('data analyst python sql dashboards stakeholders experience team build pipelines '
+         'requirements communication cloud modeling reporting insights product growth').split()
+
+def make_jobs(count: int):
+    """Rows shaped like the /jobs response, with descriptions of typical posting length."""
+    rng = random.Random(0)
+    jobs = []
+    for job_id in range(1, count + 1):
+        description = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(300, 900)))
+        jobs.append({
+            'id': job_id,
+            'title': f'Data Analyst {job_id}',
+            'company': f'Company {job_id % 97}',
+            'description': description,
+            'apply_link': f'https://jobs.example.com/postings/{job_id}',
+            'status': rng.choice(['to_apply', 'applied', 'interviewing']),
+            'saved_at': '2025-04-11 12:00:00',
+            'applied_at': '',
+            'has_tailored_resume': job_id % 3 == 0
+        })
+    return jobs
+
+def load_parse_bodies():
+    """/parse-resume bodies for the example parse results."""
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(backend_dir), 'uploads', '*.json'))):
+        with open(path, 'r') as f:
+            bodies.append({'success': True, 'message': 'Resume parsed successfully', 'data': json.load(f)})
+    return bodies
+
+def jsonify_encode(obj) -> bytes:
+    """What Flask 2.0's jsonify does outside debug mode."""
+    return (json.dumps(obj, separators=(',', ':'), sort_keys=True) + '\n').encode('utf-8')
+
+def stdlib_encode(obj) -> bytes:
+    return json.dumps(obj, default=serialization._default, separators=(',', ':')).encode('utf-8')
+
+def orjson_encode(obj) -> bytes:
+    return orjson.dumps(obj, default=serialization._default, option=orjson.OPT_NON_STR_KEYS)
+
+def best_time(fn, payload, repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(payload)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark JSON encoders on realistic payloads.')
+    parser.add_argument('--jobs', type=int, default=2000, help='Number of saved jobs in the /jobs payload')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per encoder (best is reported)')
+    args = parser.parse_args()
+
+    encoders = [('jsonify', jsonify_encode), ('json', stdlib_encode)]
+    if orjson is not None:
+        encoders.append(('orjson', orjson_encode))
+    decoders = [('json', json.loads)] + ([('orjson', orjson.loads)] if orjson is not None else [])
+
+    payloads = [(f'/jobs ({args.jobs} rows)', make_jobs(args.jobs))]
+    parse_bodies = load_parse_bodies()
+    if parse_bodies:
+        payloads.append((f'/parse-resume x{len(parse_bodies)}', parse_bodies))
+
+    print(f"serialization backend in use: {serialization.BACKEND}")
+    for name, payload in payloads:
+        size = len(jsonify_encode(payload))
+        print(f"\n{name}: {size / 1024:.0f} KiB")
+        baseline = best_time(jsonify_encode, payload, args.repeat)
+        for encoder_name, encode in encoders:
+            elapsed = best_time(encode, payload, args.repeat)
+            print(f"  encode {encoder_name:<8} {elapsed:8.2f} ms  ({baseline / elapsed:4.1f}x jsonify)")
+        encoded = jsonify_encode(payload)
+        for decoder_name, decode in decoders:
+            print(f"  decode {decoder_name:<8} {best_time(decode, encoded, args.repeat):8.2f} ms")
+
+if __name__ == "__main__":
+    main()
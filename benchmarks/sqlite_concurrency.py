@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+SQLite Concurrency Benchmark
+
+Runs reader threads listing jobs (the /jobs query) alongside writer threads
+saving jobs (the /save-job insert) against a temporary jobs database, in two
+configurations:
+
+- ``connect``: a new connection per operation in the default rollback journal
+  mode, as app.get_db() used to do
+- ``pool``: the pooled WAL connections of database.ConnectionPool
+
+and reports throughput, read latency and how often an operation failed with
+"database is locked".
+
+Usage:
+    python benchmarks/sqlite_concurrency.py [--readers N] [--writers N] [--seconds S] [--jobs N]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from database import ConnectionPool
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        description TEXT,
+        apply_link TEXT,
+        status TEXT DEFAULT 'to_apply',
+        saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        applied_at TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS tailored_resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+'''
+
+LIST_JOBS = '''
+    SELECT j.*,
+           CASE WHEN tr.id IS NOT NULL THEN 1 ELSE 0 END as has_tailored_resume
+    FROM jobs j
+    LEFT JOIN (
+        SELECT DISTINCT job_id, MIN(id) as id
+        FROM tailored_resumes
+        GROUP BY job_id
+    ) tr ON j.id = tr.job_id
+    ORDER BY j.saved_at DESC
+'''
+
+SAVE_JOB = 'INSERT INTO jobs (title, company, description, apply_link) VALUES (?, ?, ?, ?)'
+
+DESCRIPTION = 'Analyze data, build dashboards and work with stakeholders. ' * 40
+
+def connect_per_operation(db_path):
+    """The old behaviour: open (and drop) a default-configured connection for each operation."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def seed(db_path, jobs):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    conn.executemany(SAVE_JOB, [(f'Job {i}', f'Company {i % 50}', DESCRIPTION, f'https://example.com/{i}')
+                                for i in range(jobs)])
+    conn.commit()
+    conn.close()
+
+def run(mode, db_path, readers, writers, seconds):
+    """Run the workload for `seconds`. Returns a dict of counters and read latencies."""
+    pool = ConnectionPool(db_path) if mode == 'pool' else None
+    stop = threading.Event()
+    lock = threading.Lock()
+    results = {'reads': 0, 'writes': 0, 'locked': 0, 'latencies': []}
+
+    def operation(write):
+        if pool is not None:
+            conn = pool.acquire()
+        else:
+            conn = connect_per_operation(db_path)
+        try:
+            if write:
+                with conn:
+                    conn.execute(SAVE_JOB, ('New job', 'Acme', DESCRIPTION, 'https://example.com/new'))
+            else:
+                conn.execute(LIST_JOBS).fetchall()
+        finally:
+            if pool is not None:
+                # One request per operation, as in the app
+                pool.release()
+            else:
+                conn.close()
+
+    def worker(write):
+        rng = random.Random()
+        reads, writes, locked, latencies = 0, 0, 0, []
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                operation(write)
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e):
+                    raise
+                locked += 1
+                continue
+            if write:
+                writes += 1
+                time.sleep(rng.uniform(0, 0.002))
+            else:
+                reads += 1
+                latencies.append(time.perf_counter() - start)
+        with lock:
+            results['reads'] += reads
+            results['writes'] += writes
+            results['locked'] += locked
+            results['latencies'].extend(latencies)
+
+    threads = [threading.Thread(target=worker, args=(False,)) for _ in range(readers)]
+    threads += [threading.Thread(target=worker, args=(True,)) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if pool is not None:
+        pool.close_all()
+    return results
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled WAL connections against per-operation connections.')
+    parser.add_argument('--readers', type=int, default=4, help='Reader threads')
+    parser.add_argument('--writers', type=int, default=2, help='Writer threads')
+    parser.add_argument('--seconds', type=float, default=3.0, help='Duration of each run')
+    parser.add_argument('--jobs', type=int, default=500, help='Jobs in the seeded database')
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.jobs} seeded jobs, {args.seconds:.0f}s per run")
+    print(f"{'mode':<8} {'reads/s':>9} {'writes/s':>9} {'p50 read ms':>12} {'p95 read ms':>12} {'locked':>7}")
+    for mode in ('connect', 'pool'):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'jobs.db')
+            seed(db_path, args.jobs)
+            results = run(mode, db_path, args.readers, args.writers, args.seconds)
+        latencies = results['latencies']
+        print(f"{mode:<8} {results['reads'] / args.seconds:>9.0f} {results['writes'] / args.seconds:>9.0f} "
+              f"{percentile(latencies, 0.5) * 1000:>12.2f} {percentile(latencies, 0.95) * 1000:>12.2f} "
+              f"{results['locked']:>7}")
+
+if __name__ == "__main__":
+    main()
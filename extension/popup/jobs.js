@@ -82,6 +82,9 @@ function setupResumeUpload() {
     });
 }
 
+// Parsed resume fields shown in the modal
+const PARSED_RESUME_FIELDS = 'contact_info,summary,experiences,education,skills,research,certifications';
+
 // Function to parse the resume by sending it to the backend
 async function parseResume(file) {
     const formData = new FormData();
@@ -90,7 +93,7 @@ async function parseResume(file) {
     console.log('Sending resume file to server:', file.name);
     
     try {
-        const response = await fetch('/parse-resume', {
+        const response = await fetch(`/parse-resume?fields=${PARSED_RESUME_FIELDS}`, {
             method: 'POST',
             body: formData
         });
@@ -251,15 +254,29 @@ function displayParsedResume(data) {
     modal.style.display = 'block';
 }
 
+// Jobs requested per page; later pages are appended as they arrive
+const JOBS_PAGE_SIZE = 50;
+
+async function fetchJobsPage(cursor) {
+    const params = new URLSearchParams({ limit: JOBS_PAGE_SIZE });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    const response = await fetch(`/jobs?${params}`);
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return {
+        jobs: await response.json(),
+        nextCursor: response.headers.get('X-Next-Cursor')
+    };
+}
+
 async function loadJobs() {
     try {
         console.log('Loading jobs...');
-        const response = await fetch('/jobs');
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const jobs = await response.json();
-        console.log('Jobs loaded:', jobs);
+        let page = await fetchJobsPage(null);
+        console.log('Jobs loaded:', page.jobs);
         
         const tableBody = document.getElementById('jobsTableBody');
         const noJobsDiv = document.getElementById('noJobs');
@@ -267,26 +284,22 @@ async function loadJobs() {
         // Clear existing content
         tableBody.innerHTML = '';
         
-        if (jobs.length === 0) {
+        if (page.jobs.length === 0) {
             console.log('No jobs found');
             noJobsDiv.classList.remove('hidden');
             return;
         }
         
         noJobsDiv.classList.add('hidden');
-        jobs.forEach(job => {
-            const row = createJobRow(job);
-            tableBody.appendChild(row);
-        });
-        
-        // Add event listeners for status selects
-        document.querySelectorAll('.status-select').forEach(select => {
-            select.addEventListener('change', handleStatusChange);
-            // Store the initial value for rollback
-            select.setAttribute('data-previous-value', select.value);
-        });
+        page.jobs.forEach(job => tableBody.appendChild(createJobRow(job)));
         
         await updateJobStats();
+        
+        // Show the first page right away, then append the rest
+        while (page.nextCursor) {
+            page = await fetchJobsPage(page.nextCursor);
+            page.jobs.forEach(job => tableBody.appendChild(createJobRow(job)));
+        }
         console.log('Jobs loaded successfully');
         
     } catch (error) {
@@ -362,6 +375,11 @@ function createJobRow(job) {
         <td>${resumeButton}</td>
     `;
 
+    const statusSelect = row.querySelector('.status-select');
+    statusSelect.addEventListener('change', handleStatusChange);
+    // Store the initial value for rollback
+    statusSelect.setAttribute('data-previous-value', statusSelect.value);
+
     // Add event listener for the resume button if it's not already tailored
     if (!safeJob.has_tailored_resume) {
         const button = row.querySelector('.resume-button');
@@ -413,13 +431,39 @@ async function handleStatusChange(event) {
     }
 }
 
+const TAILOR_POLL_INTERVAL_MS = 1000;
+// Give up polling a queued tailoring after this long
+const TAILOR_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
+// Poll a background tailoring task until it finishes; resolves with its result
+async function waitForTailoring(statusUrl) {
+    const deadline = Date.now() + TAILOR_POLL_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, TAILOR_POLL_INTERVAL_MS));
+        const response = await fetch(statusUrl);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const task = await response.json();
+        if (task.status === 'done') {
+            return task.result;
+        }
+        if (task.status === 'failed') {
+            throw new Error(task.error || 'Tailoring failed');
+        }
+    }
+    throw new Error('Timed out waiting for the tailored resume');
+}
+
 async function tailorResume(jobId) {
     try {
         const button = document.querySelector(`tr[data-job-id="${jobId}"] .resume-button`);
         button.disabled = true;
         button.textContent = 'Tailoring...';
         
-        const response = await fetch(`/jobs/${jobId}/tailor-resume`, {
+        // Queued on the server; the response is a handle to poll, which any
+        // server process can answer since task status is kept in the database
+        const response = await fetch(`/jobs/${jobId}/tailor-resume?async=1`, {
             method: 'POST'
         });
 
@@ -427,7 +471,8 @@ async function tailorResume(jobId) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
 
-        const data = await response.json();
+        const handle = await response.json();
+        const data = await waitForTailoring(handle.status_url);
         if (!data.job || !data.job.has_tailored_resume) {
             throw new Error('Resume was not created successfully');
         }
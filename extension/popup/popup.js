@@ -1,3 +1,7 @@
+// Saved jobs shown in the popup, and the fields its cards use
+const POPUP_JOBS_LIMIT = 20;
+const POPUP_JOB_FIELDS = 'id,title,company,description,apply_link,saved_at';
+
 document.addEventListener('DOMContentLoaded', async () => {
     const jobList = document.getElementById('jobList');
     
@@ -10,7 +14,8 @@ document.addEventListener('DOMContentLoaded', async () => {
     await updateDailyGoal();
     
     try {
-        const response = await fetch('/get-jobs');
+        // Only the latest jobs are shown here; "View All Jobs" lists the rest
+        const response = await fetch(`/get-jobs?limit=${POPUP_JOBS_LIMIT}&fields=${POPUP_JOB_FIELDS}`);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
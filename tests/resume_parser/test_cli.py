@@ -0,0 +1,113 @@
+"""
+Resume Parser CLI Tests
+
+Tests for the batch (directory, glob and JSONL) mode of the resume parser CLI.
+"""
+
+import os
+import sys
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root and backend directory to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'backend'))
+
+from backend.resume_parser import cli
+
+
+def fake_parse_resume(file_path):
+    """Stand-in for the real parser that echoes the file name."""
+    return {'contact_info': {'name': os.path.basename(file_path)}}
+
+
+class TestResumeParserCLI(unittest.TestCase):
+    """Test cases for the resume parser CLI batch mode."""
+
+    def setUp(self):
+        """Create a small tree of resume files."""
+        self.test_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_dir, 'nested'))
+        self.files = [
+            os.path.join(self.test_dir, 'a.pdf'),
+            os.path.join(self.test_dir, 'nested', 'b.docx'),
+        ]
+        for path in self.files:
+            with open(path, 'wb') as f:
+                f.write(os.path.basename(path).encode())
+        with open(os.path.join(self.test_dir, 'notes.txt'), 'w') as f:
+            f.write('not a resume')
+
+    def tearDown(self):
+        """Remove the temporary tree."""
+        shutil.rmtree(self.test_dir)
+
+    def test_expand_paths_directory_and_glob(self):
+        """Directories are walked recursively and globs are expanded."""
+        self.assertEqual(cli.expand_paths([self.test_dir]), sorted(self.files))
+        pattern = os.path.join(self.test_dir, '*.pdf')
+        self.assertEqual(cli.expand_paths([pattern]), [self.files[0]])
+
+    @patch.object(cli, 'parse_resume', fake_parse_resume)
+    def test_run_batch_streams_jsonl(self):
+        """Each parsed file produces one JSON line."""
+        out = io.StringIO()
+        failures = cli.run_batch(self.files, out, jobs=2)
+
+        self.assertEqual(failures, 0)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(sorted(r['file'] for r in records), sorted(self.files))
+        for record in records:
+            self.assertEqual(len(record['content_hash']), 64)
+            self.assertEqual(record['data']['contact_info']['name'], os.path.basename(record['file']))
+
+    @patch.object(cli, 'parse_resume', fake_parse_resume)
+    def test_run_batch_reports_unreadable_files(self):
+        """A file removed during the run is reported and the other files are still parsed."""
+        missing = os.path.join(self.test_dir, 'gone.pdf')
+        out = io.StringIO()
+        failures = cli.run_batch([missing] + self.files, out)
+
+        self.assertEqual(failures, 1)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(records[0]['file'], missing)
+        self.assertIn('error', records[0])
+        self.assertEqual(sorted(r['file'] for r in records[1:]), sorted(self.files))
+
+    @patch.object(cli, 'parse_resume', fake_parse_resume)
+    def test_run_batch_skips_unchanged(self):
+        """Files recorded in the manifest with the same hash are skipped."""
+        manifest = {}
+        cli.run_batch(self.files, io.StringIO(), manifest=manifest)
+        self.assertEqual(sorted(manifest), sorted(self.files))
+
+        # Modify one file; only that one should be parsed again
+        with open(self.files[0], 'ab') as f:
+            f.write(b'changed')
+        out = io.StringIO()
+        cli.run_batch(self.files, out, manifest=manifest)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['file'] for r in records], [self.files[0]])
+
+    @patch.object(cli, 'parse_resume', fake_parse_resume)
+    def test_run_batch_reparses_after_parser_change(self):
+        """Unchanged files are parsed again when the parser version differs."""
+        manifest = {}
+        with patch.object(cli, 'get_parser_version', return_value='old'):
+            cli.run_batch(self.files, io.StringIO(), manifest=manifest)
+        self.assertEqual({entry['parser_version'] for entry in manifest.values()}, {'old'})
+
+        out = io.StringIO()
+        with patch.object(cli, 'get_parser_version', return_value='new'):
+            cli.run_batch(self.files, out, manifest=manifest)
+        self.assertEqual(len(out.getvalue().splitlines()), len(self.files))
+        self.assertEqual({entry['parser_version'] for entry in manifest.values()}, {'new'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Resume File Handler Tests
+
+Tests for content-addressed upload storage.
+"""
+
+import os
+import io
+import sys
+import shutil
+import hashlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from werkzeug.datastructures import FileStorage
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import file_handler, store
+from resume_parser.store import ParsedResumeStore
+
+
+PDF_BYTES = b'%PDF-1.4\n' + b'resume body ' * 10000
+
+
+class TestStoreResumeUpload(unittest.TestCase):
+    """Test cases for store_resume_upload."""
+
+    def setUp(self):
+        """Point uploads at a temporary directory and an in-memory store."""
+        self.upload_dir = tempfile.mkdtemp()
+        self.store = ParsedResumeStore(':memory:')
+        for patcher in (patch.object(file_handler, 'UPLOAD_DIR', self.upload_dir),
+                        patch.object(store, 'get_store', return_value=self.store)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.upload_dir)
+
+    def _upload(self, data, filename='resume.pdf'):
+        return file_handler.store_resume_upload(FileStorage(io.BytesIO(data), filename=filename))
+
+    def test_upload_is_content_addressed(self):
+        """The stored file is named after its hash and metadata is recorded."""
+        success, _, upload = self._upload(PDF_BYTES)
+
+        self.assertTrue(success)
+        self.assertEqual(upload['content_hash'], hashlib.sha256(PDF_BYTES).hexdigest())
+        self.assertEqual(upload['size'], len(PDF_BYTES))
+        self.assertFalse(upload['duplicate'])
+        content_hash = upload['content_hash']
+        self.assertEqual(upload['path'], os.path.join(
+            self.upload_dir, content_hash[:2], content_hash[2:4], f"{content_hash}.pdf"))
+        with open(upload['path'], 'rb') as f:
+            self.assertEqual(f.read(), PDF_BYTES)
+
+    def test_duplicate_upload_is_stored_once(self):
+        """Uploading the same bytes twice keeps one file but two metadata rows."""
+        _, _, first = self._upload(PDF_BYTES, 'a.pdf')
+        _, _, second = self._upload(PDF_BYTES, 'b.pdf')
+
+        self.assertTrue(second['duplicate'])
+        self.assertEqual(first['path'], second['path'])
+        self.assertEqual(os.listdir(os.path.dirname(first['path'])), [os.path.basename(first['path'])])
+        uploads = self.store.get_uploads(first['content_hash'])
+        self.assertEqual([u['original_filename'] for u in uploads], ['a.pdf', 'b.pdf'])
+
+    def test_invalid_extension(self):
+        """Files with other extensions are rejected without writing anything."""
+        success, _, upload = self._upload(b'hello', 'notes.txt')
+        self.assertFalse(success)
+        self.assertIsNone(upload)
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_upload_over_limit_is_rejected(self):
+        """Uploads larger than the limit are rejected and leave nothing behind."""
+        with self.assertRaises(file_handler.UploadTooLarge) as raised:
+            file_handler.store_resume_upload(
+                FileStorage(io.BytesIO(PDF_BYTES), filename='big.pdf'), max_bytes=1024)
+
+        self.assertEqual(raised.exception.status_code, 413)
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_content_must_match_extension(self):
+        """A file whose magic number does not match its extension is rejected."""
+        with self.assertRaises(file_handler.InvalidUploadContent) as raised:
+            self._upload(b'GIF89a not a pdf', 'resume.pdf')
+        self.assertEqual(raised.exception.status_code, 415)
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_file_shorter_than_signature_is_rejected(self):
+        """A file too short to hold its signature gets the same 415 as a mismatch."""
+        with self.assertRaises(file_handler.InvalidUploadContent) as raised:
+            self._upload(b'%P', 'resume.pdf')
+        self.assertEqual(raised.exception.status_code, 415)
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+        # The legacy wrapper keeps reporting rejections as a failed result
+        success, message, path = file_handler.save_resume_file(
+            FileStorage(io.BytesIO(b'%P'), filename='resume.pdf'))
+        self.assertFalse(success)
+        self.assertIsNone(path)
+
+    def test_endpoint_uses_the_rejection_status(self):
+        """/parse-resume answers a short file with 415, not 400."""
+        import app as backend_app
+        response = backend_app.app.test_client().post('/parse-resume', data={
+            'file': (io.BytesIO(b'%P'), 'resume.pdf')
+        }, content_type='multipart/form-data')
+
+        self.assertEqual(response.status_code, 415)
+        self.assertIn('error', response.get_json())
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+
+class TestUploadSpool(unittest.TestCase):
+    """Test cases for the streaming upload spool."""
+
+    def setUp(self):
+        self.upload_dir = tempfile.mkdtemp()
+        patcher = patch.object(file_handler, 'UPLOAD_DIR', self.upload_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.upload_dir)
+
+    def test_aborts_on_first_bad_chunk(self):
+        """The signature is checked on the first chunk, before the rest arrives."""
+        spool = file_handler.UploadSpool('resume.docx')
+        with self.assertRaises(file_handler.InvalidUploadContent):
+            spool.write(b'%PDF-1.4')
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_aborts_when_limit_exceeded(self):
+        """Writing past the limit raises and removes the partial file."""
+        spool = file_handler.UploadSpool('resume.pdf', max_bytes=10)
+        spool.write(b'%PDF-')
+        with self.assertRaises(file_handler.UploadTooLarge):
+            spool.write(b'0123456789')
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_hash_matches_content(self):
+        """The running hash covers every chunk written."""
+        spool = file_handler.UploadSpool('resume.pdf')
+        for i in range(0, len(PDF_BYTES), 4096):
+            spool.write(PDF_BYTES[i:i + 4096])
+        self.assertEqual(spool.content_hash, hashlib.sha256(PDF_BYTES).hexdigest())
+        spool.close()
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
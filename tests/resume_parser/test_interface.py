@@ -0,0 +1,49 @@
+"""
+Resume Parser Interface Tests
+
+Tests for selecting the fields of a parse result sent to clients.
+"""
+
+import os
+import sys
+import unittest
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser.interface import project_resume_data
+
+
+RESUME_DATA = {
+    'contact_info': {'name': 'Jane Doe'},
+    'summary': 'Data analyst',
+    'skills': ['SQL'],
+    'raw_sections': {'summary': 'Data analyst'}
+}
+
+
+class TestProjectResumeData(unittest.TestCase):
+    """Test cases for project_resume_data."""
+
+    def test_debug_fields_are_dropped_by_default(self):
+        """The compact projection keeps every field except raw_sections."""
+        self.assertEqual(set(project_resume_data(RESUME_DATA)), {'contact_info', 'summary', 'skills'})
+
+    def test_debug_fields_on_request(self):
+        """include_debug keeps the debug payloads."""
+        self.assertEqual(project_resume_data(RESUME_DATA, include_debug=True), RESUME_DATA)
+
+    def test_field_list(self):
+        """An explicit field list keeps only those fields, ignoring unknown ones."""
+        projected = project_resume_data(RESUME_DATA, fields=['skills', 'raw_sections', 'missing'])
+        self.assertEqual(projected, {'skills': ['SQL'], 'raw_sections': {'summary': 'Data analyst'}})
+
+    def test_source_is_not_modified(self):
+        """Projection returns a new dictionary and leaves the shared result alone."""
+        project_resume_data(RESUME_DATA)
+        self.assertIn('raw_sections', RESUME_DATA)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Resume Re-parse Tests
+
+Tests for parser versioning and the background re-parse job.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import interface, reparse
+from resume_parser.store import ParsedResumeStore
+
+
+def fake_parse_resume_file(file_path):
+    """Stand-in for the real parser that echoes the file name."""
+    return {'summary': os.path.basename(file_path)}, False
+
+
+class TestReparse(unittest.TestCase):
+    """Test cases for parser versioning and background re-parse."""
+
+    def setUp(self):
+        """Create an in-memory store and a directory of source files."""
+        self.store = ParsedResumeStore(':memory:')
+        self.source_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Close the store and remove the source files."""
+        self.store.close()
+        shutil.rmtree(self.source_dir)
+
+    def test_parser_version_is_stable_and_stamped(self):
+        """The version is derived from the parser sources and stamped on results."""
+        version = interface.get_parser_version()
+        self.assertEqual(len(version), 12)
+        self.assertEqual(interface.stamp_parser_version({})['parser_version'], version)
+        self.assertNotIn('parser_version', interface.stamp_parser_version({'error': 'bad'}))
+
+    @patch.object(reparse, 'parse_resume_file', fake_parse_resume_file)
+    def test_upgrades_stale_results(self):
+        """Stale results are replaced by the current version and old versions pruned."""
+        source_path = os.path.join(self.source_dir, 'a.pdf')
+        with open(source_path, 'wb') as f:
+            f.write(b'%PDF-1.4')
+        self.store.save({'summary': 'old'}, 'a' * 64, 'old-version', source_path)
+        self.store.save({'summary': 'gone'}, 'b' * 64, 'old-version', os.path.join(self.source_dir, 'missing.pdf'))
+
+        job = reparse.ReparseJob(store=self.store, workers=1, max_per_minute=6000)
+        upgraded, failed = job.run()
+
+        self.assertEqual((upgraded, failed), (1, 0))
+        self.assertEqual(self.store.get('a' * 64, job.parser_version), {'summary': 'a.pdf'})
+        self.assertIsNone(self.store.get('a' * 64, 'old-version'))
+        # Results whose source file is gone keep serving the old version
+        self.assertEqual(self.store.get('b' * 64), {'summary': 'gone'})
+        self.assertEqual(len(self.store.stale_entries(job.parser_version)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
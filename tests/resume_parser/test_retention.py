@@ -0,0 +1,165 @@
+"""
+Upload Retention Tests
+
+Tests for the sharded upload layout migration and the retention rules of the
+upload garbage collector.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import file_handler
+from resume_parser.retention import RetentionPolicy, UploadGarbageCollector
+from resume_parser.store import ParsedResumeStore
+
+
+class TestUploadGarbageCollector(unittest.TestCase):
+    """Test cases for the upload garbage collector."""
+
+    def setUp(self):
+        """Create an upload directory and an in-memory store."""
+        self.upload_dir = tempfile.mkdtemp()
+        self.store = ParsedResumeStore(':memory:')
+
+    def tearDown(self):
+        shutil.rmtree(self.upload_dir)
+
+    def _collector(self, **policy):
+        return UploadGarbageCollector(self.store, self.upload_dir, RetentionPolicy(**policy))
+
+    def _blob(self, content_hash, size=10, record=True):
+        path = file_handler.get_blob_path(content_hash, 'pdf', self.upload_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'x' * size)
+        if record:
+            self.store.record_upload(content_hash, path, 'resume.pdf', size=size)
+            self.store.save({'contact_info': {}}, content_hash, 'v1', path)
+        return path
+
+    def _backdate(self, content_hash=None):
+        with self.store._conn:
+            self.store._conn.execute(
+                "UPDATE resume_uploads SET uploaded_at = '2000-01-01 00:00:00' WHERE ? IS NULL OR content_hash = ?",
+                (content_hash, content_hash))
+
+    def _age(self, path, seconds):
+        old = time.time() - seconds
+        os.utime(path, (old, old))
+
+    def test_flat_files_are_moved_into_shards(self):
+        """Content-addressed files in the old flat layout move into shards and the store follows."""
+        content_hash = 'ab' * 32
+        flat_path = os.path.join(self.upload_dir, f"{content_hash}.pdf")
+        with open(flat_path, 'wb') as f:
+            f.write(b'%PDF')
+        self.store.record_upload(content_hash, flat_path, 'resume.pdf', size=4)
+
+        stats = self._collector(delete_orphans=False).run_pass()
+
+        sharded_path = os.path.join(self.upload_dir, 'ab', 'ab', f"{content_hash}.pdf")
+        self.assertEqual(stats['migrated'], 1)
+        self.assertTrue(os.path.exists(sharded_path))
+        self.assertEqual(self.store.get_uploads(content_hash)[0]['blob_path'], sharded_path)
+
+    def test_over_quota_deletes_least_recently_uploaded(self):
+        """Files are deleted oldest first until the total fits the byte budget."""
+        old_path = self._blob('1' * 64, size=100)
+        self._backdate('1' * 64)
+        new_path = self._blob('2' * 64, size=100)
+
+        stats = self._collector(max_total_bytes=150, delete_orphans=False).run_pass()
+
+        self.assertEqual(stats['over_quota'], 1)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertIsNone(self.store.get('1' * 64))
+        self.assertTrue(os.path.exists(new_path))
+        self.assertEqual(self.store.upload_totals(), (1, 100))
+
+    def test_expired_uploads_are_deleted(self):
+        """Files whose latest upload is older than the maximum age are deleted with their results."""
+        path = self._blob('3' * 64)
+        self._backdate()
+
+        stats = self._collector(max_age_days=30, delete_orphans=False).run_pass()
+
+        self.assertEqual(stats['expired'], 1)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.store.get_uploads('3' * 64), [])
+
+    def test_content_uploaded_again_during_collection_is_kept(self):
+        """An upload recorded after the collector picked a file keeps the file and its results."""
+        content_hash = '8' * 64
+        path = self._blob(content_hash)
+        self._backdate()
+        uploads_by_age = self.store.uploads_by_age
+
+        def upload_again(*args, **kwargs):
+            expired = uploads_by_age(*args, **kwargs)
+            self.store.record_upload(content_hash, path, 'again.pdf', size=10)
+            return expired
+
+        with patch.object(self.store, 'uploads_by_age', side_effect=upload_again):
+            stats = self._collector(max_age_days=30, delete_orphans=False).run_pass()
+
+        self.assertEqual(stats['expired'], 0)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual([u['original_filename'] for u in self.store.get_uploads(content_hash)], ['again.pdf'])
+        self.assertIsNotNone(self.store.get(content_hash))
+
+    def test_orphans_are_deleted_after_grace_period(self):
+        """Unreferenced blobs and stale temp uploads are deleted once old enough; legacy files are kept."""
+        kept = self._blob('4' * 64)
+        orphan = self._blob('5' * 64, record=False)
+        fresh_orphan = self._blob('6' * 64, record=False)
+        legacy_pdf = os.path.join(self.upload_dir, 'legacy_resume.pdf')
+        legacy_json = os.path.join(self.upload_dir, 'legacy_resume.json')
+        temp_upload = os.path.join(self.upload_dir, '.upload-abc')
+        for path in (legacy_pdf, legacy_json, temp_upload):
+            open(path, 'wb').close()
+        for path in (kept, orphan, legacy_pdf, legacy_json, temp_upload):
+            self._age(path, 7200)
+
+        stats = self._collector(orphan_grace_seconds=3600).run_pass()
+
+        self.assertEqual(stats['orphaned'], 2)
+        for path in (kept, fresh_orphan, legacy_pdf, legacy_json):
+            self.assertTrue(os.path.exists(path))
+        for path in (orphan, temp_upload):
+            self.assertFalse(os.path.exists(path))
+
+        # Legacy files go once their deletion is enabled
+        stats = self._collector(orphan_grace_seconds=3600, delete_legacy=True).run_pass()
+
+        self.assertEqual(stats['orphaned'], 2)
+        self.assertFalse(os.path.exists(legacy_pdf))
+        self.assertFalse(os.path.exists(legacy_json))
+
+    def test_rows_for_missing_files_are_dropped(self):
+        """Store rows pointing at files that were removed out of band are deleted."""
+        path = self._blob('7' * 64)
+        os.remove(path)
+
+        # A fresh row may belong to an upload whose file is still being moved into place
+        stats = self._collector(delete_orphans=False).run_pass()
+        self.assertEqual(stats['missing'], 0)
+
+        self._backdate()
+        stats = self._collector(delete_orphans=False).run_pass()
+
+        self.assertEqual(stats['missing'], 1)
+        self.assertEqual(self.store.get_uploads('7' * 64), [])
+        self.assertIsNone(self.store.get('7' * 64))
+
+
+if __name__ == '__main__':
+    unittest.main()
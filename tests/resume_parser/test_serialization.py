@@ -0,0 +1,80 @@
+"""
+JSON Serialization Tests
+
+Tests that both serializer backends encode the same way.
+"""
+
+import os
+import sys
+import json
+import importlib
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import serialization
+
+
+PAYLOAD = {
+    'contact_info': {'name': 'Zoë Doe', 'email': 'zoe@example.com'},
+    'skills': ['SQL', 'Python'],
+    'saved_at': datetime(2025, 4, 11, 12, 30),
+    'start': date(2024, 1, 2),
+    'tags': {'remote'},
+    1: 'numeric key'
+}
+
+
+class TestSerialization(unittest.TestCase):
+    """Test cases for resume_parser.serialization."""
+
+    def tearDown(self):
+        importlib.reload(serialization)
+
+    def _backends(self):
+        yield importlib.reload(serialization)
+        with patch.dict(os.environ, {'JSON_SERIALIZER': 'json'}):
+            yield importlib.reload(serialization)
+
+    def test_backends_agree(self):
+        """Every backend produces the same decoded document and round-trips through loads."""
+        decoded = []
+        for module in self._backends():
+            encoded = module.dumps(PAYLOAD)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(module.loads(encoded), json.loads(encoded))
+            decoded.append(json.loads(encoded))
+        for document in decoded:
+            self.assertEqual(document, decoded[0])
+        self.assertEqual(decoded[0]['saved_at'], '2025-04-11T12:30:00')
+        self.assertEqual(decoded[0]['tags'], ['remote'])
+        self.assertEqual(decoded[0]['1'], 'numeric key')
+
+    def test_pretty_output(self):
+        """pretty=True indents by two spaces."""
+        for module in self._backends():
+            self.assertIn(b'\n  "skills"', module.dumps({'skills': []}, pretty=True))
+
+    def test_streamed_encodings(self):
+        """Streamed arrays and NDJSON decode to the items, whatever the chunk size."""
+        items = [{'id': i, 'title': f'Job {i}'} for i in range(5)]
+        for chunk_items in (1, 2, 5, 10):
+            chunks = list(serialization.iter_json_array(iter(items), chunk_items))
+            self.assertEqual(json.loads(b''.join(chunks)), items)
+            lines = b''.join(serialization.iter_ndjson(iter(items), chunk_items)).splitlines()
+            self.assertEqual([json.loads(line) for line in lines], items)
+        self.assertEqual(json.loads(b''.join(serialization.iter_json_array([]))), [])
+        self.assertEqual(b''.join(serialization.iter_ndjson([])), b'')
+
+    def test_forced_stdlib(self):
+        """JSON_SERIALIZER=json selects the standard library."""
+        with patch.dict(os.environ, {'JSON_SERIALIZER': 'json'}):
+            self.assertEqual(importlib.reload(serialization).BACKEND, 'json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Parsed Resume Store Tests
+
+Tests for the SQLite-backed parsed resume store.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser.store import ParsedResumeStore
+from resume_parser.file_handler import compute_file_hash
+
+
+SAMPLE_RESUME = {
+    'contact_info': {'name': 'John  Doe', 'email': 'John.Doe@Example.com'},
+    'summary': 'Experienced software engineer.',
+    'experiences': [],
+}
+
+
+class TestParsedResumeStore(unittest.TestCase):
+    """Test cases for the parsed resume store."""
+
+    def setUp(self):
+        """Create an in-memory store."""
+        self.store = ParsedResumeStore(':memory:', cache_size=2)
+
+    def tearDown(self):
+        """Close the store."""
+        self.store.close()
+
+    def test_save_and_get(self):
+        """Results are keyed by content hash and parser version."""
+        self.store.save(SAMPLE_RESUME, 'a' * 64, 'v1', '/tmp/a.pdf')
+        self.assertEqual(self.store.get('a' * 64, 'v1'), SAMPLE_RESUME)
+        self.assertIsNone(self.store.get('a' * 64, 'v2'))
+        self.assertIsNone(self.store.get('b' * 64))
+
+    def test_get_latest_version(self):
+        """Without a version the most recently stored result is returned."""
+        self.store.save({'summary': 'old'}, 'a' * 64, 'v1')
+        self.store.save({'summary': 'new'}, 'a' * 64, 'v2')
+        self.assertEqual(self.store.get('a' * 64)['summary'], 'new')
+
+    def test_compact_json(self):
+        """Results are stored without indentation."""
+        self.store.save(SAMPLE_RESUME, 'a' * 64, 'v1')
+        raw = self.store._conn.execute('SELECT data FROM parsed_resumes').fetchone()['data']
+        self.assertNotIn('\n', raw)
+        self.assertNotIn(', ', raw)
+
+    def test_lookup_by_email_and_name(self):
+        """Lookups are case and whitespace insensitive."""
+        self.store.save(SAMPLE_RESUME, 'a' * 64, 'v1')
+        self.assertEqual(self.store.find_by_email('john.doe@example.com')[0]['content_hash'], 'a' * 64)
+        self.assertEqual(self.store.find_by_name('john doe')[0]['content_hash'], 'a' * 64)
+        self.assertEqual(self.store.latest_by_email('JOHN.DOE@EXAMPLE.COM'), SAMPLE_RESUME)
+        self.assertEqual(self.store.find_by_email('nobody@example.com'), [])
+
+    def test_lru_eviction(self):
+        """The cache keeps at most cache_size entries but lookups still hit the table."""
+        for i in range(3):
+            self.store.save({'summary': str(i)}, str(i) * 64, 'v1')
+        self.assertEqual(len(self.store._cache), 2)
+        self.assertEqual(self.store.get('0' * 64, 'v1'), {'summary': '0'})
+
+    def test_import_json_files(self):
+        """Legacy JSON files next to their uploads are imported."""
+        upload_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(upload_dir, 'resume.pdf'), 'wb') as f:
+                f.write(b'%PDF-1.4')
+            with open(os.path.join(upload_dir, 'resume.json'), 'w') as f:
+                json.dump(SAMPLE_RESUME, f, indent=2)
+            with open(os.path.join(upload_dir, 'orphan.json'), 'w') as f:
+                json.dump(SAMPLE_RESUME, f)
+
+            self.assertEqual(self.store.import_json_files(upload_dir, 'v1'), 1)
+
+            # Importing again leaves results already in the store alone
+            content_hash = compute_file_hash(os.path.join(upload_dir, 'resume.pdf'))
+            self.store.save({'summary': 'newer'}, content_hash, 'v2')
+            self.assertEqual(self.store.import_json_files(upload_dir, 'v1'), 0)
+            self.assertEqual(self.store.get(content_hash), {'summary': 'newer'})
+        finally:
+            shutil.rmtree(upload_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
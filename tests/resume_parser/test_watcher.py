@@ -0,0 +1,105 @@
+"""
+Resume Watch-Folder Ingestion Tests
+
+Tests for change detection, debouncing and result saving in the ingestion daemon.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add backend directory to Python path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.insert(0, backend_dir)
+
+from resume_parser import interface, watcher
+from resume_parser.store import ParsedResumeStore
+
+
+def fake_parse_resume_file(file_path):
+    """Stand-in for the real parsers that echoes the file name."""
+    return {'contact_info': {'name': os.path.basename(file_path)}}, True
+
+
+class TestIngestionDaemon(unittest.TestCase):
+    """Test cases for the watch-folder ingestion daemon."""
+
+    def setUp(self):
+        """Create a watch directory, an in-memory store and a daemon using threads."""
+        self.watch_dir = tempfile.mkdtemp()
+        self.store = ParsedResumeStore(':memory:')
+        store_patcher = patch.object(interface, 'get_store', return_value=self.store)
+        store_patcher.start()
+        self.addCleanup(store_patcher.stop)
+        self.daemon = watcher.IngestionDaemon(self.watch_dir, settle_seconds=1.0)
+        self.daemon._executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        """Shut down the pool and remove the watch directory."""
+        self.daemon._executor.shutdown(wait=True)
+        shutil.rmtree(self.watch_dir)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.watch_dir, name), 'wb') as f:
+            f.write(data)
+
+    def _drain(self):
+        self.daemon._executor.shutdown(wait=True)
+        self.daemon.collect_results()
+        self.daemon._executor = ThreadPoolExecutor(max_workers=1)
+
+    def test_polling_watcher_reports_changes(self):
+        """The polling fallback reports new and modified files."""
+        poller = watcher.PollingWatcher(self.watch_dir, interval=0)
+        self._write('a.pdf', b'one')
+        names, overflowed = poller.read_events(0)
+        self.assertEqual(names, {'a.pdf'})
+        self.assertFalse(overflowed)
+        self.assertEqual(poller.read_events(0)[0], set())
+
+    @patch.object(watcher, 'parse_resume_file', fake_parse_resume_file)
+    def test_debounce_and_ingest(self):
+        """Files are parsed only after the settle period and only once per content."""
+        self._write('a.pdf', b'partial')
+        self.daemon.notice(['a.pdf', 'notes.txt'], now=100.0)
+
+        # Still inside the settle period
+        self.assertEqual(self.daemon.dispatch_ready(now=100.5), 0)
+
+        # The file grows: the quiet period restarts
+        self._write('a.pdf', b'partial and complete')
+        self.assertEqual(self.daemon.dispatch_ready(now=100.9), 0)
+        self.assertEqual(self.daemon.dispatch_ready(now=101.5), 0)
+        self.assertEqual(self.daemon.dispatch_ready(now=102.0), 1)
+        self._drain()
+
+        content_hash = watcher.compute_file_hash(os.path.join(self.watch_dir, 'a.pdf'))
+        self.assertEqual(self.store.get(content_hash)['contact_info']['name'], 'a.pdf')
+        self.assertEqual(self.daemon.latency.summary()['count'], 1)
+
+        # Touching the file without changing content does not re-parse it
+        self.daemon.notice(['a.pdf'], now=200.0)
+        self.assertEqual(self.daemon.dispatch_ready(now=202.0), 0)
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is Linux-only')
+    def test_inotify_watcher_reports_changes(self):
+        """The inotify watcher reports files written into the directory."""
+        inotify = watcher.InotifyWatcher(self.watch_dir)
+        try:
+            self._write('b.docx', b'data')
+            deadline = time.time() + 2
+            names = set()
+            while 'b.docx' not in names and time.time() < deadline:
+                names |= inotify.read_events(0.1)[0]
+            self.assertIn('b.docx', names)
+        finally:
+            inotify.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
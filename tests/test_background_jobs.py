@@ -0,0 +1,114 @@
+"""
+Background Jobs Tests
+
+Tests for the in-process job registry used by async API endpoints.
+"""
+
+import os
+import sys
+import json
+import threading
+import unittest
+
+# Add backend directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from background_jobs import JobRegistry, sse_stream, poll_sse_stream, DONE, FAILED
+
+
+def staged_job(value, progress):
+    progress('extracting')
+    progress('sectioning')
+    return {'value': value}
+
+
+def failing_job(progress):
+    progress('extracting')
+    raise ValueError('bad file')
+
+
+class TestJobRegistry(unittest.TestCase):
+    """Test cases for the job registry."""
+
+    def setUp(self):
+        self.registry = JobRegistry(max_workers=1)
+
+    def _wait(self, job):
+        for _ in self.registry.iter_events(job, keepalive=5):
+            pass
+
+    def test_job_reports_stages_and_result(self):
+        """A job goes through its stages and keeps its result."""
+        job = self.registry.submit('test', staged_job, 42)
+        self._wait(job)
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.result, {'value': 42})
+        self.assertEqual([e['stage'] for e in job.events],
+                         ['queued', 'running', 'extracting', 'sectioning', 'done'])
+        self.assertIs(self.registry.get(job.id), job)
+
+    def test_failed_job(self):
+        """Exceptions fail the job and record the error."""
+        job = self.registry.submit('test', failing_job)
+        self._wait(job)
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.error, 'bad file')
+        self.assertNotIn('result', job.to_dict())
+
+    def test_sse_stream(self):
+        """Server-sent events end with the finished job."""
+        gate = threading.Event()
+
+        def gated_job(progress):
+            gate.wait(5)
+            return 'ok'
+
+        job = self.registry.submit('test', gated_job)
+        gate.set()
+        messages = list(sse_stream(self.registry, job))
+
+        self.assertTrue(messages[0].startswith('event: stage\n'))
+        self.assertTrue(messages[-1].startswith('event: done\n'))
+        final = json.loads(messages[-1].split('data: ', 1)[1])
+        self.assertEqual(final['result'], 'ok')
+
+    def test_poll_sse_stream(self):
+        """Polled tasks send each new stage once and end with the finished task."""
+        states = iter([
+            {'status': 'queued', 'stage': 'queued'},
+            {'status': 'running', 'stage': 'extracting'},
+            {'status': 'running', 'stage': 'extracting'},
+            {'status': 'done', 'stage': 'done', 'result': 'ok'}
+        ])
+        messages = list(poll_sse_stream(lambda: next(states), poll_interval=0))
+
+        self.assertEqual([m.split('\n', 1)[0] for m in messages],
+                         ['event: stage', 'event: stage', 'event: done'])
+        final = json.loads(messages[-1].split('data: ', 1)[1])
+        self.assertEqual(final['result'], 'ok')
+
+        messages = list(poll_sse_stream(lambda: None, poll_interval=0))
+        self.assertTrue(messages[0].startswith('event: failed\n'))
+
+    def test_unknown_job(self):
+        self.assertIsNone(self.registry.get('missing'))
+
+    def test_wait(self):
+        """wait() reports whether the job finished within the timeout."""
+        gate = threading.Event()
+
+        def gated_job(progress):
+            gate.wait(5)
+            return 'ok'
+
+        job = self.registry.submit('test', gated_job)
+        self.assertFalse(self.registry.wait(job, timeout=0.05))
+        gate.set()
+        self.assertTrue(self.registry.wait(job, timeout=5))
+        self.assertEqual(job.result, 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
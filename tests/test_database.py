@@ -0,0 +1,544 @@
+"""
+Jobs Database Tests
+
+Tests for the pooled SQLite connections shared by the app and database.Database,
+the schema migrations, the paginated job listing and the query plans of the
+job endpoints.
+"""
+
+import os
+import sys
+import sqlite3
+import shutil
+import tempfile
+import threading
+import unittest
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, BACKEND_DIR)
+
+import database
+from database import ConnectionPool, Database, get_pool, migrate, get_schema_version
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for the per-thread connection pool."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'jobs.db')
+        self.pool = ConnectionPool(self.db_path)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_connections_are_tuned(self):
+        """Pooled connections use WAL mode, synchronous=NORMAL and memory-mapped I/O."""
+        conn = self.pool.acquire()
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.assertEqual(conn.execute('PRAGMA synchronous').fetchone()[0], 1)
+        self.assertGreater(conn.execute('PRAGMA mmap_size').fetchone()[0], 0)
+
+    def test_thread_keeps_its_connection_until_release(self):
+        """A thread gets one connection until it releases it, then the next checkout reuses it."""
+        conn = self.pool.acquire()
+        self.assertIs(self.pool.acquire(), conn)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.pool.acquire()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], conn)
+
+        self.pool.release()
+        with self.pool.connection() as reused:
+            self.assertIs(reused, conn)
+
+    def test_release_rolls_back_uncommitted_work(self):
+        """Work left uncommitted when a connection is released is not seen by the next user."""
+        with self.pool.connection() as conn, conn:
+            conn.execute('CREATE TABLE items (name TEXT)')
+        conn = self.pool.acquire()
+        conn.execute("INSERT INTO items VALUES ('draft')")
+        self.pool.release()
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM items').fetchone()[0], 0)
+
+    def test_readers_are_not_blocked_by_a_writer(self):
+        """A reader sees the last committed data while another connection holds a write transaction."""
+        with self.pool.connection() as conn, conn:
+            conn.execute('CREATE TABLE items (name TEXT)')
+            conn.execute("INSERT INTO items VALUES ('saved')")
+        writer = self.pool.connect()
+        writer.execute('BEGIN IMMEDIATE')
+        writer.execute("INSERT INTO items VALUES ('pending')")
+        try:
+            with self.pool.connection() as reader:
+                self.assertEqual(reader.execute('SELECT COUNT(*) FROM items').fetchone()[0], 1)
+        finally:
+            writer.rollback()
+            writer.close()
+
+    def test_pools_are_shared_per_path(self):
+        """get_pool returns one pool per database file."""
+        self.assertIs(get_pool(self.db_path), get_pool(os.path.join(self.tmp_dir, '.', 'jobs.db')))
+
+
+class TestDatabase(unittest.TestCase):
+    """Test cases for the Database helper."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = Database(os.path.join(self.tmp_dir, 'jobs.db'))
+
+    def tearDown(self):
+        self.db.pool.close_all()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_save_get_and_delete_job(self):
+        """Jobs round-trip through the pooled connections."""
+        job_id = self.db.save_job('Data Analyst', 'Acme', 'Analyze data', 'https://example.com/apply')
+        self.assertEqual(self.db.get_job(job_id)['company'], 'Acme')
+        self.assertEqual([job['id'] for job in self.db.get_jobs()], [job_id])
+        self.assertTrue(self.db.delete_job(job_id))
+        self.assertIsNone(self.db.get_job(job_id))
+        self.assertFalse(self.db.delete_job(job_id))
+
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for the versioned schema migrations."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.row_factory = sqlite3.Row
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_fresh_database_reaches_latest_version(self):
+        """A new database gets every step, and migrating again is a no-op."""
+        self.assertEqual(migrate(self.conn), 0)
+        self.assertEqual(get_schema_version(self.conn), database.SCHEMA_VERSION)
+        self.assertEqual(migrate(self.conn), database.SCHEMA_VERSION)
+
+    def test_unversioned_database_is_upgraded(self):
+        """Databases from before versioning keep their rows and count their applications."""
+        self.conn.executescript('''
+            CREATE TABLE jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                description TEXT,
+                apply_link TEXT,
+                saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        ''')
+        self.conn.execute("INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')")
+        self.conn.commit()
+
+        migrate(self.conn)
+        self.conn.execute("UPDATE jobs SET status = 'applied', applied_at = '2025-04-11 09:30:00'")
+        self.conn.commit()
+
+        job = self.conn.execute('SELECT * FROM jobs').fetchone()
+        self.assertEqual(job['title'], 'Analyst')
+        self.assertNotIn('applied_date', job.keys())
+        leftovers = self.conn.execute("SELECT name FROM sqlite_master WHERE name LIKE '%applied_date%'").fetchall()
+        self.assertEqual(leftovers, [])
+        count = self.conn.execute(database.APPLIED_ON_DATE_SQL, ('2025-04-11',)).fetchone()['count']
+        self.assertEqual(count, 1)
+
+    def test_tailored_resume_columns_follow_inserts_and_deletes(self):
+        """Triggers keep each job's tailored resume count and latest id current."""
+        migrate(self.conn)
+        job_id = self.conn.execute("INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')").lastrowid
+        first = self.conn.execute(
+            "INSERT INTO tailored_resumes (job_id, created_at) VALUES (?, '2025-04-10 08:00:00')",
+            (job_id,)).lastrowid
+        second = self.conn.execute(
+            "INSERT INTO tailored_resumes (job_id, created_at) VALUES (?, '2025-04-11 08:00:00')",
+            (job_id,)).lastrowid
+
+        def job_row():
+            return self.conn.execute(
+                'SELECT tailored_count, latest_tailored_resume_id FROM jobs WHERE id = ?', (job_id,)).fetchone()
+
+        self.assertEqual(tuple(job_row()), (2, second))
+        self.conn.execute('DELETE FROM tailored_resumes WHERE id = ?', (second,))
+        self.assertEqual(tuple(job_row()), (1, first))
+        self.conn.execute('DELETE FROM tailored_resumes WHERE id = ?', (first,))
+        self.assertEqual(tuple(job_row()), (0, None))
+
+    def test_tailored_resume_columns_are_backfilled(self):
+        """Upgrading from version 2 fills the columns from existing tailored resumes."""
+        for version, step in database.MIGRATIONS[:2]:
+            step(self.conn)
+        self.conn.execute('PRAGMA user_version = 2')
+        self.conn.execute("INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')")
+        self.conn.execute("INSERT INTO tailored_resumes (job_id, content) VALUES (1, 'a')")
+        self.conn.execute("INSERT INTO tailored_resumes (job_id, content) VALUES (1, 'b')")
+        self.conn.commit()
+
+        migrate(self.conn)
+
+        job = self.conn.execute(database.GET_JOB_SQL, (1,)).fetchone()
+        self.assertEqual(job['tailored_count'], 2)
+        self.assertEqual(job['latest_tailored_resume_id'], 2)
+        self.assertEqual(job['has_tailored_resume'], 1)
+
+    def test_data_version_increases_on_every_write(self):
+        """Inserts, updates and deletes of jobs and tailored resumes all bump the data version."""
+        migrate(self.conn)
+        writes = (
+            "INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')",
+            "UPDATE jobs SET status = 'applied' WHERE id = 1",
+            "INSERT INTO tailored_resumes (job_id) VALUES (1)",
+            "DELETE FROM tailored_resumes WHERE job_id = 1",
+            "DELETE FROM jobs WHERE id = 1"
+        )
+        for sql in writes:
+            with self.subTest(sql=sql):
+                version = database.get_data_version(self.conn)
+                self.conn.execute(sql)
+                self.assertGreater(database.get_data_version(self.conn), version)
+
+    def test_counters_follow_job_writes(self):
+        """Status totals and daily applied counts track inserts, status changes and deletes."""
+        migrate(self.conn)
+        for title in ('Analyst', 'Engineer', 'Scientist'):
+            self.conn.execute("INSERT INTO jobs (title, company) VALUES (?, 'Acme')", (title,))
+        self.conn.execute("UPDATE jobs SET status = 'applied', applied_at = '2025-04-11 09:00:00' WHERE id IN (1, 2)")
+        self.conn.execute("UPDATE jobs SET status = 'interviewing' WHERE id = 2")
+        self.conn.execute('DELETE FROM jobs WHERE id = 3')
+
+        counts = {row['status']: row['count'] for row in self.conn.execute(database.STATUS_COUNTS_SQL)}
+        self.assertEqual(counts, {'applied': 1, 'interviewing': 1})
+        applied = self.conn.execute(database.APPLIED_ON_DATE_SQL, ('2025-04-11',)).fetchone()['count']
+        self.assertEqual(applied, 1)
+        self.assertEqual(database.verify_counters(self.conn), [])
+
+    def test_verify_counters_detects_and_repairs_drift(self):
+        """Counters edited out of band are reported and rebuilt on repair."""
+        migrate(self.conn)
+        self.conn.execute("INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')")
+        self.conn.execute("UPDATE job_counters SET count = 7 WHERE kind = 'status' AND key = 'to_apply'")
+
+        mismatches = database.verify_counters(self.conn, repair=True)
+
+        self.assertEqual(mismatches, [{'kind': 'status', 'key': 'to_apply', 'stored': 7, 'actual': 1}])
+        self.assertEqual(database.verify_counters(self.conn), [])
+
+    def test_failed_step_leaves_previous_version(self):
+        """A step that raises is rolled back without bumping the version."""
+        def broken(conn):
+            conn.execute('CREATE TABLE half_done (id INTEGER)')
+            raise RuntimeError('boom')
+
+        migrate(self.conn)
+        original = database.MIGRATIONS
+        database.MIGRATIONS = original + [(database.SCHEMA_VERSION + 1, broken)]
+        try:
+            with self.assertRaises(RuntimeError):
+                migrate(self.conn)
+        finally:
+            database.MIGRATIONS = original
+        self.assertEqual(get_schema_version(self.conn), database.SCHEMA_VERSION)
+        tables = [row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        self.assertNotIn('half_done', tables)
+
+
+class TestListJobs(unittest.TestCase):
+    """Test cases for the paginated, projected job listing."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.row_factory = sqlite3.Row
+        migrate(self.conn)
+        # Jobs 1-3 share a saved_at, so ties are broken by id
+        for job_id in range(1, 6):
+            saved_at = '2025-04-10 12:00:00' if job_id <= 3 else f'2025-04-1{job_id} 12:00:00'
+            self.conn.execute(
+                'INSERT INTO jobs (title, company, description, saved_at) VALUES (?, ?, ?, ?)',
+                (f'Job {job_id}', 'Acme', 'Long description', saved_at))
+
+    def test_pages_cover_every_job_once(self):
+        """Following the cursors visits each job exactly once, newest first."""
+        seen, cursor = [], None
+        while True:
+            jobs, cursor = database.list_jobs(self.conn, limit=2, cursor=cursor)
+            seen.extend(job['id'] for job in jobs)
+            if cursor is None:
+                break
+        self.assertEqual(seen, [5, 4, 3, 2, 1])
+
+    def test_default_fields_leave_out_description_and_coalesce_nulls(self):
+        """Descriptions are only returned on request, and NULL columns come back as ''."""
+        jobs, cursor = database.list_jobs(self.conn)
+        self.assertIsNone(cursor)
+        self.assertNotIn('description', jobs[0])
+        self.assertEqual(jobs[0]['applied_at'], '')
+
+        jobs, _ = database.list_jobs(self.conn, fields=['title', 'description'], limit=1)
+        self.assertEqual(jobs, [{'title': 'Job 5', 'description': 'Long description'}])
+
+    def test_iter_jobs_streams_every_job(self):
+        """iter_jobs yields every job in listing order across fetch batches."""
+        jobs = list(database.iter_jobs(self.conn, fields=['id', 'description'], batch_size=2))
+        self.assertEqual([job['id'] for job in jobs], [5, 4, 3, 2, 1])
+        self.assertEqual(jobs[0]['description'], 'Long description')
+        with self.assertRaises(ValueError):
+            database.iter_jobs(self.conn, fields=['salary'])
+
+    def test_invalid_arguments_are_rejected(self):
+        """Unknown fields, bad limits and forged cursors raise ValueError."""
+        for kwargs in ({'fields': ['salary']}, {'limit': 0}, {'cursor': 'not-a-cursor'}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                database.list_jobs(self.conn, **kwargs)
+
+
+class TestUpsertJobs(unittest.TestCase):
+    """Test cases for saving jobs keyed by their normalized apply link."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.row_factory = sqlite3.Row
+        migrate(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_normalize_apply_link(self):
+        """Tracking parameters, fragments, case and trailing slashes do not change the key."""
+        key = database.normalize_apply_link('https://www.linkedin.com/jobs/view/123/')
+        for link in ('HTTPS://WWW.LinkedIn.com/jobs/view/123?trk=feed&refId=abc',
+                     'https://www.linkedin.com/jobs/view/123/?utm_source=mail#apply'):
+            self.assertEqual(database.normalize_apply_link(link), key)
+        self.assertNotEqual(database.normalize_apply_link('https://www.linkedin.com/jobs/view/124/'), key)
+        self.assertIsNone(database.normalize_apply_link('  '))
+
+    def test_reimport_updates_instead_of_duplicating(self):
+        """Importing the same postings twice leaves one row each, updated from the second import."""
+        jobs = [{'title': f'Job {i}', 'company': 'Acme', 'apply_link': f'https://example.com/jobs/{i}'}
+                for i in range(5)]
+        jobs.append({'title': 'No link', 'company': 'Acme'})
+
+        first = database.upsert_jobs(self.conn, jobs, batch_size=2)
+        jobs[0] = dict(jobs[0], title='Renamed', apply_link='https://example.com/jobs/0/?utm_source=csv')
+        second = database.upsert_jobs(self.conn, jobs[:5] + [{'title': 'Broken'}, 'not a job'], batch_size=2)
+
+        self.assertEqual((first['inserted'], first['updated']), (6, 0))
+        self.assertEqual((second['inserted'], second['updated']), (0, 5))
+        self.assertEqual([error['index'] for error in second['errors']], [5, 6])
+        self.assertEqual(self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0], 6)
+        self.assertEqual(self.conn.execute('SELECT title FROM jobs WHERE id = 1').fetchone()[0], 'Renamed')
+        self.assertEqual(database.verify_counters(self.conn), [])
+
+    def test_save_job_returns_the_existing_id(self):
+        """Saving a posting again returns the id it was first saved under."""
+        job = {'title': 'Analyst', 'company': 'Acme', 'apply_link': 'https://example.com/jobs/1'}
+        job_id = database.save_job(self.conn, job)
+        self.assertEqual(database.save_job(self.conn, dict(job, description='Updated')), job_id)
+        self.assertNotEqual(database.save_job(self.conn, {'title': 'Analyst', 'company': 'Acme'}), job_id)
+
+    def test_existing_duplicates_survive_the_migration(self):
+        """Databases already holding duplicate links migrate, with the newest copy keyed."""
+        conn = sqlite3.connect(':memory:')
+        for version, step in database.MIGRATIONS[:5]:
+            step(conn)
+        conn.execute('PRAGMA user_version = 5')
+        for title in ('Old copy', 'New copy'):
+            conn.execute("INSERT INTO jobs (title, company, apply_link) VALUES (?, 'Acme', 'https://example.com/jobs/1')",
+                         (title,))
+        conn.commit()
+
+        migrate(conn)
+
+        keyed = conn.execute('SELECT title FROM jobs WHERE apply_link_key IS NOT NULL').fetchall()
+        self.assertEqual(keyed, [('New copy',)])
+        conn.close()
+
+
+class TestSearchJobs(unittest.TestCase):
+    """Test cases for full-text search over jobs and tailored resumes."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.row_factory = sqlite3.Row
+        migrate(self.conn)
+        database.upsert_jobs(self.conn, [
+            {'title': 'Data Analyst', 'company': 'Acme', 'description': 'Build <b>SQL</b> dashboards'},
+            {'title': 'Line Cook', 'company': 'Bistro', 'description': 'Prepare meals'},
+            {'title': 'Backend Engineer', 'company': 'Data Corp', 'description': 'Run pipelines in SQL'}
+        ])
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _ids(self, text, **kwargs):
+        return [result['id'] for result in database.search_jobs(self.conn, text, **kwargs)[0]]
+
+    def test_ranked_matches_with_highlighted_snippets(self):
+        """Title matches outrank description matches, and snippets are escaped and highlighted."""
+        results, cursor = database.search_jobs(self.conn, 'data')
+        self.assertEqual([result['id'] for result in results], [1, 3])
+        self.assertIsNone(cursor)
+
+        result = database.search_jobs(self.conn, 'dashboards')[0][0]
+        self.assertEqual(result['matched_in'], 'job')
+        self.assertIn('&lt;b&gt;SQL&lt;/b&gt; <mark>dashboards</mark>', result['snippet'])
+
+    def test_index_follows_writes(self):
+        """Updated and deleted jobs and new tailored resumes are reflected in results."""
+        self.conn.execute("UPDATE jobs SET description = 'Bake bread' WHERE id = 2")
+        self.conn.execute('DELETE FROM jobs WHERE id = 3')
+        database.add_tailored_resume(self.conn, 2, 'Sourdough and pipelines')
+
+        self.assertEqual(self._ids('bread'), [2])
+        self.assertEqual(self._ids('sql'), [1])
+        result = database.search_jobs(self.conn, 'pipelines')[0][0]
+        self.assertEqual((result['id'], result['matched_in']), (2, 'tailored_resume'))
+
+    def test_prefix_matching_and_pagination(self):
+        """The last word matches as a prefix, and cursors page through the ranking."""
+        self.assertEqual(self._ids('pipe'), [3])
+        first, cursor = database.search_jobs(self.conn, 'sql', limit=1)
+        second, cursor = database.search_jobs(self.conn, 'sql', limit=1, cursor=cursor)
+        self.assertIsNone(cursor)
+        self.assertEqual(sorted([first[0]['id'], second[0]['id']]), [1, 3])
+
+    def test_operators_in_input_are_plain_words(self):
+        """FTS5 syntax typed by users is searched for literally instead of failing."""
+        self.assertEqual(self._ids('"data" AND ('), [])
+        with self.assertRaises(ValueError):
+            database.search_jobs(self.conn, ' ?! ')
+
+
+class TestResumeBlobs(unittest.TestCase):
+    """Test cases for the deduplicated, compressed tailored resume bodies."""
+
+    CONTENT = '\\section{Experience} Built SQL dashboards for the sales team. ' * 50
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        migrate(self.conn)
+        for title in ('Analyst', 'Engineer'):
+            self.conn.execute("INSERT INTO jobs (title, company) VALUES (?, 'Acme')", (title,))
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_identical_bodies_share_one_compressed_blob(self):
+        """Tailoring the same text for several jobs stores it once, smaller than the text."""
+        for job_id in (1, 2, 2):
+            database.add_tailored_resume(self.conn, job_id, self.CONTENT)
+
+        blobs = self.conn.execute('SELECT size, length(data) FROM resume_blobs').fetchall()
+        self.assertEqual(len(blobs), 1)
+        self.assertLess(blobs[0][1], blobs[0][0] / 10)
+        resume = database.get_latest_tailored_resume(self.conn, 2)
+        self.assertEqual((resume['id'], resume['content']), (3, self.CONTENT))
+        self.assertIsNone(database.get_latest_tailored_resume(self.conn, 3))
+
+    def test_migration_deduplicates_existing_rows(self):
+        """Upgrading from version 7 moves bodies into blobs, one per distinct text, still searchable."""
+        conn = sqlite3.connect(':memory:')
+        for version, step in database.MIGRATIONS[:7]:
+            step(conn)
+        conn.execute('PRAGMA user_version = 7')
+        conn.execute("INSERT INTO jobs (title, company) VALUES ('Analyst', 'Acme')")
+        for content in (self.CONTENT, self.CONTENT, 'Sourdough baker'):
+            conn.execute('INSERT INTO tailored_resumes (job_id, content) VALUES (1, ?)', (content,))
+        conn.commit()
+
+        migrate(conn)
+
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM resume_blobs').fetchone()[0], 2)
+        self.assertNotIn('content', database._column_names(conn, 'tailored_resumes'))
+        self.assertEqual(database.get_latest_tailored_resume(conn, 1)['content'], 'Sourdough baker')
+        result = database.search_jobs(conn, 'dashboards')[0][0]
+        self.assertEqual(result['matched_in'], 'tailored_resume')
+        self.assertIn('<mark>dashboards</mark>', result['snippet'])
+        conn.close()
+
+    def test_prune_removes_unreferenced_blobs_from_search(self):
+        """Bodies left without tailored resumes are deleted along with their index entries."""
+        database.add_tailored_resume(self.conn, 1, self.CONTENT)
+        database.add_tailored_resume(self.conn, 2, 'Sourdough baker')
+        self.conn.execute('DELETE FROM tailored_resumes WHERE job_id = 1')
+
+        self.assertEqual(database.prune_resume_blobs(self.conn), 1)
+        self.assertEqual(database.search_jobs(self.conn, 'dashboards')[0], [])
+        self.assertEqual([r['id'] for r in database.search_jobs(self.conn, 'sourdough')[0]], [2])
+
+
+class TestTailorTasks(unittest.TestCase):
+    """Test cases for the tailoring task status shared between processes."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        migrate(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_unfinished_task_is_shared_until_it_finishes(self):
+        """One unfinished task per job and template; a new one can start once it is done."""
+        task_id, created = database.create_tailor_task(self.conn, 1, 'experience')
+        self.assertTrue(created)
+        self.assertEqual(database.create_tailor_task(self.conn, 1, 'experience'), (task_id, False))
+        self.assertTrue(database.create_tailor_task(self.conn, 1, 'summary')[1])
+
+        database.update_tailor_task(self.conn, task_id, 'done', resume_id=7)
+        task = database.get_tailor_task(self.conn, task_id)
+        self.assertEqual((task['status'], task['resume_id']), ('done', 7))
+        self.assertIsNotNone(task['finished_at'])
+        self.assertTrue(database.create_tailor_task(self.conn, 1, 'experience')[1])
+
+    def test_stale_tasks_fail_and_old_tasks_expire(self):
+        """Tasks abandoned by a dead process stop blocking, and old finished tasks are deleted."""
+        stale_id, _ = database.create_tailor_task(self.conn, 1, 'experience')
+        old_id, _ = database.create_tailor_task(self.conn, 2, 'experience')
+        database.update_tailor_task(self.conn, old_id, 'failed', error='boom')
+        with self.conn:
+            self.conn.execute('UPDATE tailor_tasks SET updated_at = 0, finished_at = finished_at - 7200')
+
+        task_id, created = database.create_tailor_task(self.conn, 1, 'experience')
+        self.assertTrue(created)
+        self.assertEqual(database.get_tailor_task(self.conn, stale_id)['status'], 'failed')
+        self.assertIsNone(database.get_tailor_task(self.conn, old_id))
+
+
+class TestQueryPlans(unittest.TestCase):
+    """Check that the job endpoint queries are served from indexes."""
+
+    QUERIES = {
+        'list jobs': (database.LIST_JOBS_SQL, ()),
+        'first page': (database.list_jobs_sql(database.DEFAULT_JOB_FIELDS, limit=True), (50,)),
+        'next page': (database.list_jobs_sql(database.DEFAULT_JOB_FIELDS, True, True), ('2025-04-11', 9, 50)),
+        'get job': (database.GET_JOB_SQL, (1,)),
+        'status counts': (database.STATUS_COUNTS_SQL, ()),
+        'applied today': (database.APPLIED_ON_DATE_SQL, ('2025-04-11',)),
+        'latest tailored resume': (database.LATEST_TAILORED_RESUME_SQL, (1,))
+    }
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        migrate(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_queries_use_indexes(self):
+        """No query scans a table without an index or sorts in a temporary b-tree."""
+        for name, (sql, params) in self.QUERIES.items():
+            with self.subTest(query=name):
+                plan = [row[3] for row in self.conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+                for step in plan:
+                    self.assertNotIn('TEMP B-TREE', step, plan)
+                    if step.startswith('SCAN'):
+                        self.assertIn('INDEX', step, plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Backend Cold Start Tests
+
+Imports the backend in a fresh interpreter and checks that it stays within an
+import-time budget without loading the NLP stack, which is only needed once a
+resume is actually parsed.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import unittest
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+# Seconds allowed for `import app`; override with IMPORT_BUDGET_SECONDS on slow machines
+IMPORT_BUDGET_SECONDS = float(os.environ.get('IMPORT_BUDGET_SECONDS', 2.0))
+
+# Modules that must not be imported at startup
+HEAVY_MODULES = (
+    'spacy',
+    'nltk',
+    'pdfminer',
+    'docx',
+    'resume_parser.parser',
+    'resume_parser.docx_parser',
+    'resume_parser.enhanced_parser',
+    'resume_parser.relevance_matcher'
+)
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': [name for name in sys.argv[1:] if name in sys.modules]}))
+'''
+
+
+class TestImportBudget(unittest.TestCase):
+    """Test the backend's cold start."""
+
+    def _import_app(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = dict(os.environ, RESUME_STORE_PATH=os.path.join(tmp_dir, 'store.db'))
+            result = subprocess.run(
+                [sys.executable, '-c', PROBE] + list(HEAVY_MODULES),
+                cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=60
+            )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_app_import_is_light(self):
+        """Importing the app loads no NLP modules and stays within the time budget."""
+        probe = self._import_app()
+        self.assertEqual(probe['modules'], [])
+        self.assertLess(probe['elapsed'], IMPORT_BUDGET_SECONDS)
+
+    def test_package_attributes_load_on_access(self):
+        """Public package functions are still importable from the package itself."""
+        sys.path.insert(0, BACKEND_DIR)
+        try:
+            import resume_parser
+            self.assertIn('parse_resume', dir(resume_parser))
+            self.assertTrue(callable(resume_parser.get_parser_version))
+            with self.assertRaises(AttributeError):
+                resume_parser.no_such_function
+        finally:
+            sys.path.remove(BACKEND_DIR)
+
+
+if __name__ == '__main__':
+    unittest.main()
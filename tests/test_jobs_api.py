@@ -0,0 +1,294 @@
+"""
+Jobs API Tests
+
+Tests for the job endpoints of the Flask app, run against a temporary jobs
+database through Flask's test client.
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import time
+import threading
+import unittest
+from unittest.mock import patch
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, BACKEND_DIR)
+
+import app as backend_app
+from background_jobs import JobRegistry
+from database import ConnectionPool, add_tailored_resume
+from resume_templates import TemplateStore
+
+
+class JobsAPITestCase(unittest.TestCase):
+    """Base class running the app against an empty, migrated jobs database."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pool = ConnectionPool(os.path.join(self.tmp_dir, 'jobs.db'))
+        patcher = patch.object(backend_app, 'db_pool', self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        backend_app.init_db()
+        self.client = backend_app.app.test_client()
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.tmp_dir)
+
+    def save_job(self, title='Data Analyst'):
+        response = self.client.post('/save-job', json={'title': title, 'company': 'Acme', 'description': 'SQL'})
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['id']
+
+
+class TestConditionalRequests(JobsAPITestCase):
+    """Test ETags and 304 responses on the job endpoints."""
+
+    URLS = ('/jobs', '/get-jobs?limit=1', '/jobs/stats', '/jobs/today-stats', '/jobs/1')
+
+    def test_unchanged_data_is_not_modified(self):
+        """Revalidating with the returned ETag gets a 304 until a write happens."""
+        self.save_job()
+        for url in self.URLS:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag = response.headers['ETag']
+
+                response = self.client.get(url, headers={'If-None-Match': etag})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.data, b'')
+
+    def test_every_write_changes_the_etag(self):
+        """Saving, updating, tailoring and deleting jobs each invalidate the ETag."""
+        job_id = self.save_job()
+        writes = (
+            lambda: self.save_job('Data Engineer'),
+            lambda: self.client.put(f'/jobs/{job_id}/status', json={'status': 'applied'}),
+            lambda: self.client.delete(f'/delete-job/{job_id}')
+        )
+        for write in writes:
+            etag = self.client.get('/jobs').headers['ETag']
+            write()
+            response = self.client.get('/jobs', headers={'If-None-Match': etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_missing_job_is_not_tagged(self):
+        """Error responses carry no ETag."""
+        response = self.client.get('/jobs/42')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response.headers)
+
+
+class TestSearch(JobsAPITestCase):
+    """Test the job search endpoint."""
+
+    def test_search_pages_through_results(self):
+        """Results come a page at a time with the cursor in X-Next-Cursor."""
+        for title in ('Data Analyst', 'Data Engineer', 'Line Cook'):
+            self.save_job(title)
+        response = self.client.get('/jobs/search?q=data&limit=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 1)
+
+        response = self.client.get(f"/jobs/search?q=data&limit=1&cursor={response.headers['X-Next-Cursor']}")
+        self.assertEqual(len(response.get_json()), 1)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_empty_query_is_rejected(self):
+        """A search without words is a bad request."""
+        self.assertEqual(self.client.get('/jobs/search?q=').status_code, 400)
+
+
+class TestBulkSave(JobsAPITestCase):
+    """Test the bulk job import endpoint."""
+
+    def test_json_array_import_is_idempotent(self):
+        """Posting the same array twice inserts the jobs once and then updates them."""
+        jobs = [{'title': f'Job {i}', 'company': 'Acme', 'apply_link': f'https://example.com/jobs/{i}'}
+                for i in range(3)]
+        first = self.client.post('/jobs/bulk', json=jobs).get_json()
+        second = self.client.post('/jobs/bulk', json=jobs).get_json()
+        self.assertEqual((first['inserted'], first['updated']), (3, 0))
+        self.assertEqual((second['inserted'], second['updated']), (0, 3))
+        self.assertEqual(len(self.client.get('/jobs').get_json()), 3)
+
+    def test_ndjson_import_reports_bad_lines(self):
+        """NDJSON lines that are not valid jobs are reported without stopping the import."""
+        body = b'{"title": "Analyst", "company": "Acme"}\n\nnot json\n{"title": "Engineer"}\n'
+        response = self.client.post('/jobs/bulk', data=body, content_type='application/x-ndjson')
+        summary = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((summary['received'], summary['inserted']), (3, 1))
+        self.assertEqual([error['index'] for error in summary['errors']], [1, 2])
+
+    def test_rejects_non_array_json(self):
+        """A JSON body that is not an array is rejected."""
+        response = self.client.post('/jobs/bulk', json={'title': 'Analyst'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_save_job_updates_a_saved_posting(self):
+        """Saving the same posting from the extension twice keeps one job."""
+        job = {'title': 'Analyst', 'company': 'Acme', 'apply_link': 'https://example.com/jobs/1?trk=x'}
+        first = self.client.post('/save-job', json=job).get_json()['id']
+        second = self.client.post('/save-job', json=dict(job, apply_link='https://example.com/jobs/1')).get_json()['id']
+        self.assertEqual(first, second)
+
+
+class TestTailorResume(JobsAPITestCase):
+    """Test tailoring a resume from a cached template."""
+
+    def setUp(self):
+        super().setUp()
+        self.template_path = os.path.join(self.tmp_dir, 'experience.tex')
+        with open(self.template_path, 'w', encoding='utf-8') as f:
+            f.write('\\section{Experience}\n')
+        store = TemplateStore({'experience': self.template_path, 'missing': self.template_path + '.gone'})
+        for name, value in (('template_store', store), ('tailor_jobs', JobRegistry(max_workers=1))):
+            patcher = patch.object(backend_app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tailor_stores_the_template(self):
+        """The stored resume is the template text; wait=1 answers with it once saved."""
+        job_id = self.save_job()
+        response = self.client.post(f'/jobs/{job_id}/tailor-resume?wait=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.get_json()['job']['has_tailored_resume'])
+        content = self.client.get(f'/jobs/{job_id}/tailored-resume').get_json()['content']
+        self.assertEqual(content, '\\section{Experience}')
+
+    def test_tailoring_returns_a_handle_and_dedupes(self):
+        """Requests get a task handle at once; repeated clicks share the unfinished task."""
+        job_id = self.save_job()
+        gate = threading.Event()
+        run_job = backend_app.tailor_resume_job
+
+        def gated_job(*args, progress):
+            gate.wait(5)
+            return run_job(*args, progress=progress)
+
+        with patch.object(backend_app, 'tailor_resume_job', gated_job):
+            first = self.client.post(f'/jobs/{job_id}/tailor-resume')
+            second = self.client.post(f'/jobs/{job_id}/tailor-resume?async=1')
+        self.assertEqual((first.status_code, second.status_code), (202, 202))
+        handle = first.get_json()
+        self.assertEqual(second.get_json()['task_id'], handle['task_id'])
+        self.assertEqual(self.client.get(handle['status_url']).get_json()['status'], 'queued')
+
+        gate.set()
+        for _ in range(100):
+            status = self.client.get(handle['status_url']).get_json()
+            if status['status'] == 'done':
+                break
+            time.sleep(0.05)
+        self.assertEqual(status['status'], 'done')
+        self.assertTrue(status['result']['job']['has_tailored_resume'])
+        self.assertEqual(self.client.get(f'/jobs/{job_id}').get_json()['tailored_count'], 1)
+        self.assertEqual(self.client.get('/tailor-resume/jobs/missing').status_code, 404)
+
+    def test_status_is_shared_between_processes(self):
+        """Task status comes from the jobs database, not the memory of the process that queued it."""
+        job_id = self.save_job()
+        self.assertEqual(self.client.post(f'/jobs/{job_id}/tailor-resume?wait=1').status_code, 200)
+        with self.pool.connection() as db:
+            task_id = db.execute('SELECT id FROM tailor_tasks').fetchone()[0]
+        with patch.object(backend_app, 'tailor_jobs', JobRegistry(max_workers=1)):
+            status = self.client.get(f'/tailor-resume/jobs/{task_id}').get_json()
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['result']['resume_id'], 1)
+
+    def test_unknown_and_missing_templates(self):
+        """Unknown template names are rejected and missing files are reported."""
+        job_id = self.save_job()
+        response = self.client.post(f'/jobs/{job_id}/tailor-resume', json={'template': 'cover-letter'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(f'/jobs/{job_id}/tailor-resume', json={'template': 'missing'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_non_object_body_is_rejected(self):
+        """A JSON body that is not an object is a bad request."""
+        job_id = self.save_job()
+        for body in (['x'], 'experience', 1):
+            with self.subTest(body=body):
+                response = self.client.post(f'/jobs/{job_id}/tailor-resume', json=body)
+                self.assertEqual(response.status_code, 400)
+
+
+class TestParseJobs(JobsAPITestCase):
+    """Test async resume parsing, with the upload and the parser stubbed out."""
+
+    def setUp(self):
+        super().setUp()
+        upload = {'path': os.path.join(self.tmp_dir, 'resume.pdf'), 'content_hash': 'a' * 64}
+
+        def parse(file_path, content_hash, progress=None):
+            progress('extracting')
+            return {'success': True, 'message': 'Resume parsed successfully',
+                    'data': {'contact_info': {'name': 'Ada'}, 'skills': ['SQL']}}, 200
+
+        for name, value in (('store_resume_upload', lambda file: (True, 'ok', upload)),
+                            ('parse_saved_resume', parse),
+                            ('parse_jobs', JobRegistry(max_workers=1))):
+            patcher = patch.object(backend_app, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def submit(self):
+        response = self.client.post('/parse-resume?async=1&fields=skills', data={
+            'file': (io.BytesIO(b'%PDF-1.4'), 'resume.pdf')
+        }, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 202)
+        return response.get_json()
+
+    def test_status_is_shared_between_processes(self):
+        """Any process can report a parse queued by another, from the jobs database."""
+        handle = self.submit()
+        for _ in range(100):
+            with patch.object(backend_app, 'parse_jobs', JobRegistry(max_workers=1)):
+                status = self.client.get(handle['status_url']).get_json()
+            if status['status'] == 'done':
+                break
+            time.sleep(0.05)
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['result']['data'], {'skills': ['SQL']})
+        self.assertEqual(self.client.get('/parse-resume/jobs/missing').status_code, 404)
+
+    def test_events_end_with_the_result(self):
+        """The event stream is read from the jobs database and ends with the finished parse."""
+        handle = self.submit()
+        response = self.client.get(handle['events_url'])
+        messages = response.get_data(as_text=True).strip().split('\n\n')
+        self.assertTrue(messages[-1].startswith('event: done\n'))
+        self.assertIn('"SQL"', messages[-1])
+        self.assertEqual(self.client.get('/parse-resume/jobs/missing/events').status_code, 404)
+
+
+class TestCompactCommand(JobsAPITestCase):
+    """Test the compact-db command."""
+
+    def test_prunes_unused_bodies_and_reports_sizes(self):
+        """Bodies of deleted tailored resumes are dropped and the sizes are printed."""
+        job_id = self.save_job()
+        with self.pool.connection() as db:
+            add_tailored_resume(db, job_id, 'Old experience section')
+            add_tailored_resume(db, job_id, 'New experience section')
+            db.execute('DELETE FROM tailored_resumes WHERE id = 1')
+            db.commit()
+
+        result = backend_app.app.test_cli_runner().invoke(args=['compact-db'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Removed 1 unused resume bodies', result.output)
+        self.assertIn('Database size:', result.output)
+        self.assertEqual(self.client.get(f'/jobs/{job_id}/tailored-resume').get_json()['content'],
+                         'New experience section')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
-from tools.llm_api import create_llm_client, query_llm
+from tools.llm_api import create_llm_client, query_llm, load_environment, get_config
 
 class TestLLMAPI(unittest.TestCase):
     def setUp(self):
@@ -91,5 +93,39 @@ class TestLLMAPI(unittest.TestCase):
         # Verify error handling
         self.assertIsNone(response)
 
+class TestLLMConfig(unittest.TestCase):
+    def tearDown(self):
+        get_config.cache_clear()
+
+    def test_load_environment_precedence(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, '.env.example'), 'w') as f:
+                f.write("OPENAI_API_KEY=example\nOPENAI_MODEL_DEPLOYMENT=example-model\nLLM_TEST_SYSTEM=file\n")
+            with open(os.path.join(tmp_dir, '.env.local'), 'w') as f:
+                f.write("OPENAI_API_KEY=local\n")
+
+            with patch.dict(os.environ, {'LLM_TEST_SYSTEM': 'system'}):
+                values, env_files = load_environment(tmp_dir)
+
+        # .env.local beats .env.example, system variables beat both
+        self.assertEqual(env_files, ('.env.local', '.env.example'))
+        self.assertEqual(values['OPENAI_API_KEY'], 'local')
+        self.assertEqual(values['OPENAI_MODEL_DEPLOYMENT'], 'example-model')
+        self.assertEqual(values['LLM_TEST_SYSTEM'], 'system')
+        # Loading does not touch the process environment
+        self.assertNotIn('OPENAI_MODEL_DEPLOYMENT', os.environ)
+
+    @patch('tools.llm_api.load_environment')
+    def test_config_is_loaded_once(self, mock_load_environment):
+        mock_load_environment.return_value = ({'ANTHROPIC_API_KEY': 'key'}, ('.env',))
+        get_config.cache_clear()
+
+        config = get_config()
+
+        self.assertIs(get_config(), config)
+        self.assertEqual(config.anthropic_api_key, 'key')
+        self.assertEqual(config.openai_base_url, "https://api.openai.com/v1")
+        mock_load_environment.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
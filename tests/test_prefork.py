@@ -0,0 +1,91 @@
+"""
+Pre-fork Server Tests
+
+Tests for the memory report and for serving requests from forked workers.
+"""
+
+import os
+import sys
+import time
+import socket
+import signal
+import tempfile
+import subprocess
+import unittest
+import urllib.request
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, BACKEND_DIR)
+
+import prefork
+
+
+SMAPS_ROLLUP = """55d0c8a4b000-7ffd5a9f1000 ---p 00000000 00:00 0                          [rollup]
+Rss:               94208 kB
+Pss:               29696 kB
+Shared_Clean:      61440 kB
+Shared_Dirty:      24576 kB
+Private_Clean:      1024 kB
+Private_Dirty:      7168 kB
+Referenced:        94208 kB
+"""
+
+
+class TestMemoryReport(unittest.TestCase):
+    """Test cases for reading per-process memory."""
+
+    def test_parse_smaps_rollup(self):
+        """Shared and unique totals are summed from the clean and dirty counts."""
+        memory = prefork.parse_smaps_rollup(SMAPS_ROLLUP)
+        self.assertEqual(memory['Rss'], 94208)
+        self.assertEqual(memory['shared'], 61440 + 24576)
+        self.assertEqual(memory['unique'], 1024 + 7168)
+
+    @unittest.skipUnless(os.path.exists('/proc/self/smaps_rollup'), 'needs /proc/<pid>/smaps_rollup')
+    def test_report_for_this_process(self):
+        """The report has a row per process and a PSS total."""
+        report = prefork.memory_report(os.getpid(), [])
+        self.assertIn('master', report)
+        self.assertIn('total pss', report)
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'needs os.fork()')
+class TestPreforkServer(unittest.TestCase):
+    """Start the server with two workers and serve requests."""
+
+    def _free_port(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def test_workers_serve_requests(self):
+        """Forked workers answer requests and exit with the master on SIGTERM."""
+        port = self._free_port()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = dict(os.environ, RESUME_STORE_PATH=os.path.join(tmp_dir, 'store.db'),
+                       UPLOAD_DELETE_ORPHANS='0')
+            master = subprocess.Popen(
+                [sys.executable, os.path.join(BACKEND_DIR, 'prefork.py'), '--workers', '2', '--port', str(port)],
+                cwd=tmp_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            try:
+                deadline = time.time() + 60
+                while True:
+                    try:
+                        with urllib.request.urlopen(f'http://127.0.0.1:{port}/jobs', timeout=5) as response:
+                            self.assertEqual(response.status, 200)
+                        break
+                    except OSError:
+                        if time.time() > deadline or master.poll() is not None:
+                            raise
+                        time.sleep(0.2)
+                for _ in range(4):
+                    with urllib.request.urlopen(f'http://127.0.0.1:{port}/jobs', timeout=5) as response:
+                        self.assertEqual(response.status, 200)
+            finally:
+                master.send_signal(signal.SIGTERM)
+                self.assertEqual(master.wait(timeout=30), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Resume Template Tests
+
+Tests for the in-memory resume template store.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, BACKEND_DIR)
+
+from resume_templates import TemplateStore
+
+
+class TestTemplateStore(unittest.TestCase):
+    """Test cases for TemplateStore."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'experience.tex')
+        self.write('  \\section{Experience}\n')
+        self.store = TemplateStore({'experience': self.path}, check_interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, text, path=None, mtime_ns=None):
+        path = path or self.path
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_is_served_from_memory(self):
+        """A template is read once and only stat()ed afterwards."""
+        self.assertEqual(self.store.get('experience'), '\\section{Experience}')
+        with patch('builtins.open', side_effect=AssertionError('template re-read')):
+            self.assertEqual(self.store.get('experience'), '\\section{Experience}')
+
+    def test_changed_or_replaced_file_is_reloaded(self):
+        """Edits in place and files swapped in by rename are both picked up."""
+        self.store.get('experience')
+        self.write('\\section{Projects}', mtime_ns=10**18)
+        self.assertEqual(self.store.get('experience'), '\\section{Projects}')
+
+        replacement = os.path.join(self.tmp_dir, 'new.tex')
+        self.write('\\section{Skills}', path=replacement, mtime_ns=10**18)
+        os.replace(replacement, self.path)
+        self.assertEqual(self.store.get('experience'), '\\section{Skills}')
+
+    def test_check_interval_skips_stat(self):
+        """Within the check interval the cached template is returned without touching the file."""
+        store = TemplateStore({'experience': self.path}, check_interval=3600)
+        store.get('experience')
+        os.remove(self.path)
+        self.assertEqual(store.get('experience'), '\\section{Experience}')
+
+    def test_named_templates_and_preparation(self):
+        """Each name maps to its own file, prepared once per load."""
+        other = os.path.join(self.tmp_dir, 'summary.tex')
+        self.write('Summary', path=other)
+        calls = []
+        store = TemplateStore({'experience': self.path, 'summary': other, 'missing': other + '.gone'},
+                              prepare=lambda text: calls.append(text) or text.upper(), check_interval=0)
+
+        self.assertEqual(store.get('summary'), 'SUMMARY')
+        store.get('summary')
+        self.assertEqual(calls, ['Summary'])
+        status = store.load_all()
+        self.assertIsNone(status['experience'])
+        self.assertIsNotNone(status['missing'])
+        with self.assertRaises(KeyError):
+            store.get('cover-letter')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,50 +1,88 @@
 #!/usr/bin/env python3
 
-import google.generativeai as genai
 from openai import OpenAI, AzureOpenAI
 from anthropic import Anthropic
 import argparse
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import sys
 import base64
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Tuple
 import mimetypes
 
-def load_environment():
-    """Load environment variables from .env files in order of precedence"""
-    # Order of precedence:
-    # 1. System environment variables (already loaded)
-    # 2. .env.local (user-specific overrides)
-    # 3. .env (project defaults)
-    # 4. .env.example (example configuration)
-    
-    env_files = ['.env.local', '.env', '.env.example']
-    env_loaded = False
-    
-    print("Current working directory:", Path('.').absolute(), file=sys.stderr)
-    print("Looking for environment files:", env_files, file=sys.stderr)
+# Environment files in order of precedence (system environment variables win over all of them):
+# .env.local (user-specific overrides), .env (project defaults), .env.example (example configuration)
+ENV_FILES = ('.env.local', '.env', '.env.example')
+
+@dataclass(frozen=True)
+class LLMConfig:
+    """API keys and settings for the LLM providers, resolved once per process."""
+    openai_api_key: Optional[str] = None
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_model: str = "gpt-4o"
+    azure_api_key: Optional[str] = None
+    azure_model: str = "gpt-4o-ms"
+    deepseek_api_key: Optional[str] = None
+    siliconflow_api_key: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
+    google_api_key: Optional[str] = None
+    env_files: Tuple[str, ...] = ()
+
+def load_environment(directory: str = '.') -> Tuple[dict, Tuple[str, ...]]:
+    """
+    Read environment variables from .env files without modifying os.environ.
     
-    for env_file in env_files:
-        env_path = Path('.') / env_file
-        print(f"Checking {env_path.absolute()}", file=sys.stderr)
+    Args:
+        directory (str): Directory containing the .env files
+        
+    Returns:
+        tuple: (merged variables with system environment variables taking precedence,
+                names of the files that were found)
+    """
+    values = {}
+    found = []
+    # Apply the lowest-precedence file first so higher-precedence files override it
+    for env_file in reversed(ENV_FILES):
+        env_path = Path(directory) / env_file
         if env_path.exists():
-            print(f"Found {env_file}, loading variables...", file=sys.stderr)
-            load_dotenv(dotenv_path=env_path)
-            env_loaded = True
-            print(f"Loaded environment variables from {env_file}", file=sys.stderr)
-            # Print loaded keys (but not values for security)
-            with open(env_path) as f:
-                keys = [line.split('=')[0].strip() for line in f if '=' in line and not line.startswith('#')]
-                print(f"Keys loaded from {env_file}: {keys}", file=sys.stderr)
+            values.update({key: value for key, value in dotenv_values(env_path).items() if value is not None})
+            found.append(env_file)
     
-    if not env_loaded:
+    if not found:
         print("Warning: No .env files found. Using system environment variables only.", file=sys.stderr)
-        print("Available system environment variables:", list(os.environ.keys()), file=sys.stderr)
+    
+    values.update(os.environ)
+    return values, tuple(reversed(found))
+
+@lru_cache(maxsize=None)
+def get_config() -> LLMConfig:
+    """
+    Get the LLM configuration, loading it on first use.
+    
+    Returns:
+        LLMConfig: The process-wide configuration (call get_config.cache_clear() to reload)
+    """
+    env, env_files = load_environment()
+    return LLMConfig(
+        openai_api_key=env.get('OPENAI_API_KEY'),
+        openai_base_url=env.get('OPENAI_BASE_URL', LLMConfig.openai_base_url),
+        openai_model=env.get('OPENAI_MODEL_DEPLOYMENT', LLMConfig.openai_model),
+        azure_api_key=env.get('AZURE_OPENAI_API_KEY'),
+        azure_model=env.get('AZURE_OPENAI_MODEL_DEPLOYMENT', LLMConfig.azure_model),
+        deepseek_api_key=env.get('DEEPSEEK_API_KEY'),
+        siliconflow_api_key=env.get('SILICONFLOW_API_KEY'),
+        anthropic_api_key=env.get('ANTHROPIC_API_KEY'),
+        google_api_key=env.get('GOOGLE_API_KEY'),
+        env_files=env_files
+    )
 
-# Load environment variables at module import
-load_environment()
+def _genai():
+    """Import the Gemini SDK on first use; it is by far the slowest SDK to import."""
+    import google.generativeai as genai
+    return genai
 
 def encode_image_file(image_path: str) -> tuple[str, str]:
     """
@@ -66,9 +104,10 @@ def encode_image_file(image_path: str) -> tuple[str, str]:
     return encoded_string, mime_type
 
 def create_llm_client(provider="openai"):
+    config = get_config()
     if provider == "openai":
-        api_key = os.getenv('OPENAI_API_KEY')
-        base_url = os.getenv('OPENAI_BASE_URL', "https://api.openai.com/v1")
+        api_key = config.openai_api_key
+        base_url = config.openai_base_url
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         return OpenAI(
@@ -76,7 +115,7 @@ def create_llm_client(provider="openai"):
             base_url=base_url
         )
     elif provider == "azure":
-        api_key = os.getenv('AZURE_OPENAI_API_KEY')
+        api_key = config.azure_api_key
         if not api_key:
             raise ValueError("AZURE_OPENAI_API_KEY not found in environment variables")
         return AzureOpenAI(
@@ -85,7 +124,7 @@ def create_llm_client(provider="openai"):
             azure_endpoint="https://msopenai.openai.azure.com"
         )
     elif provider == "deepseek":
-        api_key = os.getenv('DEEPSEEK_API_KEY')
+        api_key = config.deepseek_api_key
         if not api_key:
             raise ValueError("DEEPSEEK_API_KEY not found in environment variables")
         return OpenAI(
@@ -93,7 +132,7 @@ def create_llm_client(provider="openai"):
             base_url="https://api.deepseek.com/v1",
         )
     elif provider == "siliconflow":
-        api_key = os.getenv('SILICONFLOW_API_KEY')
+        api_key = config.siliconflow_api_key
         if not api_key:
             raise ValueError("SILICONFLOW_API_KEY not found in environment variables")
         return OpenAI(
@@ -101,16 +140,17 @@ def create_llm_client(provider="openai"):
             base_url="https://api.siliconflow.cn/v1"
         )
     elif provider == "anthropic":
-        api_key = os.getenv('ANTHROPIC_API_KEY')
+        api_key = config.anthropic_api_key
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
         return Anthropic(
             api_key=api_key
         )
     elif provider == "gemini":
-        api_key = os.getenv('GOOGLE_API_KEY')
+        api_key = config.google_api_key
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
+        genai = _genai()
         genai.configure(api_key=api_key)
         return genai
     elif provider == "local":
@@ -142,9 +182,9 @@ def query_llm(prompt: str, client=None, model=None, provider="openai", image_pat
         # Set default model
         if model is None:
             if provider == "openai":
-                model = os.getenv('OPENAI_MODEL_DEPLOYMENT', 'gpt-4o')
+                model = get_config().openai_model
             elif provider == "azure":
-                model = os.getenv('AZURE_OPENAI_MODEL_DEPLOYMENT', 'gpt-4o-ms')  # Get from env with fallback
+                model = get_config().azure_model
             elif provider == "deepseek":
                 model = "deepseek-chat"
             elif provider == "siliconflow":
@@ -220,7 +260,7 @@ def query_llm(prompt: str, client=None, model=None, provider="openai", image_pat
         elif provider == "gemini":
             model = client.GenerativeModel(model)
             if image_path:
-                file = genai.upload_file(image_path, mime_type="image/png")
+                file = _genai().upload_file(image_path, mime_type="image/png")
                 chat_session = model.start_chat(
                     history=[{
                         "role": "user",
@@ -261,7 +301,7 @@ def main():
         elif args.provider == 'gemini':
             args.model = "gemini-2.0-flash-exp"
         elif args.provider == 'azure':
-            args.model = os.getenv('AZURE_OPENAI_MODEL_DEPLOYMENT', 'gpt-4o-ms')  # Get from env with fallback
+            args.model = get_config().azure_model
 
     client = create_llm_client(args.provider)
     response = query_llm(args.prompt, client, model=args.model, provider=args.provider, image_path=args.image)